@@ -0,0 +1,81 @@
+"""Ad-hoc SQL over the dashboard's tables with an embedded DuckDB engine.
+
+Each query gets a fresh in-memory DuckDB connection with the loaded DataFrames registered
+as views. DuckDB scans the DataFrame columns in place, so registering copies no data.
+The connection cannot read or write files, a timer interrupts queries that run past the
+timeout, and results are capped at a row limit.
+"""
+import threading
+import time
+
+import pandas as pd
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_ROW_LIMIT = 1000
+ROW_LIMITS = [100, 1000, 10000, 100000]
+
+EXAMPLE_QUERY = """SELECT Year, COUNT(*) AS GS, ROUND(AVG(GmSc), 1) AS avg_gmsc,
+       SUM(CASE WHEN GmSc >= 60 THEN 1 ELSE 0 END) AS strong_starts
+FROM games
+GROUP BY Year
+ORDER BY Year"""
+
+
+def _query_frame(df):
+    """View of `df` DuckDB can register: string column names, mixed-type object columns as strings"""
+    df = df.rename(columns=str)
+    mixed = [col for col in df.columns if df[col].dtype == object]
+    return df.astype({col: 'string' for col in mixed}) if mixed else df
+
+
+def query_tables(df_data, df_season, df_vars):
+    """The tables available to queries, by SQL name"""
+    return {'games': df_data, 'seasons': df_season, 'variables': df_vars}
+
+
+def table_columns(tables):
+    """Column names and DuckDB types of each table, one row per column"""
+    import duckdb
+
+    rows = []
+    with duckdb.connect() as con:
+        for name, df in tables.items():
+            con.register(name, _query_frame(df))
+            relation = con.sql(f'SELECT * FROM {name}')
+            for column, dtype in zip(relation.columns, relation.types):
+                rows.append({'Table': name, 'Column': column, 'Type': str(dtype)})
+    return pd.DataFrame(rows)
+
+
+def run_query(sql, tables, row_limit=DEFAULT_ROW_LIMIT, timeout=DEFAULT_TIMEOUT):
+    """Run one SQL query; return (result DataFrame, whether rows were cut at `row_limit`, seconds).
+
+    Raises TimeoutError when the query runs longer than `timeout` seconds, ValueError for
+    statements that return no rows, and duckdb.Error for invalid SQL.
+    """
+    import duckdb
+
+    con = duckdb.connect(config={'enable_external_access': False})
+    try:
+        for name, df in tables.items():
+            con.register(name, _query_frame(df))
+        con.execute("SET lock_configuration = true")
+
+        timer = threading.Timer(timeout, con.interrupt)
+        start = time.perf_counter()
+        timer.start()
+        try:
+            relation = con.sql(sql)
+            if relation is None:
+                raise ValueError("Only queries that return rows (SELECT, WITH, ...) can be run here")
+            result = relation.limit(row_limit + 1).df()
+        except duckdb.InterruptException:
+            raise TimeoutError(f"Query stopped after {timeout} seconds") from None
+        finally:
+            timer.cancel()
+        elapsed = time.perf_counter() - start
+    finally:
+        con.close()
+
+    truncated = len(result) > row_limit
+    return result.iloc[:row_limit], truncated, elapsed
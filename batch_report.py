@@ -0,0 +1,134 @@
+"""Batch report: every page's metrics for a directory of pitcher workbooks.
+
+    python batch_report.py workbooks/ --out reports/ --format parquet json --workers 8
+
+Each workbook in the directory must use the dashboard's three-sheet layout (Data, Season
+Totals, Variable Descriptions); its file name is used as the pitcher's name. Workbooks are
+processed in parallel across a process pool, and each page table is written once for all
+pitchers, with a leading Pitcher column (e.g. reports/season_statistics.parquet). A
+timings table records how long each workbook took to read and to analyze, and which ones
+failed. Exits with status 1 if any workbook failed.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+OUTPUT_FORMATS = ('parquet', 'json')
+WORKBOOK_EXTENSIONS = ('.xlsx', '.xlsm')
+
+
+def find_workbooks(directory):
+    """Workbook paths in `directory`, sorted by name (Excel lock files skipped)"""
+    return sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.lower().endswith(WORKBOOK_EXTENSIONS) and not name.startswith('~$')
+    )
+
+
+def report_workbook(path):
+    """Read one workbook and build its report; return (pitcher, tables, timing row)"""
+    from pitcher_report import read_workbook, pitcher_report
+
+    pitcher = os.path.splitext(os.path.basename(path))[0]
+    timing = {'Pitcher': pitcher, 'File': path, 'Starts': 0, 'Read (s)': 0.0, 'Analyze (s)': 0.0, 'Error': None}
+    try:
+        start = time.perf_counter()
+        df_data, df_season, _ = read_workbook(path)
+        timing['Read (s)'] = time.perf_counter() - start
+        timing['Starts'] = len(df_data)
+
+        start = time.perf_counter()
+        tables = pitcher_report(df_data, df_season)
+        timing['Analyze (s)'] = time.perf_counter() - start
+    except Exception as exc:
+        timing['Error'] = f"{type(exc).__name__}: {exc}"
+        tables = {}
+    return pitcher, tables, timing
+
+
+def run_batch(paths, workers=None):
+    """Report every workbook across a process pool; return (tables by name, timings)"""
+    results = {}
+    timings = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(report_workbook, path) for path in paths]
+        for future in as_completed(futures):
+            pitcher, tables, timing = future.result()
+            results[pitcher] = tables
+            timings.append(timing)
+            status = f"ERROR {timing['Error']}" if timing['Error'] else f"{timing['Starts']} starts"
+            print(f"  {pitcher:<32} read {timing['Read (s)']:6.2f}s  analyze {timing['Analyze (s)']:6.2f}s  {status}",
+                  flush=True)
+
+    # One table per page, pitchers in name order
+    combined = {}
+    for pitcher in sorted(results):
+        for name, table in results[pitcher].items():
+            combined.setdefault(name, []).append(table.assign(Pitcher=pitcher))
+    combined = {
+        name: pd.concat(frames, ignore_index=True)[['Pitcher'] + [c for c in frames[0].columns if c != 'Pitcher']]
+        for name, frames in combined.items()
+    }
+    timings = pd.DataFrame(timings).sort_values('Pitcher', ignore_index=True)
+    return combined, timings
+
+
+def table_file_name(name):
+    """'Pitch Usage Change' -> 'pitch_usage_change'"""
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+
+def write_tables(tables, out_dir, formats=OUTPUT_FORMATS):
+    """Write each table to `out_dir` in each format; return the written paths"""
+    from export import write_export
+
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    for name, table in tables.items():
+        base = os.path.join(out_dir, table_file_name(name))
+        if 'parquet' in formats:
+            with open(base + '.parquet', 'wb') as sink:
+                write_export(table, 'Parquet', sink)
+            written.append(base + '.parquet')
+        if 'json' in formats:
+            table.to_json(base + '.json', orient='records', date_format='iso', indent=1)
+            written.append(base + '.json')
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Every page's metrics for a directory of pitcher workbooks")
+    parser.add_argument('directory', help="directory of workbooks in the dashboard's three-sheet layout")
+    parser.add_argument('--out', default='reports', help="directory for the consolidated tables (default: reports)")
+    parser.add_argument('--format', nargs='+', choices=OUTPUT_FORMATS, default=list(OUTPUT_FORMATS),
+                        help="output formats (default: parquet json)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    paths = find_workbooks(args.directory)
+    if not paths:
+        print(f"No workbooks found in {args.directory}")
+        return 1
+
+    print(f"Reporting {len(paths)} workbooks")
+    start = time.perf_counter()
+    tables, timings = run_batch(paths, args.workers)
+    elapsed = time.perf_counter() - start
+
+    tables['Timings'] = timings
+    written = write_tables(tables, args.out, args.format)
+    failed = timings['Error'].notna().sum()
+    print(f"Wrote {len(written)} files to {args.out}")
+    print(f"{len(paths) - failed} of {len(paths)} workbooks in {elapsed:.1f}s "
+          f"(read {timings['Read (s)'].sum():.1f}s, analyze {timings['Analyze (s)'].sum():.1f}s across workers)")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""Game-level bootstrap confidence intervals for season rate stats.
+
+Every season is resampled with replacement at the start level (a season of ~30 starts is
+redrawn as ~30 starts from the same season), and ERA, K/9, BB/9 and average Game Score are
+recomputed for each resample. All seasons are resampled together as one NumPy index array.
+"""
+import numpy as np
+import pandas as pd
+
+from rates import per_nine
+
+BOOTSTRAP_STATS = ['ERA', 'K/9', 'BB/9', 'GmSc']
+
+
+def _season_stats(er, so, bb, gmsc, outs, season_start, season_length):
+    """ERA, K/9, BB/9 and average Game Score for each season block along the last axis"""
+    def season_sum(values):
+        return np.add.reduceat(values, season_start, axis=-1)
+
+    outs_total = season_sum(outs)
+    return {
+        'ERA': per_nine(season_sum(er), outs_total),
+        'K/9': per_nine(season_sum(so), outs_total),
+        'BB/9': per_nine(season_sum(bb), outs_total),
+        'GmSc': season_sum(gmsc) / season_length,
+    }
+
+
+def bootstrap_season_intervals(df_data, n_resamples=5000, confidence=0.95, seed=0, chunk_size=1000):
+    """Bootstrap confidence intervals for ERA, K/9, BB/9 and Game Score, one row per Year"""
+    log = df_data.sort_values(['Year', 'Date'])
+    years, codes = np.unique(log['Year'].to_numpy(), return_inverse=True)
+    n = len(log)
+
+    season_start = np.r_[0, np.flatnonzero(np.diff(codes)) + 1]
+    season_length = np.diff(np.r_[season_start, n])
+    row_start = season_start[codes]
+    row_length = season_length[codes]
+
+    # Counting stats stay integers, so the resampled season sums are exact
+    er = log['ER'].to_numpy(dtype=np.int64)
+    so = log['SO'].to_numpy(dtype=np.int64)
+    bb = log['BB'].to_numpy(dtype=np.int64)
+    gmsc = log['GmSc'].to_numpy(dtype=np.int64)
+    outs = log['Outs'].to_numpy(dtype=np.int64)
+
+    rng = np.random.default_rng(seed)
+    samples = {stat: [] for stat in BOOTSTRAP_STATS}
+    for start in range(0, n_resamples, chunk_size):
+        size = min(chunk_size, n_resamples - start)
+        # Column j of each resample is drawn from the starts in row j's own season
+        idx = row_start + (rng.random((size, n)) * row_length).astype(np.int64)
+        chunk = _season_stats(er[idx], so[idx], bb[idx], gmsc[idx], outs[idx],
+                              season_start, season_length)
+        for stat in BOOTSTRAP_STATS:
+            samples[stat].append(chunk[stat])
+
+    point = _season_stats(er, so, bb, gmsc, outs, season_start, season_length)
+    alpha = (1 - confidence) / 2 * 100
+    out = {'Year': years, 'Starts': season_length}
+    for stat in BOOTSTRAP_STATS:
+        draws = np.concatenate(samples[stat])
+        low, high = np.nanpercentile(draws, [alpha, 100 - alpha], axis=0)
+        out[stat] = point[stat]
+        out[f'{stat} Low'] = low
+        out[f'{stat} High'] = high
+    return pd.DataFrame(out)
+
+
+def error_bars(intervals, stat, years, values):
+    """Plotly `error_y` spec drawing the bootstrap interval of `stat` around the plotted values"""
+    bounds = intervals.set_index('Year').reindex(years)
+    values = np.asarray(values, dtype=float)
+    return dict(
+        type='data',
+        symmetric=False,
+        array=np.clip(bounds[f'{stat} High'].to_numpy() - values, 0, None),
+        arrayminus=np.clip(values - bounds[f'{stat} Low'].to_numpy(), 0, None),
+        color='rgba(66,66,66,0.6)',
+        thickness=1.5,
+        width=6
+    )
@@ -0,0 +1,138 @@
+"""Change points in the per-start series, found by binary segmentation on cumulative sums.
+
+Each series (walk rate, strikeout rate, Game Score, home runs) is split where its mean
+shifts. The squared-error cost of any run of starts comes from three cumulative sums, so
+every candidate split is scored in O(1). Each round scores every split of every open segment
+at once, across all pitchers in the log. A split is kept only when it lowers the cost by
+more than a BIC penalty scaled to that pitcher's start-to-start noise. Rate series are
+weighted by batters faced, so a 30-batter start counts for more than a 15-batter one.
+"""
+import numpy as np
+import pandas as pd
+
+# Series name -> (numerator column, weight column or None for an unweighted per-start value)
+CHANGE_SERIES = {
+    'BB/BF': ('BB', 'BF'),
+    'SO/BF': ('SO', 'BF'),
+    'GmSc': ('GmSc', None),
+    'HR': ('HR', None),
+}
+
+MIN_SEGMENT = 6        # starts on each side of a change point
+PENALTY_SCALE = 2      # BIC: two parameters (location and new mean) per change point
+RECENT_STARTS = 10     # a change this close to the latest start counts as a new regime
+
+
+def segment_cost(cw, cwx, cwxx, lo, hi):
+    """Weighted squared error around the mean of starts lo..hi-1, from cumulative sums"""
+    w = cw[hi] - cw[lo]
+    wx = cwx[hi] - cwx[lo]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(w > 0, (cwxx[hi] - cwxx[lo]) - wx ** 2 / w, 0.0)
+
+
+def noise_variance(x, w, groups):
+    """Per-group variance of a start around its local mean, from successive differences.
+
+    Differences cancel level shifts, so the estimate isn't inflated by the change points
+    being looked for. Each difference is scaled by its two starts' weights, so for rate
+    series the result is the variance of a single batter-faced outcome.
+    """
+    same = groups[1:] == groups[:-1]
+    d = (x[1:] - x[:-1]) / np.sqrt(1 / w[1:] + 1 / w[:-1])
+    variance = pd.Series(d[same] ** 2).groupby(groups[1:][same]).mean()
+    return variance.reindex(np.unique(groups)).fillna(0).to_numpy()
+
+
+def binary_segmentation(x, w, groups, min_size=MIN_SEGMENT, penalty_scale=PENALTY_SCALE):
+    """Change points of the weighted mean of `x`, each group (contiguous rows) split separately.
+
+    Returns the sorted row positions where a new segment starts (never a group's first row).
+    """
+    n = len(x)
+    cw = np.r_[0, np.cumsum(w)]
+    cwx = np.r_[0, np.cumsum(w * x)]
+    cwxx = np.r_[0, np.cumsum(w * x * x)]
+
+    _, lo = np.unique(groups, return_index=True)
+    hi = np.r_[lo[1:], n]
+    penalty = penalty_scale * noise_variance(x, w, groups) * np.log(np.maximum(hi - lo, 2))
+    seg_lo, seg_hi, seg_pen = lo, hi, penalty
+    points = []
+
+    while len(seg_lo):
+        n_splits = seg_hi - seg_lo - 2 * min_size + 1
+        open_ = n_splits > 0
+        seg_lo, seg_hi, seg_pen, n_splits = seg_lo[open_], seg_hi[open_], seg_pen[open_], n_splits[open_]
+        if not len(seg_lo):
+            break
+
+        # Every allowed split of every open segment, scored at once
+        seg = np.repeat(np.arange(len(seg_lo)), n_splits)
+        first = np.r_[0, np.cumsum(n_splits)[:-1]]
+        split = seg_lo[seg] + min_size + np.arange(len(seg)) - first[seg]
+        gain = (segment_cost(cw, cwx, cwxx, seg_lo[seg], seg_hi[seg])
+                - segment_cost(cw, cwx, cwxx, seg_lo[seg], split)
+                - segment_cost(cw, cwx, cwxx, split, seg_hi[seg]))
+
+        # Best split per segment: highest gain first within each segment
+        best = np.lexsort((-gain, seg))[first]
+        keep = gain[best] > seg_pen
+        split = split[best][keep]
+        points.append(split)
+
+        seg_lo, seg_hi = np.r_[seg_lo[keep], split], np.r_[split, seg_hi[keep]]
+        seg_pen = np.r_[seg_pen[keep], seg_pen[keep]]
+
+    return np.sort(np.concatenate(points)) if points else np.array([], dtype=np.int64)
+
+
+def change_points(df_data, by=(), series=CHANGE_SERIES, min_size=MIN_SEGMENT, penalty_scale=PENALTY_SCALE):
+    """Regime changes in each per-start series, one row per change point.
+
+    Starts are taken in date order across seasons. `by` lists the columns that identify one
+    pitcher; add a pitcher column to run a whole staff at once. Each row gives the first start of
+    the new regime and the series mean before and after it (to the neighbouring change points).
+    """
+    by = list(by)
+    log = df_data.sort_values(by + ['Date'], kind='stable').reset_index(drop=True)
+    groups = log.groupby(by, sort=False).ngroup().to_numpy() if by else np.zeros(len(log), dtype=np.int64)
+    # Position of each start within its pitcher's sequence, and that pitcher's start count
+    start_no = log.groupby(groups).cumcount().to_numpy()
+    n_starts = np.bincount(groups)[groups]
+
+    found = []
+    for name, (col, weight_col) in series.items():
+        w = log[weight_col].to_numpy(dtype=float) if weight_col else np.ones(len(log))
+        x = log[col].to_numpy(dtype=float) / np.where(w > 0, w, 1) if weight_col else log[col].to_numpy(dtype=float)
+        valid = np.flatnonzero((w > 0) & ~np.isnan(x))
+        x, w, g = x[valid], w[valid], groups[valid]
+
+        at = binary_segmentation(x, w, g, min_size, penalty_scale)
+        if not len(at):
+            continue
+
+        # Segment boundaries per group: group starts plus change points
+        bounds = np.unique(np.r_[np.unique(g, return_index=True)[1], at, len(x)])
+        cw = np.r_[0, np.cumsum(w)]
+        cwx = np.r_[0, np.cumsum(w * x)]
+        means = (cwx[bounds[1:]] - cwx[bounds[:-1]]) / (cw[bounds[1:]] - cw[bounds[:-1]])
+        k = np.searchsorted(bounds, at)
+
+        rows = log.loc[valid[at], by + ['Date', 'Year']].reset_index(drop=True)
+        rows['Series'] = name
+        rows['Start'] = start_no[valid[at]] + 1
+        rows['Starts Ago'] = n_starts[valid[at]] - start_no[valid[at]] - 1
+        rows['Before'] = means[k - 1]
+        rows['After'] = means[k]
+        found.append(rows)
+
+    columns = by + ['Date', 'Year', 'Series', 'Start', 'Starts Ago', 'Before', 'After']
+    if not found:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(found, ignore_index=True)[columns].sort_values(by + ['Date', 'Series']).reset_index(drop=True)
+
+
+def recent_shifts(points, last_n=RECENT_STARTS):
+    """Change points among each pitcher's latest `last_n` starts, i.e. regimes that just began"""
+    return points[points['Starts Ago'] < last_n]
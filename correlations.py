@@ -0,0 +1,54 @@
+"""Correlation matrices of the game log's numeric columns, per season and across all seasons.
+
+The chosen columns are copied once into a contiguous float64 array with rows sorted by
+season. Each season is then a row slice of that array, and its full matrix comes from a
+single `np.corrcoef` call. No pairwise loops run, so the cost grows with starts x columns²
+in vectorized code, however many seasons or pitchers there are.
+"""
+import numpy as np
+import pandas as pd
+
+# Per-start counting and rate columns (identifiers, dates and the partial game-state columns left out)
+CORRELATION_COLUMNS = [
+    'Outs', 'BF', 'Pit', 'Str', 'StL', 'StS', 'H', 'R', 'ER', 'HR', 'BB', 'IBB', 'SO', 'HBP',
+    'BK', 'WP', 'GB', 'FB', 'LD', 'PU', 'Unk', 'AB', '2B', '3B', 'SB', 'CS', 'PO', 'GIDP',
+    'SF', 'ROE', 'DR', 'GmSc', 'ERA', 'FIP', 'BAbip', 'aLI', 'WPA', 'cWPA', 'RE24',
+]
+
+ALL_SEASONS = 'All seasons'
+
+
+def correlation_matrices(df_data, columns=CORRELATION_COLUMNS, by='Year'):
+    """Correlation matrix of `columns` for all starts and for each value of `by`.
+
+    Returns (labels, columns, matrices): labels[0] is ALL_SEASONS, then each season, and
+    matrices[i] is the (n_columns x n_columns) matrix for labels[i]. A column that doesn't
+    vary within a season (e.g. no balks all year) has NaN correlations there.
+    """
+    columns = [col for col in columns if col in df_data.columns]
+    log = df_data.sort_values(by, kind='stable')
+    values = np.ascontiguousarray(log[columns].to_numpy(dtype=np.float64))
+    seasons, first = np.unique(log[by].to_numpy(), return_index=True)
+    last = np.r_[first[1:], len(values)]
+
+    matrices = np.full((len(seasons) + 1, len(columns), len(columns)), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        matrices[0] = np.corrcoef(values, rowvar=False)
+        for i, (lo, hi) in enumerate(zip(first, last), start=1):
+            if hi - lo > 1:
+                matrices[i] = np.corrcoef(values[lo:hi], rowvar=False)
+    return [ALL_SEASONS] + seasons.tolist(), columns, matrices
+
+
+def strongest_pairs(matrix, columns, n=10):
+    """The `n` column pairs with the largest absolute correlation, strongest first"""
+    rows, cols = np.triu_indices(len(columns), k=1)
+    r = matrix[rows, cols]
+    keep = ~np.isnan(r)
+    rows, cols, r = rows[keep], cols[keep], r[keep]
+    order = np.argsort(-np.abs(r), kind='stable')[:n]
+    return pd.DataFrame({
+        'Metric 1': np.asarray(columns)[rows[order]],
+        'Metric 2': np.asarray(columns)[cols[order]],
+        'Correlation': r[order],
+    })
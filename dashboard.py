@@ -1,9 +1,23 @@
+import os
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+from win_probability import win_probability_by_season, rolling_win_probability
+from bootstrap import BOOTSTRAP_STATS, bootstrap_season_intervals, error_bars
+from rates import fip_constant
+from pitcher_report import read_workbook, peak_and_latest, exit_context
+from export import EXPORT_FORMATS, export_file
+from plot_encoding import encode_figure, payload_size
+from workload import WORKLOAD_FLAGS, ACWR_HIGH, extend_workload, workload_summary
+from change_points import recent_shifts, change_points, RECENT_STARTS
+from streaks import STREAK_TYPES, season_streaks, longest_streaks, consistency_summary
+from league_percentiles import LEAGUE_FILE, read_league_table, LeagueBaseline, percentile_label, percentile_badge
+from opponent_adjustment import TEAM_OFFENSE_FILE, read_team_offense, TeamOffense, season_adjusted
+from season_window import GameLogWindow, check_season_totals
+# Modules used by a single page (season_explorer, similar_starts, drivers, projection, correlations,
+# adhoc_query) are imported in the page branches, so other pages' reruns never load them
 
 # Page configuration
 st.set_page_config(
@@ -143,27 +157,146 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+DATA_FILE = 'Data/sandy_stats_since_21 copy.xlsx'
+
 # Load data
-@st.cache_data
-def load_data():
-    """Load and prepare the data from Excel file"""
-    # Load all sheets
-    df_data = pd.read_excel('Data/sandy_stats_since_21 copy.xlsx', sheet_name='Data')
-    df_season = pd.read_excel('Data/sandy_stats_since_21 copy.xlsx', sheet_name='Season Totals')
-    df_vars = pd.read_excel('Data/sandy_stats_since_21 copy.xlsx', sheet_name='Variable Descriptions')
-    
-    # Clean up the data sheet - remove unnamed columns
-    # Handle NaN values by filling them with False before applying ~ operator
-    unnamed_mask = df_data.columns.str.contains('^Unnamed', na=False)
-    df_data = df_data.loc[:, ~unnamed_mask]
-    
-    # Ensure Date is datetime
-    df_data['Date'] = pd.to_datetime(df_data['Date'])
-    
-    return df_data, df_season, df_vars
+# Cached results are also persisted to disk, so a warm-up run (warmup.py) done before the
+# server starts saves the first visitor from parsing the workbook and building the metrics
+@st.cache_data(persist="disk")
+def load_data(data_version):
+    """Load and prepare the data from Excel file (data_version: the workbook's modification time)"""
+    return read_workbook(DATA_FILE)
+
+@st.cache_resource
+def load_team_offense(team_file, team_version):
+    """Index the team-season offense table by (team, season) once per file version (None without a file)"""
+    teams = read_team_offense(team_file) if team_file else None
+    return TeamOffense(teams) if teams is not None else None
+
+@st.cache_data(persist="disk")
+def load_opponent_adjusted(df_data, df_season, team_file, team_version):
+    """Join each start to its opponent's offense and add the adjusted columns, once per data and table version"""
+    games = load_team_offense(team_file, team_version).adjust(df_data, df_season)
+    seasons = season_adjusted(games, df_season)[['Year', 'Avg Opp R/G', 'Adj ERA', 'Adj FIP', 'Adj K/BB']]
+    return games, df_season.merge(seasons, on='Year', how='left')
+
+@st.cache_data(persist="disk")
+def load_season_adjusted(df_data, df_season):
+    """Raw and opponent-adjusted season ERA, FIP and K/BB for the starts in the game window"""
+    return season_adjusted(df_data, df_season)
+
+@st.cache_data(persist="disk")
+def load_win_probability(df_data):
+    """Compute season and rolling leverage/win-probability summaries once per data version"""
+    return win_probability_by_season(df_data), rolling_win_probability(df_data)
+
+@st.cache_data(persist="disk")
+def load_bootstrap_intervals(df_data):
+    """Compute game-level bootstrap intervals for season rate stats once per data version"""
+    return bootstrap_season_intervals(df_data)
+
+@st.cache_resource
+def load_start_index(df_data):
+    """Build the standardized game-line index used by the similar-start search"""
+    return StartIndex(df_data)
+
+@st.cache_data(persist="disk")
+def load_season_projection(df_data, df_season, n_starts, recovery_weight):
+    """Simulate 20,000 seasons of starts and return the projected ERA, FIP and K/BB of each"""
+    totals = simulate_season(df_data, n_starts=n_starts, recovery_weight=recovery_weight)
+    return projection_rates(totals, fip_constant(df_season))
+
+@st.cache_data(persist="disk")
+def load_streaks(df_data):
+    """Find every streak in the game log and the per-season consistency summary once per data version"""
+    streaks = season_streaks(df_data)
+    return streaks, longest_streaks(streaks), consistency_summary(df_data)
+
+@st.cache_resource
+def workload_store():
+    """The last workload table built by this server, kept so a reloaded game log can extend it"""
+    return {}
+
+@st.cache_data(persist="disk")
+def load_workload(df_data):
+    """Rest, pitch loads and workload flags for every start, extending the last table when the workbook only gained later starts"""
+    store = workload_store()
+    store['table'] = extend_workload(store.get('table'), df_data)
+    return store['table']
+
+@st.cache_data(persist="disk")
+def load_driver_fits(df_data):
+    """Fit Game Score and ER per out on their game-line drivers per season and rolling window, once per data version"""
+    seasons, rolling = driver_fits(df_data)
+    return seasons, rolling, driver_effects(df_data, seasons)
+
+@st.cache_data(persist="disk")
+def load_change_points(df_data):
+    """Find regime changes in the per-start walk, strikeout, Game Score and HR series once per data version"""
+    return change_points(df_data)
+
+@st.cache_resource
+def load_league_baseline(league_file, league_version):
+    """Sort the league pitcher-season table into percentile lookups once per file version (None without a file)"""
+    league = read_league_table(league_file) if league_file else None
+    return LeagueBaseline(league) if league is not None else None
+
+@st.cache_resource
+def load_game_log_window(df_data):
+    """Sort the game log by date once for the season-window filter"""
+    return GameLogWindow(df_data)
+
+@st.cache_data(persist="disk")
+def load_season_check(df_data, df_season):
+    """Compare full seasons rebuilt from the game log with the Season Totals sheet"""
+    return check_season_totals(load_game_log_window(df_data), df_season)
+
+@st.cache_data(persist="disk", max_entries=200)
+def load_window_totals(df_data, df_season, start, end, last_n):
+    """Game log, season totals and bootstrap intervals for one window of each season, cached per window"""
+    window = load_game_log_window(df_data)
+    lo, hi = window.date_range(start, end) if last_n is None else window.last_starts(last_n)
+    games = window.rows(lo, hi)
+    if games.empty:
+        return games, None, None
+    intervals = bootstrap_season_intervals(games).set_index('Year').reindex(window.years).reset_index()
+    return games, window.totals(lo, hi, df_season), intervals
+
+@st.cache_data(persist="disk")
+def load_correlations(df_data):
+    """Correlation matrices of the game log's numeric columns, all seasons and each season, once per data version"""
+    return correlation_matrices(df_data)
+
+@st.cache_data(persist="disk")
+def load_table_columns(df_data, df_season, df_vars):
+    """List the columns and SQL types of the tables available on the Ad-hoc Query page"""
+    return table_columns(query_tables(df_data, df_season, df_vars))
+
+@st.cache_data(persist="disk", max_entries=200)
+def load_query_result(df_data, df_season, df_vars, sql, row_limit):
+    """Run an ad-hoc SQL query once per query text, row limit and data version"""
+    return run_query(sql, query_tables(df_data, df_season, df_vars), row_limit)
+
+def table_file(path):
+    """`path`, or the same table saved as Parquet, whichever exists first (None if neither)"""
+    for candidate in (path, os.path.splitext(path)[0] + '.parquet'):
+        if os.path.exists(candidate):
+            return candidate
+    return None
 
 # Load data
-df_data, df_season, df_vars = load_data()
+df_data, df_season, df_vars = load_data(os.path.getmtime(DATA_FILE))
+# With a team offense table, every start carries its opponent-adjusted stats from here on
+team_file = table_file(TEAM_OFFENSE_FILE)
+team_version = os.path.getmtime(team_file) if team_file else None
+opponent_adjusted = load_team_offense(team_file, team_version) is not None
+if opponent_adjusted:
+    df_data, df_season = load_opponent_adjusted(df_data, df_season, team_file, team_version)
+df_wpa_season, df_wpa_rolling = load_win_probability(df_data)
+df_intervals = load_bootstrap_intervals(df_data)
+df_workload = load_workload(df_data)
+league_file = table_file(LEAGUE_FILE)
+league_baseline = load_league_baseline(league_file, os.path.getmtime(league_file) if league_file else None)
 
 # Title and Introduction
 st.title("⚾ Sandy Alcantara: Performance Analysis Dashboard")
@@ -207,8 +340,44 @@ st.sidebar.markdown("""
 st.sidebar.header("📊 Dashboard Navigation")
 page = st.sidebar.radio(
     "Select a section:",
-    ["Overview", "Performance Regression", "Pitch Usage Analysis", "Detailed Statistics", "Analysis & Recommendations"]
+    ["Overview", "Performance Regression", "Pitch Usage Analysis", "Detailed Statistics", "Analysis & Recommendations",
+     "Correlations", "Ad-hoc Query"]
 )
+browser_charts = st.sidebar.checkbox(
+    "Switch metrics in the browser", value=True,
+    help="Metric pickers redraw their charts without a trip to the server. Turn off if charts don't load."
+)
+st.sidebar.markdown("---")
+
+# Season charts can cover part of every season, rebuilt from the game log
+st.sidebar.header("📅 Game Window")
+window_mode = st.sidebar.radio("Starts to include:", ["Full seasons", "Date range", "Last N starts"])
+window_start = window_end = last_n = None
+if window_mode == "Date range":
+    first_day, last_day = load_game_log_window(df_data).day_span()
+    window_start, window_end = st.sidebar.slider(
+        "Dates (within each season):",
+        min_value=first_day, max_value=last_day,
+        value=(first_day, first_day + (last_day - first_day) // 2), format="MMM D"
+    )
+elif window_mode == "Last N starts":
+    last_n = st.sidebar.slider("Starts at the end of each season:", min_value=1, max_value=30, value=10)
+
+season_check = load_season_check(df_data, df_season)
+if season_check:
+    st.sidebar.warning("Game log and Season Totals disagree:\n\n" + "\n".join(f"- {p}" for p in season_check))
+
+# Full-season totals stay available for stats that need a whole season
+df_season_totals = df_season
+df_window = df_data
+if window_mode != "Full seasons":
+    window_games, window_season, window_intervals = load_window_totals(df_data, df_season, window_start, window_end, last_n)
+    if window_games.empty:
+        st.sidebar.warning("No starts fall in this window; showing full seasons.")
+    else:
+        df_window, df_season, df_intervals = window_games, window_season, window_intervals
+        st.sidebar.caption(f"Season charts cover {len(df_window)} of {len(df_data)} starts. "
+                           "Pitch mix is always the full-season value.")
 st.sidebar.markdown("---")
 st.sidebar.markdown("""
 <div style='text-align: center; color: white; font-size: 0.9rem;'>
@@ -217,6 +386,15 @@ st.sidebar.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# Data export for the tables on the current page. The format radio is created here, before
+# any page fragment reads it; the table picker and button are filled in once the page has
+# added its tables
+st.sidebar.markdown("---")
+st.sidebar.header("💾 Download Data")
+export_table_slot = st.sidebar.container()
+export_format = st.sidebar.radio("Format:", list(EXPORT_FORMATS.keys()), horizontal=True, key='export_format')
+export_button_slot = st.sidebar.container()
+
 # Baseball-themed color scheme
 colors = {
     '2021': '#1565c0',  # Blue
@@ -225,6 +403,47 @@ colors = {
     '2025': '#c62828'   # Red for worst year
 }
 
+# Set DASHBOARD_PAYLOAD_REPORT=1 to list each chart's browser payload size in the sidebar
+payload_report = [] if os.environ.get('DASHBOARD_PAYLOAD_REPORT') else None
+
+def plotly_chart(fig, **kwargs):
+    """Render a figure with its trace data sent as compact binary arrays (kwargs go to st.plotly_chart)"""
+    encoded = encode_figure(fig)
+    if payload_report is not None:
+        before, after = payload_size(fig), payload_size(encoded)
+        payload_report.append({
+            'Chart': fig.layout.title.text or f'Chart {len(payload_report) + 1}',
+            'JSON (KB)': before / 1024,
+            'Binary (KB)': after / 1024,
+            'Saved (%)': (1 - after / before) * 100
+        })
+    return st.plotly_chart(encoded, width="stretch", **kwargs)
+
+# League percentiles of each full season, when a league pitcher-season table is available.
+# The league table holds full seasons only, so windowed totals aren't ranked against it
+df_percentiles = league_baseline.season_percentiles(df_season_totals) if league_baseline is not None else None
+
+def league_badge(year, stat):
+    """League percentile pill for one season's stat, or nothing without a league table or inside a game window"""
+    if df_percentiles is None or stat not in df_percentiles.columns or window_mode != "Full seasons":
+        return ''
+    return percentile_badge(df_percentiles.loc[df_percentiles['Year'] == year, stat].iloc[0], stat)
+
+def card_stat(value):
+    """A season rate stat to two decimals, or a dash when the window has no starts that season"""
+    return f"{value:.2f}" if pd.notna(value) else "—"
+
+def card_change(change):
+    """ERA change from 2022 for the summary cards, or a note when either season has no starts in the window"""
+    return f"{change:+.2f} from 2022" if pd.notna(change) else "No starts in this window"
+
+# Tables offered for download in the sidebar; each page adds the tables it shows.
+# Game Log and Season Totals follow the game window, like the season charts
+export_tables = {
+    'Game Log': df_window,
+    'Season Totals': df_season
+}
+
 # ========== OVERVIEW PAGE ==========
 if page == "Overview":
     st.header("📈 Season Overview ⚾")
@@ -236,9 +455,10 @@ if page == "Overview":
         era_2021 = df_season[df_season['Year'] == 2021]['ERA'].values[0]
         st.markdown(f"""
         <div style='text-align: center; padding: 1rem; background: linear-gradient(135deg, #e3f2fd 0%, #ffffff 100%); border-radius: 10px; border: 2px solid #1565c0;'>
-            <div style='font-family: "Bebas Neue", cursive; font-size: 4rem; color: #0d47a1; line-height: 1;'>{era_2021:.2f}</div>
+            <div style='font-family: "Bebas Neue", cursive; font-size: 4rem; color: #0d47a1; line-height: 1;'>{card_stat(era_2021)}</div>
             <div style='font-family: "Oswald", sans-serif; font-size: 1.2rem; color: #424242; margin-top: 0.5rem; font-weight: 600;'>2021 ERA</div>
             <div style='font-family: "Roboto", sans-serif; font-size: 0.9rem; color: #757575; margin-top: 0.3rem;'>Earned Run Average</div>
+            {league_badge(2021, 'ERA')}
         </div>
         """, unsafe_allow_html=True)
         w_2021 = df_season[df_season['Year'] == 2021]['W'].values[0]
@@ -255,9 +475,10 @@ if page == "Overview":
         era_2022 = df_season[df_season['Year'] == 2022]['ERA'].values[0]
         st.markdown(f"""
         <div style='text-align: center; padding: 1rem; background: linear-gradient(135deg, #e8f5e9 0%, #ffffff 100%); border-radius: 10px; border: 3px solid #2e7d32;'>
-            <div style='font-family: "Bebas Neue", cursive; font-size: 4rem; color: #1b5e20; line-height: 1;'>{era_2022:.2f}</div>
+            <div style='font-family: "Bebas Neue", cursive; font-size: 4rem; color: #1b5e20; line-height: 1;'>{card_stat(era_2022)}</div>
             <div style='font-family: "Oswald", sans-serif; font-size: 1.2rem; color: #424242; margin-top: 0.5rem; font-weight: 600;'>🏆 2022 ERA</div>
             <div style='font-family: "Roboto", sans-serif; font-size: 0.9rem; color: #757575; margin-top: 0.3rem;'>Cy Young Award Winner</div>
+            {league_badge(2022, 'ERA')}
         </div>
         """, unsafe_allow_html=True)
         w_2022 = df_season[df_season['Year'] == 2022]['W'].values[0]
@@ -275,9 +496,10 @@ if page == "Overview":
         era_change_2023 = era_2023 - era_2022
         st.markdown(f"""
         <div style='text-align: center; padding: 1rem; background: linear-gradient(135deg, #fff3e0 0%, #ffffff 100%); border-radius: 10px; border: 2px solid #f57c00;'>
-            <div style='font-family: "Bebas Neue", cursive; font-size: 4rem; color: #e65100; line-height: 1;'>{era_2023:.2f}</div>
+            <div style='font-family: "Bebas Neue", cursive; font-size: 4rem; color: #e65100; line-height: 1;'>{card_stat(era_2023)}</div>
             <div style='font-family: "Oswald", sans-serif; font-size: 1.2rem; color: #424242; margin-top: 0.5rem; font-weight: 600;'>2023 ERA</div>
-            <div style='font-family: "Roboto", sans-serif; font-size: 0.9rem; color: #757575; margin-top: 0.3rem;'>+{era_change_2023:.2f} from 2022</div>
+            <div style='font-family: "Roboto", sans-serif; font-size: 0.9rem; color: #757575; margin-top: 0.3rem;'>{card_change(era_change_2023)}</div>
+            {league_badge(2023, 'ERA')}
         </div>
         """, unsafe_allow_html=True)
         w_2023 = df_season[df_season['Year'] == 2023]['W'].values[0]
@@ -295,9 +517,10 @@ if page == "Overview":
         era_change_2025 = era_2025 - era_2022
         st.markdown(f"""
         <div style='text-align: center; padding: 1rem; background: linear-gradient(135deg, #ffebee 0%, #ffffff 100%); border-radius: 10px; border: 2px solid #c62828;'>
-            <div style='font-family: "Bebas Neue", cursive; font-size: 4rem; color: #b71c1c; line-height: 1;'>{era_2025:.2f}</div>
+            <div style='font-family: "Bebas Neue", cursive; font-size: 4rem; color: #b71c1c; line-height: 1;'>{card_stat(era_2025)}</div>
             <div style='font-family: "Oswald", sans-serif; font-size: 1.2rem; color: #424242; margin-top: 0.5rem; font-weight: 600;'>2025 ERA</div>
-            <div style='font-family: "Roboto", sans-serif; font-size: 0.9rem; color: #757575; margin-top: 0.3rem;'>+{era_change_2025:.2f} from 2022</div>
+            <div style='font-family: "Roboto", sans-serif; font-size: 0.9rem; color: #757575; margin-top: 0.3rem;'>{card_change(era_change_2025)}</div>
+            {league_badge(2025, 'ERA')}
         </div>
         """, unsafe_allow_html=True)
         w_2025 = df_season[df_season['Year'] == 2025]['W'].values[0]
@@ -326,54 +549,77 @@ if page == "Overview":
         'BAbip': 'Batting Average on Balls in Play'
     }
     
-    selected_metric = st.selectbox("Select a metric to compare:", list(metric_names.keys()), 
-                                   format_func=lambda x: metric_names[x])
-    
-    # Convert Year to int and prepare data
-    years_int = df_season['Year'].astype(int).tolist()
-    metric_values = df_season[selected_metric].tolist()
-    max_val = max(metric_values)
-    
-    # Determine text format - whole numbers for HR, SO, BB, etc., decimals for others
-    whole_number_metrics = ['HR', 'SO', 'BB', 'H', 'IP']
-    if selected_metric in whole_number_metrics:
-        text_format = [f"{int(val)}" for val in metric_values]
-        text_template = '%{text}'
-    elif selected_metric == 'BAbip':
-        # BAbip should have 3 decimal places
-        text_format = [f"{val:.3f}" for val in metric_values]
-        text_template = '%{text:.3f}'
+    # Metric switching happens in the browser; the server version reruns the script on each change
+    metric_formats = {'SO': 'int', 'BB': 'int', 'HR': 'int', 'IP': '.1f', 'BAbip': '.3f'}
+    if browser_charts:
+        from season_explorer import season_bundle, metric_view, season_explorer
+        season_explorer(
+            season_bundle(df_season, metrics_to_show, colors, df_intervals),
+            metric_view(metric_names, metric_formats, "Select a metric to compare:",
+                        "⚾ {name} by Season", "{name}", error_bars=True),
+            key='overview_metrics'
+        )
     else:
-        text_format = [f"{val:.2f}" for val in metric_values]
-        text_template = '%{text:.2f}'
+        # Metric chart; changing the metric reruns only this fragment
+        @st.fragment
+        def overview_metric_chart():
+            selected_metric = st.selectbox("Select a metric to compare:", list(metric_names.keys()), 
+                                           format_func=lambda x: metric_names[x])
     
-    fig = go.Figure()
-    fig.add_trace(
-        go.Bar(
-            x=years_int,
-            y=metric_values,
-            marker_color=[colors[str(y)] for y in years_int],
-            text=text_format,
-            textposition='outside',
-            hovertemplate=f'{metric_names[selected_metric]}: %{{y}}<extra></extra>'
-        )
-    )
+            # Convert Year to int and prepare data
+            years_int = df_season['Year'].astype(int).tolist()
+            metric_values = df_season[selected_metric].tolist()
+            max_val = max(metric_values)
+    
+            # Show the bootstrap interval when one is available for this metric
+            metric_error_y = None
+            if selected_metric in BOOTSTRAP_STATS:
+                metric_error_y = error_bars(df_intervals, selected_metric, years_int, metric_values)
+                max_val = max(max_val, df_intervals[f'{selected_metric} High'].max())
+    
+            # Determine text format - whole numbers for HR, SO, BB, etc., decimals for others
+            whole_number_metrics = ['HR', 'SO', 'BB', 'H', 'IP']
+            if selected_metric in whole_number_metrics:
+                text_format = [f"{int(val)}" for val in metric_values]
+                text_template = '%{text}'
+            elif selected_metric == 'BAbip':
+                # BAbip should have 3 decimal places
+                text_format = [f"{val:.3f}" for val in metric_values]
+                text_template = '%{text:.3f}'
+            else:
+                text_format = [f"{val:.2f}" for val in metric_values]
+                text_template = '%{text:.2f}'
     
-    # Always add padding to prevent numbers from being cut off
-    fig.update_layout(
-        title=f"⚾ {metric_names[selected_metric]} by Season",
-        xaxis_title="Season",
-        yaxis_title=metric_names[selected_metric],
-        showlegend=False, 
-        height=450,
-        yaxis=dict(range=[0, max_val * 1.15]),  # Add 15% padding for text visibility
-        font=dict(family="Roboto, sans-serif", size=12),
-        title_font=dict(family="Oswald, sans-serif", size=20, color="#1565c0"),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        xaxis=dict(tickmode='linear', tick0=2021, dtick=1)
-    )
-    st.plotly_chart(fig, use_container_width=True)
+            fig = go.Figure()
+            fig.add_trace(
+                go.Bar(
+                    x=years_int,
+                    y=metric_values,
+                    marker_color=[colors[str(y)] for y in years_int],
+                    text=text_format,
+                    textposition='outside',
+                    error_y=metric_error_y,
+                    hovertemplate=f'{metric_names[selected_metric]}: %{{y}}<extra></extra>'
+                )
+            )
+    
+            # Always add padding to prevent numbers from being cut off
+            fig.update_layout(
+                title=f"⚾ {metric_names[selected_metric]} by Season",
+                xaxis_title="Season",
+                yaxis_title=metric_names[selected_metric],
+                showlegend=False, 
+                height=450,
+                yaxis=dict(range=[0, max_val * 1.15]),  # Add 15% padding for text visibility
+                font=dict(family="Roboto, sans-serif", size=12),
+                title_font=dict(family="Oswald, sans-serif", size=20, color="#1565c0"),
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                xaxis=dict(tickmode='linear', tick0=2021, dtick=1)
+            )
+            plotly_chart(fig)
+        
+        overview_metric_chart()
     
     # Summary table
     st.subheader("📊 Complete Season Statistics")
@@ -383,7 +629,18 @@ if page == "Overview":
         'ERA': '{:.2f}',
         'FIP': '{:.2f}',
         'BAbip': '{:.3f}'
-    }), use_container_width=True)
+    }), width="stretch")
+    export_tables['Season Statistics'] = df_season[display_cols]
+    
+    # Where each season ranks among league starters
+    st.markdown("**League percentiles** (share of league pitcher seasons with 100+ IP that each full season beats)")
+    if df_percentiles is not None:
+        st.dataframe(df_percentiles.style.format(
+            {stat: percentile_label for stat in df_percentiles.columns if stat != 'Year'}
+        ), width="stretch")
+        export_tables['League Percentiles'] = df_percentiles
+    else:
+        st.caption(f"Add a league pitcher-season table at `{LEAGUE_FILE}` (or `.parquet`) to rank each season against the league.")
 
 # ========== PERFORMANCE REGRESSION PAGE ==========
 elif page == "Performance Regression":
@@ -404,7 +661,8 @@ elif page == "Performance Regression":
             mode='lines+markers',
             name='ERA',
             line=dict(color='#d62728', width=3),
-            marker=dict(size=12, symbol='circle')
+            marker=dict(size=12, symbol='circle'),
+            error_y=error_bars(df_intervals, 'ERA', df_season['Year'], df_season['ERA'])
         )
     )
     
@@ -442,17 +700,91 @@ elif page == "Performance Regression":
         bgcolor="rgba(255,255,255,0.8)"
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig)
     
     st.markdown("""
     **What this shows:** 
     - ERA (Earned Run Average) measures runs allowed per 9 innings
     - FIP (Fielding Independent Pitching) measures what ERA should be based on strikeouts, walks, and home runs
     - Both metrics show a significant decline from 2022 to 2025
+    - Error bars show the 95% range of ERA when each season's starts are resampled (bootstrap), 
+      so seasons whose bars don't overlap differ by more than start-to-start noise
     """)
     
     st.markdown("---")
     
+    # Opponent-adjusted ERA and FIP
+    st.subheader("🆚 Opponent-Adjusted ERA and FIP")
+    
+    if not opponent_adjusted:
+        st.caption(f"Add a team-season batting table at `{TEAM_OFFENSE_FILE}` (or `.parquet`; Baseball-Reference columns "
+                   "Year, Tm, G, PA, R, HR, BB, SO) to adjust each start for the lineup Sandy faced.")
+    else:
+        df_adjusted = load_season_adjusted(df_window, df_season_totals)
+        
+        fig = go.Figure()
+        for stat, color in [('ERA', '#1565c0'), ('FIP', '#ff7f0e')]:
+            fig.add_trace(
+                go.Bar(
+                    name=stat,
+                    x=df_adjusted['Year'],
+                    y=df_adjusted[stat],
+                    marker_color=color,
+                    opacity=0.45,
+                    hovertemplate=f'{stat}: %{{y:.2f}}<extra></extra>'
+                )
+            )
+            fig.add_trace(
+                go.Bar(
+                    name=f'Adj {stat}',
+                    x=df_adjusted['Year'],
+                    y=df_adjusted[f'Adj {stat}'],
+                    marker_color=color,
+                    text=[f"{val:.2f}" for val in df_adjusted[f'Adj {stat}']],
+                    textposition='outside',
+                    hovertemplate=f'Adj {stat}: %{{y:.2f}}<extra></extra>'
+                )
+            )
+        
+        fig.update_layout(
+            title="⚾ ERA and FIP, Raw vs Opponent-Adjusted",
+            xaxis_title="Season",
+            yaxis_title="Runs per 9 Innings",
+            barmode='group',
+            height=450,
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            font=dict(family="Roboto, sans-serif", size=12),
+            title_font=dict(family="Oswald, sans-serif", size=20, color="#1565c0"),
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            xaxis=dict(tickmode='linear', tick0=2021, dtick=1)
+        )
+        
+        plotly_chart(fig)
+        
+        st.dataframe(df_adjusted.style.format({
+            'Avg Opp R/G': '{:.2f}',
+            'ERA': '{:.2f}',
+            'Adj ERA': '{:.2f}',
+            'FIP': '{:.2f}',
+            'Adj FIP': '{:.2f}',
+            'K/BB': '{:.2f}',
+            'Adj K/BB': '{:.2f}'
+        }), width="stretch")
+        export_tables['Opponent-Adjusted Seasons'] = df_adjusted
+        
+        unmatched = (~df_window['Opp Matched']).sum()
+        if unmatched:
+            st.caption(f"{unmatched} starts have no row for their opponent's season in the team table and are left unadjusted.")
+        
+        st.markdown("""
+        **What this shows:** Each start's runs, home runs and walks are scaled by how the opponent's offense
+        compared with the league average that season, and its strikeouts by how often that lineup struck out.
+        An adjusted ERA below the raw ERA means Sandy faced tougher-than-average lineups that season.
+        """)
+    
+    st.markdown("---")
+    
     # Game-by-game ERA progression
     st.subheader("📈 Game-by-Game ERA Progression")
     
@@ -477,6 +809,15 @@ elif page == "Performance Regression":
             )
         )
     
+    # Mark where the per-start series shifted to a new level (one line per date, all series named)
+    shifts = load_change_points(df_data)
+    for shift_date, shift in shifts.groupby('Date'):
+        fig.add_shape(type='line', x0=shift_date, x1=shift_date, y0=0, y1=1, yref='paper',
+                      line=dict(color='#616161', width=1, dash='dash'))
+        fig.add_annotation(x=shift_date, y=0.98, yref='paper', text=' / '.join(shift['Series']),
+                           showarrow=False, xanchor='left', yanchor='top',
+                           font=dict(family="Roboto, sans-serif", size=10, color='#616161'))
+    
     fig.update_layout(
         title="⚾ ERA Throughout Each Season (Game-by-Game)",
         xaxis_title="Date",
@@ -490,25 +831,46 @@ elif page == "Performance Regression":
         paper_bgcolor='rgba(0,0,0,0)'
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig)
+    
+    st.markdown("""
+    **What this shows:** 
+    - Each season's running ERA, start by start
+    - Dashed lines mark starts where walk rate (BB/BF), strikeout rate (SO/BF), Game Score or home runs
+      per start moved to a new level that held for at least several starts, found by change-point detection
+      across all seasons
+    """)
+    
+    if shifts.empty:
+        st.caption("No regime shifts stand out from start-to-start noise in these series.")
+    else:
+        st.dataframe(shifts.style.format({
+            'Date': '{:%b %d, %Y}',
+            'Before': '{:.3g}',
+            'After': '{:.3g}'
+        }), width="stretch")
+        export_tables['Regime Shifts'] = shifts
+    
+    new_regimes = recent_shifts(shifts)
+    if not new_regimes.empty:
+        st.warning(f"New regime within the last {RECENT_STARTS} starts: " + "; ".join(
+            f"{row.Series} {row.Before:.3g} → {row.After:.3g} since {row.Date:%b %d, %Y}"
+            for row in new_regimes.itertuples()))
     
     st.markdown("---")
     
     # Strikeout and Walk rates
     st.subheader("🎯 Strikeout and Walk Trends")
     
-    # Calculate rates per 9 innings
-    df_season['K/9'] = (df_season['SO'] / df_season['IP']) * 9
-    df_season['BB/9'] = (df_season['BB'] / df_season['IP']) * 9
-    df_season['K/BB'] = df_season['SO'] / df_season['BB']
-    
+    # Rates per 9 innings (K/9, BB/9) and K/BB are computed from outs at load time
     col1, col2 = st.columns(2)
     
     with col1:
         years_int = df_season['Year'].astype(int).tolist()
         k9_vals = df_season['K/9'].tolist()
         bb9_vals = df_season['BB/9'].tolist()
-        max_val = max(max(k9_vals), max(bb9_vals))
+        max_val = max(df_intervals['K/9 High'].max(), df_intervals['BB/9 High'].max(),
+                      max(k9_vals), max(bb9_vals))
         
         fig = go.Figure()
         fig.add_trace(
@@ -518,7 +880,8 @@ elif page == "Performance Regression":
                 y=k9_vals,
                 marker_color='#2e7d32',
                 text=[f"{val:.1f}" for val in k9_vals],
-                textposition='outside'
+                textposition='outside',
+                error_y=error_bars(df_intervals, 'K/9', years_int, k9_vals)
             )
         )
         fig.add_trace(
@@ -528,7 +891,8 @@ elif page == "Performance Regression":
                 y=bb9_vals,
                 marker_color='#c62828',
                 text=[f"{val:.1f}" for val in bb9_vals],
-                textposition='outside'
+                textposition='outside',
+                error_y=error_bars(df_intervals, 'BB/9', years_int, bb9_vals)
             )
         )
         fig.update_layout(
@@ -545,7 +909,7 @@ elif page == "Performance Regression":
             xaxis=dict(tickmode='linear', tick0=2021, dtick=1),
             yaxis=dict(range=[0, max_val * 1.15])  # Add padding
         )
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig)
     
     with col2:
         years_int = df_season['Year'].astype(int).tolist()
@@ -578,7 +942,7 @@ elif page == "Performance Regression":
             yaxis=dict(range=[0, max_kbb * 1.15]),  # Add padding for text
             showlegend=False
         )
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig)
     
     st.markdown("""
     **Key Insights:**
@@ -586,6 +950,282 @@ elif page == "Performance Regression":
     - Walk rate (BB/9) has increased from 2.0 in 2022 to 2.9 in 2025
     - The strikeout-to-walk ratio has declined significantly, indicating less control and dominance
     """)
+    
+    st.markdown("---")
+    
+    # Win probability and leverage
+    st.subheader("🎲 Win Probability & Leverage")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        years_int = df_wpa_season['Year'].astype(int).tolist()
+        wpa_vals = df_wpa_season['WPA/GS'].tolist()
+        high_wpa_vals = df_wpa_season['High-Lev WPA/GS'].tolist()
+        
+        fig = go.Figure()
+        fig.add_trace(
+            go.Bar(
+                name='All Starts',
+                x=years_int,
+                y=wpa_vals,
+                marker_color='#1565c0',
+                text=[f"{val:+.2f}" for val in wpa_vals],
+                textposition='outside'
+            )
+        )
+        fig.add_trace(
+            go.Bar(
+                name='High-Leverage Starts',
+                x=years_int,
+                y=high_wpa_vals,
+                marker_color='#ff6f00',
+                text=[f"{val:+.2f}" for val in high_wpa_vals],
+                textposition='outside'
+            )
+        )
+        fig.update_layout(
+            title="⚾ Win Probability Added per Start",
+            xaxis_title="Season",
+            yaxis_title="WPA per Start",
+            height=450,
+            barmode='group',
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            font=dict(family="Roboto, sans-serif", size=12),
+            title_font=dict(family="Oswald, sans-serif", size=18, color="#1565c0"),
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            xaxis=dict(tickmode='linear', tick0=2021, dtick=1)
+        )
+        fig.add_hline(y=0, line_color="gray")
+        plotly_chart(fig)
+    
+    with col2:
+        fig = go.Figure()
+        for year in [2021, 2022, 2023, 2025]:
+            year_data = df_wpa_rolling[df_wpa_rolling['Year'] == year]
+            fig.add_trace(
+                go.Scatter(
+                    x=year_data['Date'],
+                    y=year_data['RE24/100BF'],
+                    mode='lines',
+                    name=f'{year}',
+                    line=dict(color=colors[str(year)], width=2),
+                    hovertemplate='Date: %{x}<br>RE24 per 100 BF: %{y:.2f}<extra></extra>'
+                )
+            )
+        fig.update_layout(
+            title="⚾ Rolling RE24 per 100 Batters Faced (Last 5 Starts)",
+            xaxis_title="Date",
+            yaxis_title="RE24 per 100 BF",
+            height=450,
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            font=dict(family="Roboto, sans-serif", size=12),
+            title_font=dict(family="Oswald, sans-serif", size=18, color="#1565c0"),
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)'
+        )
+        fig.add_hline(y=0, line_color="gray")
+        plotly_chart(fig)
+    
+    wpa_display_cols = ['Year', 'GS', 'aLI', 'WPA', 'WPA/GS', 'WPA/LI', 'RE24/100BF',
+                        'High-Lev GS', 'High-Lev WPA/GS', 'High-Lev RE24/100BF']
+    st.dataframe(df_wpa_season[wpa_display_cols].style.format({
+        'aLI': '{:.2f}',
+        'WPA': '{:+.1f}',
+        'WPA/GS': '{:+.3f}',
+        'WPA/LI': '{:+.2f}',
+        'RE24/100BF': '{:+.2f}',
+        'High-Lev WPA/GS': '{:+.3f}',
+        'High-Lev RE24/100BF': '{:+.2f}'
+    }), width="stretch")
+    export_tables['Win Probability by Season'] = df_wpa_season
+    export_tables['Rolling Win Probability'] = df_wpa_rolling
+    export_tables['Season Confidence Intervals'] = df_intervals
+    
+    st.markdown("""
+    **What this shows:**
+    - **WPA** (Win Probability Added) credits Sandy for how much each start moved the Marlins' chances of winning
+    - **High-leverage starts** are games with an average leverage index (aLI) of 1.2 or more - the tight, high-pressure games
+    - **RE24 per 100 batters faced** measures runs saved compared to an average pitcher in the same base-out situations
+    """)
+    
+    st.markdown("---")
+    
+    # Streaks and consistency
+    st.subheader("🔥 Streaks & Consistency")
+    
+    df_streaks, df_longest, df_consistency = load_streaks(df_data)
+    streak_colors = {
+        'Good': ['#2e7d32', '#66bb6a', '#1565c0'],
+        'Bad': ['#c62828', '#ff6f00']
+    }
+    
+    fig = go.Figure()
+    for streak_type in ['Good', 'Bad']:
+        names = [name for name, kind in STREAK_TYPES.items() if kind == streak_type]
+        for name, color in zip(names, streak_colors[streak_type]):
+            streak_data = df_longest[df_longest['Streak'] == name]
+            fig.add_trace(
+                go.Bar(
+                    name=name,
+                    x=streak_data['Year'].astype(int),
+                    y=streak_data['Starts'],
+                    marker_color=color,
+                    text=streak_data['Starts'],
+                    textposition='outside',
+                    customdata=np.column_stack([streak_data['From'].dt.strftime('%b %d'),
+                                                streak_data['To'].dt.strftime('%b %d'),
+                                                streak_data['IP'].map('{:.1f}'.format)]),
+                    hovertemplate=f'{name}<br>%{{y}} starts, %{{customdata[0]}} - %{{customdata[1]}}'
+                                  '<br>%{customdata[2]} IP<extra></extra>'
+                )
+            )
+    fig.update_layout(
+        title="⚾ Longest Streaks by Season",
+        xaxis_title="Season",
+        yaxis_title="Consecutive Starts",
+        height=500,
+        barmode='group',
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        yaxis=dict(range=[0, df_longest['Starts'].max() * 1.15]),
+        font=dict(family="Roboto, sans-serif", size=12),
+        title_font=dict(family="Oswald, sans-serif", size=20, color="#1565c0"),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis=dict(tickmode='linear', tick0=2021, dtick=1)
+    )
+    plotly_chart(fig)
+    
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        st.markdown("**Longest streak of each kind**")
+        longest_display = df_longest.assign(Streak=df_longest['Streak'].astype(str))
+        st.dataframe(longest_display.style.format({
+            'IP': '{:.1f}',
+            'From': lambda d: d.strftime('%b %d, %Y'),
+            'To': lambda d: d.strftime('%b %d, %Y')
+        }), width="stretch")
+    with col2:
+        st.markdown("**Consistency by season**")
+        st.dataframe(df_consistency.style.format({
+            'Quality Start %': '{:.1f}%',
+            'GmSc Mean': '{:.1f}',
+            'GmSc Std': '{:.1f}'
+        }), width="stretch")
+    export_tables['Streaks'] = df_streaks
+    export_tables['Longest Streaks'] = df_longest
+    export_tables['Consistency by Season'] = df_consistency
+    
+    st.markdown("""
+    **What this shows:**
+    - **Quality starts** here are starts with a Game Score of 50 or more; the good streaks are runs of those, of starts with one walk or fewer, and of scoreless starts
+    - **Bad stretches** are runs of starts below a Game Score of 50 and of starts with three or more walks
+    - Streaks never carry over from one season to the next. The scoreless streak counts whole scoreless starts, so its innings are a lower bound on the scoreless-inning streak
+    - **GmSc Std** is how much Game Score swings from start to start - lower means more consistent
+    """)
+    
+    st.markdown("---")
+    
+    # Workload: rest, acute vs. chronic pitch load, and pitches per inning
+    st.subheader("🩺 Workload Monitor")
+    
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.08, row_heights=[0.6, 0.4],
+                        subplot_titles=("Pitches per Start", "Acute:Chronic Workload Ratio"))
+    for year in df_workload['Year'].unique():
+        year_data = df_workload[df_workload['Year'] == year]
+        fig.add_trace(
+            go.Bar(
+                x=year_data['Date'],
+                y=year_data['Pit'],
+                name=f'{year}',
+                marker_color=colors.get(str(year), '#757575'),
+                customdata=np.column_stack([year_data['Days Rest'], year_data['Pitches/Inning']]),
+                hovertemplate='%{x|%b %d, %Y}<br>%{y} pitches<br>%{customdata[0]:.0f} days rest'
+                              '<br>%{customdata[1]:.1f} pitches/inning<extra></extra>'
+            ),
+            row=1, col=1
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=year_data['Date'],
+                y=year_data['ACWR'],
+                mode='lines+markers',
+                name=f'{year}',
+                line=dict(color=colors.get(str(year), '#757575'), width=2),
+                showlegend=False,
+                hovertemplate='%{x|%b %d, %Y}<br>ACWR: %{y:.2f}<extra></extra>'
+            ),
+            row=2, col=1
+        )
+    
+    flagged = df_workload[df_workload['Flags'] > 0]
+    flag_names = [', '.join(np.array(list(WORKLOAD_FLAGS))[mask]) for mask in flagged[list(WORKLOAD_FLAGS)].to_numpy()]
+    fig.add_trace(
+        go.Scatter(
+            x=flagged['Date'],
+            y=flagged['Pit'] + 6,
+            mode='markers',
+            name='Flagged start',
+            marker=dict(symbol='triangle-down', size=9, color='#c62828'),
+            text=flag_names,
+            hovertemplate='%{x|%b %d, %Y}<br>%{text}<extra></extra>'
+        ),
+        row=1, col=1
+    )
+    fig.add_hline(y=ACWR_HIGH, line_dash="dash", line_color="#c62828",
+                  annotation_text=f"Load spike ({ACWR_HIGH})", row=2, col=1)
+    fig.add_hline(y=1, line_dash="dot", line_color="gray", row=2, col=1)
+    fig.update_layout(
+        title="⚾ Pitch Counts and Workload Ratio",
+        height=650,
+        bargap=0,
+        legend=dict(orientation="h", yanchor="bottom", y=1.04, xanchor="right", x=1),
+        font=dict(family="Roboto, sans-serif", size=12),
+        title_font=dict(family="Oswald, sans-serif", size=20, color="#1565c0"),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    fig.update_yaxes(title_text="Pitches", row=1, col=1)
+    fig.update_yaxes(title_text="ACWR", row=2, col=1)
+    fig.update_xaxes(title_text="Date", row=2, col=1)
+    plotly_chart(fig)
+    
+    df_workload_summary = workload_summary(df_workload)
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        st.markdown("**Flagged starts**")
+        if flagged.empty:
+            st.caption("No start crossed a workload threshold.")
+        else:
+            flagged_display = flagged[['Date', 'Pit', 'Days Rest', 'Acute Load', 'Chronic Load', 'ACWR',
+                                       'Pitches/Inning']].assign(Flags=flag_names)
+            st.dataframe(flagged_display.style.format({
+                'Date': '{:%b %d, %Y}',
+                'Days Rest': '{:.0f}',
+                'Acute Load': '{:.0f}',
+                'Chronic Load': '{:.1f}',
+                'ACWR': '{:.2f}',
+                'Pitches/Inning': '{:.1f}'
+            }, na_rep='-'), width="stretch")
+    with col2:
+        st.markdown("**Workload by season**")
+        st.dataframe(df_workload_summary.style.format({
+            'Avg Days Rest': '{:.1f}',
+            'Avg Pitches': '{:.1f}',
+            'Avg ACWR': '{:.2f}',
+            'Avg Pitches/Inning': '{:.1f}'
+        }), width="stretch")
+    export_tables['Workload'] = df_workload
+    export_tables['Workload by Season'] = df_workload_summary
+    
+    st.markdown(f"""
+    **What this shows:**
+    - **Acute load** is the pitches thrown in the 7 days before a start; **chronic load** is the weekly average over the 28 days before it
+    - **ACWR** (acute:chronic workload ratio) compares the two: near 1 the recent load matches what the arm is used to, and above {ACWR_HIGH} it has jumped
+    - The ratio is left blank until there is a start at least three weeks back, so season openers and returns from the injured list don't read as spikes
+    - Red markers are starts that crossed a threshold: {'; '.join(f"{name.lower()} ({rule})" for name, rule in WORKLOAD_FLAGS.items())}
+    """)
 
 # ========== PITCH USAGE ANALYSIS PAGE ==========
 elif page == "Pitch Usage Analysis":
@@ -644,7 +1284,7 @@ elif page == "Pitch Usage Analysis":
         yaxis=dict(range=[0, max_pitch_pct * 1.1])  # Add padding for text visibility
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig)
     
     st.markdown("""
     **What this shows:** This chart displays how often Sandy used each pitch type in each season. 
@@ -657,58 +1297,72 @@ elif page == "Pitch Usage Analysis":
     # Individual pitch trends
     st.subheader("🎯 Individual Pitch Type Trends")
     
-    selected_pitch = st.selectbox(
-        "Select a pitch type to analyze:",
-        pitch_types,
-        format_func=lambda x: pitch_names[x]
-    )
-    
-    # Fix: Convert Year to int and create proper bar chart
-    years_int = df_season['Year'].astype(int).tolist()
-    pitch_values = df_season[selected_pitch].tolist()
-    
-    fig = go.Figure()
-    pitch_values_100 = [val * 100 for val in pitch_values]
-    max_pitch_val = max(pitch_values_100)
-    
-    fig.add_trace(
-        go.Bar(
-            x=years_int,
-            y=pitch_values_100,
-            marker_color=[colors[str(y)] for y in years_int],
-            text=[f"{val:.1f}%" for val in pitch_values_100],
-            textposition='outside',
-            hovertemplate=f'{pitch_names[selected_pitch]}: %{{y:.1f}}%<extra></extra>'
+    if browser_charts:
+        from season_explorer import season_bundle, metric_view, season_explorer
+        season_explorer(
+            season_bundle(df_season, pitch_types, colors),
+            metric_view(pitch_names, {pitch: 'pct' for pitch in pitch_types}, "Select a pitch type to analyze:",
+                        "⚾ {name} Usage by Season", "{name} Usage (%)", compare=(2022, 2025)),
+            key='pitch_trends'
         )
-    )
+    else:
+        # Pitch trend chart and usage cards; changing the pitch reruns only this fragment
+        @st.fragment
+        def pitch_trend_chart():
+            selected_pitch = st.selectbox(
+                "Select a pitch type to analyze:",
+                pitch_types,
+                format_func=lambda x: pitch_names[x]
+            )
     
-    fig.update_layout(
-        title=f"⚾ {pitch_names[selected_pitch]} Usage by Season",
-        xaxis_title="Season",
-        yaxis_title=f"{pitch_names[selected_pitch]} Usage (%)",
-        showlegend=False, 
-        height=450,
-        font=dict(family="Roboto, sans-serif", size=12),
-        title_font=dict(family="Oswald, sans-serif", size=20, color="#1565c0"),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        xaxis=dict(tickmode='linear', tick0=2021, dtick=1),
-        yaxis=dict(range=[0, max_pitch_val * 1.15])  # Add padding for text - FIXED: use yaxis in update_layout
-    )
-    st.plotly_chart(fig, use_container_width=True)
+            # Fix: Convert Year to int and create proper bar chart
+            years_int = df_season['Year'].astype(int).tolist()
+            pitch_values = df_season[selected_pitch].tolist()
     
-    # Calculate changes
-    pitch_2022 = df_season[df_season['Year'] == 2022][selected_pitch].values[0]
-    pitch_2025 = df_season[df_season['Year'] == 2025][selected_pitch].values[0]
-    change = (pitch_2025 - pitch_2022) * 100
+            fig = go.Figure()
+            pitch_values_100 = [val * 100 for val in pitch_values]
+            max_pitch_val = max(pitch_values_100)
     
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("2022 Usage", f"{pitch_2022*100:.1f}%")
-    with col2:
-        st.metric("2025 Usage", f"{pitch_2025*100:.1f}%")
-    with col3:
-        st.metric("Change", f"{change:+.1f}%", delta=f"{change:+.1f} percentage points")
+            fig.add_trace(
+                go.Bar(
+                    x=years_int,
+                    y=pitch_values_100,
+                    marker_color=[colors[str(y)] for y in years_int],
+                    text=[f"{val:.1f}%" for val in pitch_values_100],
+                    textposition='outside',
+                    hovertemplate=f'{pitch_names[selected_pitch]}: %{{y:.1f}}%<extra></extra>'
+                )
+            )
+    
+            fig.update_layout(
+                title=f"⚾ {pitch_names[selected_pitch]} Usage by Season",
+                xaxis_title="Season",
+                yaxis_title=f"{pitch_names[selected_pitch]} Usage (%)",
+                showlegend=False, 
+                height=450,
+                font=dict(family="Roboto, sans-serif", size=12),
+                title_font=dict(family="Oswald, sans-serif", size=20, color="#1565c0"),
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                xaxis=dict(tickmode='linear', tick0=2021, dtick=1),
+                yaxis=dict(range=[0, max_pitch_val * 1.15])  # Add padding for text - FIXED: use yaxis in update_layout
+            )
+            plotly_chart(fig)
+    
+            # Calculate changes
+            pitch_2022 = df_season[df_season['Year'] == 2022][selected_pitch].values[0]
+            pitch_2025 = df_season[df_season['Year'] == 2025][selected_pitch].values[0]
+            change = (pitch_2025 - pitch_2022) * 100
+    
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("2022 Usage", f"{pitch_2022*100:.1f}%")
+            with col2:
+                st.metric("2025 Usage", f"{pitch_2025*100:.1f}%")
+            with col3:
+                st.metric("Change", f"{change:+.1f}%", delta=f"{change:+.1f} percentage points")
+        
+        pitch_trend_chart()
     
     st.markdown("---")
     
@@ -722,8 +1376,9 @@ elif page == "Pitch Usage Analysis":
     pitch_display.columns = ['Year'] + [pitch_names[p] for p in pitch_types]
     st.dataframe(
         pitch_display.style.format({pitch_names[p]: '{:.1f}%' for p in pitch_types}),
-        use_container_width=True
+        width="stretch"
     )
+    export_tables['Pitch Usage'] = pitch_display
     
     st.markdown("---")
     
@@ -789,74 +1444,107 @@ elif page == "Detailed Statistics":
         'GB': 'Ground Balls',
         'FB': 'Fly Balls',
         'LD': 'Line Drives',
-        'PU': 'Pop-ups'
+        'PU': 'Pop-ups',
+        'GB/9': 'Ground Balls per 9 Innings',
+        'FB/9': 'Fly Balls per 9 Innings',
+        'LD/9': 'Line Drives per 9 Innings',
+        'PU/9': 'Pop-ups per 9 Innings'
     }
     
     metric_options = {
         'Pitching Stats': ['ERA', 'FIP', 'SO', 'BB', 'HR', 'H', 'IP'],
         'Advanced Stats': ['BAbip', 'GmSc', 'WPA', 'RE24'],
         'Pitch Count Stats': ['Pit', 'Str', 'StL', 'StS'],
-        'Batted Ball Stats': ['GB', 'FB', 'LD', 'PU']
+        'Batted Ball Stats': ['GB', 'FB', 'LD', 'PU', 'GB/9', 'FB/9', 'LD/9', 'PU/9']
     }
     
-    category = st.selectbox("Select category:", list(metric_options.keys()))
-    selected_metrics = st.multiselect("Select metrics to display:", metric_options[category], 
-                                      default=metric_options[category][:3])
-    
-    if selected_metrics:
-        # Use full names for subplot titles
-        subplot_titles = [metric_full_names.get(m, m) for m in selected_metrics]
-        
-        fig = make_subplots(
-            rows=len(selected_metrics),
-            cols=1,
-            subplot_titles=subplot_titles,
-            vertical_spacing=0.1
+    if browser_charts:
+        from season_explorer import season_bundle, metric_group_view, season_explorer
+        all_metrics = [metric for group in metric_options.values() for metric in group]
+        detail_formats = {metric: '.2f' for metric in ['ERA', 'FIP', 'BAbip']}
+        detail_formats.update({metric: 'int' for metric in ['Pit', 'Str', 'GmSc', 'GB', 'LD', 'FB', 'PU',
+                                                            'StL', 'HR', 'SO', 'BB', 'H']})
+        export_tables['Season Metrics'] = df_season[['Year'] + all_metrics]
+        season_explorer(
+            season_bundle(df_season, all_metrics, colors),
+            metric_group_view(metric_options, metric_full_names, detail_formats, "Select category:",
+                              "Select metrics to display:", "⚾ {group} Comparison Across Seasons"),
+            key='detailed_metrics'
         )
+    else:
+        # Metric grid; changing the category or metrics reruns only this fragment
+        @st.fragment
+        def metric_grid():
+            category = st.selectbox("Select category:", list(metric_options.keys()))
+            selected_metrics = st.multiselect("Select metrics to display:", metric_options[category], 
+                                              default=metric_options[category][:3])
+    
+            if selected_metrics:
+                # The sidebar download is built on full reruns only, so the selection gets its own button
+                selected_table = df_season[['Year'] + selected_metrics]
+                selected_format = st.session_state['export_format']
+                st.download_button(
+                    f"Download selected metrics ({selected_format})",
+                    data=lambda: export_file(selected_table, selected_format),
+                    file_name=f"sandy_alcantara_selected_metrics.{EXPORT_FORMATS[selected_format]['extension']}",
+                    mime=EXPORT_FORMATS[selected_format]['mime']
+                )
         
-        for i, metric in enumerate(selected_metrics, 1):
-            years_int = df_season['Year'].astype(int).tolist()
-            metric_vals = df_season[metric].tolist()
-            max_metric_val = max(metric_vals)
+                # Use full names for subplot titles
+                subplot_titles = [metric_full_names.get(m, m) for m in selected_metrics]
+        
+                fig = make_subplots(
+                    rows=len(selected_metrics),
+                    cols=1,
+                    subplot_titles=subplot_titles,
+                    vertical_spacing=0.1
+                )
+        
+                for i, metric in enumerate(selected_metrics, 1):
+                    years_int = df_season['Year'].astype(int).tolist()
+                    metric_vals = df_season[metric].tolist()
+                    max_metric_val = max(metric_vals)
             
-            # Format text based on metric type
-            if metric in ['ERA', 'FIP', 'BAbip']:
-                text_format = [f"{val:.2f}" for val in metric_vals]
-            elif metric in ['Pit', 'Str', 'GmSc', 'GB', 'LD', 'FB', 'PU', 'StL', 'HR', 'SO', 'BB', 'H']:
-                text_format = [f"{int(val)}" for val in metric_vals]
-            else:
-                text_format = [f"{val:.1f}" for val in metric_vals]
+                    # Format text based on metric type
+                    if metric in ['ERA', 'FIP', 'BAbip']:
+                        text_format = [f"{val:.2f}" for val in metric_vals]
+                    elif metric in ['Pit', 'Str', 'GmSc', 'GB', 'LD', 'FB', 'PU', 'StL', 'HR', 'SO', 'BB', 'H']:
+                        text_format = [f"{int(val)}" for val in metric_vals]
+                    else:
+                        text_format = [f"{val:.1f}" for val in metric_vals]
             
-            fig.add_trace(
-                go.Bar(
-                    x=years_int,
-                    y=metric_vals,
-                    name=metric,
-                    marker_color=[colors[str(y)] for y in years_int],
+                    fig.add_trace(
+                        go.Bar(
+                            x=years_int,
+                            y=metric_vals,
+                            name=metric,
+                            marker_color=[colors[str(y)] for y in years_int],
+                            showlegend=False,
+                            text=text_format,
+                            textposition='outside'
+                        ),
+                        row=i, col=1
+                    )
+                    fig.update_xaxes(title_text="Season", row=i, col=1, tickmode='linear', tick0=2021, dtick=1)
+                    fig.update_yaxes(
+                        title_text=metric_full_names.get(metric, metric), 
+                        row=i, col=1,
+                        range=[0, max_metric_val * 1.15]  # Add padding to prevent text cutoff
+                    )
+        
+                fig.update_layout(
+                    title=f"⚾ {category} Comparison Across Seasons",
+                    height=300 * len(selected_metrics),
                     showlegend=False,
-                    text=text_format,
-                    textposition='outside'
-                ),
-                row=i, col=1
-            )
-            fig.update_xaxes(title_text="Season", row=i, col=1, tickmode='linear', tick0=2021, dtick=1)
-            fig.update_yaxes(
-                title_text=metric_full_names.get(metric, metric), 
-                row=i, col=1,
-                range=[0, max_metric_val * 1.15]  # Add padding to prevent text cutoff
-            )
+                    font=dict(family="Roboto, sans-serif", size=12),
+                    title_font=dict(family="Oswald, sans-serif", size=20, color="#1565c0"),
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)'
+                )
         
-        fig.update_layout(
-            title=f"⚾ {category} Comparison Across Seasons",
-            height=300 * len(selected_metrics),
-            showlegend=False,
-            font=dict(family="Roboto, sans-serif", size=12),
-            title_font=dict(family="Oswald, sans-serif", size=20, color="#1565c0"),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
+                plotly_chart(fig)
         
-        st.plotly_chart(fig, use_container_width=True)
+        metric_grid()
     
     st.markdown("---")
     
@@ -867,12 +1555,13 @@ elif page == "Detailed Statistics":
     """)
     
     # Calculate average game score by year
-    avg_gmsc = df_data.groupby('Year')['GmSc'].mean().reset_index()
+    avg_gmsc = df_window.groupby('Year')['GmSc'].mean().reset_index()
     avg_gmsc.columns = ['Year', 'Average Game Score']
     
     # Convert Year to int and fix chart
     avg_gmsc['Year'] = avg_gmsc['Year'].astype(int)
-    max_score = avg_gmsc['Average Game Score'].max()
+    export_tables['Average Game Score'] = avg_gmsc
+    max_score = max(avg_gmsc['Average Game Score'].max(), df_intervals['GmSc High'].max())
     
     fig = go.Figure()
     fig.add_trace(
@@ -882,6 +1571,7 @@ elif page == "Detailed Statistics":
             marker_color=[colors[str(y)] for y in avg_gmsc['Year']],
             text=[f"{val:.1f}" for val in avg_gmsc['Average Game Score']],
             textposition='outside',
+            error_y=error_bars(df_intervals, 'GmSc', avg_gmsc['Year'], avg_gmsc['Average Game Score']),
             hovertemplate='Year: %{x}<br>Average Game Score: %{y:.1f}<extra></extra>'
         )
     )
@@ -902,7 +1592,7 @@ elif page == "Detailed Statistics":
     )
     fig.add_hline(y=50, line_dash="dash", line_color="gray", 
                   annotation_text="Good Start Threshold (50)")
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig)
     
     st.markdown("""
     <div style='font-family: "Roboto", sans-serif; font-size: 0.9rem; color: #757575; font-style: italic; padding: 0.5rem 0;'>
@@ -963,7 +1653,7 @@ elif page == "Detailed Statistics":
         xaxis=dict(tickmode='linear', tick0=2021, dtick=1)
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig)
     
     st.markdown("""
     **What this shows:**
@@ -972,6 +1662,65 @@ elif page == "Detailed Statistics":
     - **Line Drives (LD)**: Usually result in hits, want to minimize these
     - **Pop-ups (PU)**: Almost always outs, very beneficial
     """)
+    
+    st.markdown("---")
+    
+    # Exit context from the parsed Exited game state
+    st.subheader("🚪 How Starts Ended")
+    
+    df_exit_context = exit_context(df_data)
+    st.dataframe(df_exit_context.style.format({
+        'Average Exit Inning': '{:.1f}',
+        'Pulled Mid-Inning (%)': '{:.1f}%',
+        'Left With Runners On (%)': '{:.1f}%',
+        'Left Trailing (%)': '{:.1f}%'
+    }), width="stretch")
+    export_tables['Exit Context'] = df_exit_context
+    
+    st.markdown("""
+    **What this shows:** The game state when Sandy left each start. Being pulled in the middle of an inning 
+    or with runners on base usually means he ran out of stamina or effectiveness before the inning was over.
+    """)
+    
+    st.markdown("---")
+    
+    # Similar-start search
+    st.subheader("🔎 Find Similar Starts")
+    st.markdown("""
+    Pick any start to find the starts across all seasons with the most similar game line 
+    (innings, hits, earned runs, walks, strikeouts, home runs, pitches, swinging strikes, batted balls and Game Score).
+    """)
+    
+    from similar_starts import SIMILARITY_FEATURES, StartIndex
+    start_index = load_start_index(df_data)
+    starts = start_index.starts
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        selected_start = st.selectbox(
+            "Select a start:",
+            starts.index[::-1],
+            format_func=lambda i: (f"{starts.at[i, 'Date']:%Y-%m-%d} vs {starts.at[i, 'Opp']} - "
+                                   f"{starts.at[i, 'IP']:.1f} IP, {starts.at[i, 'ER']} ER, "
+                                   f"{starts.at[i, 'SO']} SO, Game Score {starts.at[i, 'GmSc']}")
+        )
+    with col2:
+        n_similar = st.slider("Number of matches:", min_value=1, max_value=15, value=5)
+    
+    similar = start_index.similar_starts(selected_start, k=n_similar)
+    similar['Date'] = similar['Date'].dt.strftime('%Y-%m-%d')
+    export_tables['Similar Starts'] = similar
+    st.dataframe(
+        similar[['Distance', 'Date', 'Opp', 'IP'] + [f for f in SIMILARITY_FEATURES if f != 'Outs']].style.format({
+            'Distance': '{:.2f}',
+            'IP': '{:.1f}'
+        }),
+        width="stretch"
+    )
+    st.markdown("""
+    **Distance** is measured on standardized stats (each stat rescaled so that one unit is one standard deviation); 
+    lower means more similar.
+    """)
 
 # ========== ANALYSIS & RECOMMENDATIONS PAGE ==========
 elif page == "Analysis & Recommendations":
@@ -1012,15 +1761,15 @@ elif page == "Analysis & Recommendations":
             'impact': 'Significant - Fielding-independent metrics also show decline, indicating the problem is with pitching, not defense'
         },
         'Strikeouts per 9': {
-            '2022': (stats_2022['SO'] / stats_2022['IP']) * 9,
-            '2025': (stats_2025['SO'] / stats_2025['IP']) * 9,
-            'change': ((stats_2025['SO'] / stats_2025['IP']) * 9) - ((stats_2022['SO'] / stats_2022['IP']) * 9),
+            '2022': stats_2022['K/9'],
+            '2025': stats_2025['K/9'],
+            'change': stats_2025['K/9'] - stats_2022['K/9'],
             'impact': 'Moderate - Strikeout rate down 10%, reducing ability to escape jams'
         },
         'Walk Rate': {
-            '2022': (stats_2022['BB'] / stats_2022['IP']) * 9,
-            '2025': (stats_2025['BB'] / stats_2025['IP']) * 9,
-            'change': ((stats_2025['BB'] / stats_2025['IP']) * 9) - ((stats_2022['BB'] / stats_2022['IP']) * 9),
+            '2022': stats_2022['BB/9'],
+            '2025': stats_2025['BB/9'],
+            'change': stats_2025['BB/9'] - stats_2022['BB/9'],
             'impact': 'Critical - Walk rate increased 45%, putting more runners on base and increasing pitch counts'
         },
         'Home Runs': {
@@ -1031,9 +1780,29 @@ elif page == "Analysis & Recommendations":
         }
     }
     
+    # Bootstrap intervals for the rate stats, so real changes can be told apart from noise
+    interval_stats = {'ERA': 'ERA', 'Strikeouts per 9': 'K/9', 'Walk Rate': 'BB/9'}
+    intervals_by_year = df_intervals.set_index('Year')
+    
     for stat, data in declines.items():
-        with st.expander(f"**{stat}**: {data['2022']:.2f} → {data['2025']:.2f} (Change: {data['change']:+.2f})"):
+        change = f"{data['change']:+.2f}" if pd.notna(data['change']) else "—"
+        with st.expander(f"**{stat}**: {card_stat(data['2022'])} → {card_stat(data['2025'])} (Change: {change})"):
             st.write(f"**Impact:** {data['impact']}")
+            if stat in interval_stats:
+                low_2022, high_2022 = intervals_by_year.loc[2022, [f'{interval_stats[stat]} Low', f'{interval_stats[stat]} High']]
+                low_2025, high_2025 = intervals_by_year.loc[2025, [f'{interval_stats[stat]} Low', f'{interval_stats[stat]} High']]
+                # A season with no starts in the game window has no range to compare
+                if pd.notna([low_2022, high_2022, low_2025, high_2025]).all():
+                    overlap = low_2025 <= high_2022 and low_2022 <= high_2025
+                    st.write(
+                        f"**95% range (bootstrap over starts):** 2022: {low_2022:.2f}–{high_2022:.2f}, "
+                        f"2025: {low_2025:.2f}–{high_2025:.2f} — "
+                        + ("the ranges overlap, so part of this change could be start-to-start noise."
+                           if overlap else "the ranges don't overlap, so this change is larger than start-to-start noise.")
+                    )
+            if df_percentiles is not None and interval_stats.get(stat) in df_percentiles.columns:
+                pct = df_percentiles.set_index('Year')[interval_stats[stat]]
+                st.write(f"**League percentile (full season):** 2022: {percentile_label(pct[2022])}, 2025: {percentile_label(pct[2025])}")
     
     st.markdown("---")
     
@@ -1094,6 +1863,75 @@ elif page == "Analysis & Recommendations":
     
     st.markdown("---")
     
+    # Root causes measured: regression of each start's result on its game line
+    st.subheader("📐 Measured Drivers")
+    
+    target_names = {'GmSc': 'Game Score', 'ER/Out': 'Earned runs per out'}
+    driver_names = {'BB': 'Walks', 'SO': 'Strikeouts', 'HR': 'Home runs', 'LD%': 'Line-drive %',
+                    'StS': 'Swinging strikes', 'Pit': 'Pitches'}
+    from drivers import DRIVERS, TARGETS, ROLLING_STARTS, driver_fits, driver_effects
+    df_driver_seasons, df_driver_rolling, df_driver_effects = load_driver_fits(df_data)
+    target_label = st.selectbox("Explain:", [target_names[target] for target in TARGETS], key='driver_target')
+    driver_target = next(target for target in TARGETS if target_names[target] == target_label)
+    rolling = df_driver_rolling[df_driver_rolling['Target'] == driver_target]
+    
+    fig = make_subplots(rows=2, cols=3, subplot_titles=[driver_names[d] for d in DRIVERS],
+                        vertical_spacing=0.15, horizontal_spacing=0.08)
+    for i, driver in enumerate(DRIVERS):
+        row, col = i // 3 + 1, i % 3 + 1
+        for year in rolling['Year'].unique():
+            year_data = rolling[rolling['Year'] == year]
+            fig.add_trace(
+                go.Scatter(
+                    x=year_data['Window End'],
+                    y=year_data[driver],
+                    mode='lines',
+                    name=f'{year}',
+                    legendgroup=f'{year}',
+                    showlegend=i == 0,
+                    line=dict(color=colors.get(str(year), '#757575'), width=2),
+                    hovertemplate=f'{driver_names[driver]}<br>%{{x|%b %d, %Y}}: %{{y:.3g}}<extra></extra>'
+                ),
+                row=row, col=col
+            )
+        fig.add_hline(y=0, line_color="gray", row=row, col=col)
+    fig.update_layout(
+        title=f"⚾ {target_names[driver_target]} per Unit of Each Driver (Rolling {ROLLING_STARTS} Starts)",
+        height=600,
+        legend=dict(orientation="h", yanchor="bottom", y=1.04, xanchor="right", x=1),
+        font=dict(family="Roboto, sans-serif", size=12),
+        title_font=dict(family="Oswald, sans-serif", size=20, color="#1565c0"),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    plotly_chart(fig)
+    
+    peak_year, latest_year = peak_and_latest(df_season_totals)
+    effects = df_driver_effects[df_driver_effects['Target'] == driver_target].set_index(['Year', 'Driver'])
+    top = effects.loc[latest_year].sort_values('Rank').head(3)
+    st.markdown(f"**Biggest drivers of {target_names[driver_target].lower()} in {latest_year}** "
+                f"(effect of a typical start-to-start swing in each, vs. {peak_year}):")
+    st.markdown("\n".join(
+        f"- **{driver_names[driver]}** (±{row['Driver SD']:.2g} per start): {row['Effect per SD']:+.3g}, "
+        f"was {effects.loc[(peak_year, driver), 'Effect per SD']:+.3g} in {peak_year}"
+        for driver, row in top.iterrows()
+    ))
+    
+    seasons = df_driver_seasons[df_driver_seasons['Target'] == driver_target].drop(columns='Target')
+    st.dataframe(seasons.style.format({'R²': '{:.2f}', **{d: '{:.3g}' for d in DRIVERS}}), width="stretch")
+    export_tables['Driver Coefficients'] = df_driver_seasons
+    export_tables['Rolling Driver Coefficients'] = df_driver_rolling
+    export_tables['Driver Effects'] = df_driver_effects
+    
+    st.markdown(f"""
+    **What this shows:**
+    - Each start's {target_names[driver_target].lower()} is fit by least squares on its walks, strikeouts, home runs, line-drive share of balls in play, swinging strikes and pitch count, separately for each season and for every run of {ROLLING_STARTS} consecutive starts
+    - A coefficient is the change for one more of that driver with the others held fixed; lines drifting apart show which drivers now matter more than they did
+    - **R²** is the share of the start-to-start variation the drivers explain together
+    """)
+    
+    st.markdown("---")
+    
     st.subheader("🚀 Recommendations for Improvement")
     
     st.markdown("""
@@ -1163,6 +2001,66 @@ elif page == "Analysis & Recommendations":
     The focus should be on gradual improvement and health, not immediate return to Cy Young form.
     """)
     
+    st.markdown("""
+    #### 🎲 Simulated 2026 Season
+    
+    The projection below simulates 20,000 seasons by drawing each start from Sandy's actual game log: 
+    either from his 2025 post-surgery starts or from his 2021-2023 pre-injury starts. Move the slider to 
+    choose how much of 2026 you expect to look like 2025.
+    """)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        recovery_pct = st.slider("Share of starts that look like 2025 (%):", min_value=0, max_value=100,
+                                 value=50, step=5)
+    with col2:
+        projected_starts = st.slider("Number of starts:", min_value=10, max_value=34, value=30)
+    
+    from projection import simulate_season, projection_rates, projection_bands
+    projected = load_season_projection(df_data, df_season_totals, projected_starts, recovery_pct / 100)
+    bands = projection_bands(projected)
+    export_tables['Projected 2026 Ranges'] = bands.reset_index(names='Stat')
+    
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        st.dataframe(bands.style.format('{:.2f}'), width="stretch")
+        st.markdown("""
+        <div style='font-family: "Roboto", sans-serif; font-size: 0.9rem; color: #757575; font-style: italic;'>
+            80% of simulated seasons fall between the 10th and 90th percentile columns.
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        fig = go.Figure()
+        fig.add_trace(
+            go.Histogram(
+                x=projected['ERA'],
+                nbinsx=60,
+                marker_color='#1565c0',
+                opacity=0.8,
+                hovertemplate='ERA: %{x}<br>Simulated seasons: %{y}<extra></extra>'
+            )
+        )
+        for year in [2022, 2025]:
+            fig.add_vline(
+                x=df_season[df_season['Year'] == year]['ERA'].values[0],
+                line_dash="dash",
+                line_color=colors[str(year)],
+                annotation_text=f"{year} ERA"
+            )
+        fig.update_layout(
+            title="⚾ Projected 2026 ERA (Simulated Seasons)",
+            xaxis_title="Season ERA",
+            yaxis_title="Simulated Seasons",
+            showlegend=False,
+            height=400,
+            font=dict(family="Roboto, sans-serif", size=12),
+            title_font=dict(family="Oswald, sans-serif", size=18, color="#1565c0"),
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)'
+        )
+        plotly_chart(fig)
+    
     st.markdown("---")
     
     st.subheader("✅ Action Items Summary")
@@ -1196,6 +2094,171 @@ elif page == "Analysis & Recommendations":
     being an effective pitcher, even if not immediately at his 2022 Cy Young level.
     """)
 
+# ========== CORRELATIONS PAGE ==========
+elif page == "Correlations":
+    st.header("🔗 Metric Correlations ⚾")
+    st.markdown("""
+    How the game-log stats move together from start to start. A correlation near +1 means two stats rise
+    and fall together, near -1 means one rises as the other falls, and near 0 means they're unrelated.
+    Click a cell of the heatmap to plot that pair start by start.
+    """)
+    
+    from correlations import ALL_SEASONS, correlation_matrices, strongest_pairs
+    corr_labels, corr_columns, corr_matrices = load_correlations(df_window)
+    season_label = st.selectbox("Season:", corr_labels)
+    matrix = corr_matrices[corr_labels.index(season_label)]
+    
+    # Invisible markers over the cells make them clickable (heatmaps themselves can't be selected)
+    fig = go.Figure()
+    fig.add_trace(
+        go.Heatmap(
+            z=matrix,
+            x=corr_columns,
+            y=corr_columns,
+            zmin=-1,
+            zmax=1,
+            colorscale='RdBu',
+            reversescale=True,
+            colorbar=dict(title='r'),
+            hoverinfo='skip'
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=np.tile(corr_columns, len(corr_columns)),
+            y=np.repeat(corr_columns, len(corr_columns)),
+            customdata=matrix.ravel(),
+            mode='markers',
+            marker=dict(symbol='square', size=14, color='rgba(0,0,0,0)'),
+            hovertemplate='%{y} vs %{x}<br>r = %{customdata:.2f}<extra></extra>',
+            showlegend=False
+        )
+    )
+    fig.update_layout(
+        title=f"⚾ Correlation Matrix ({season_label})",
+        height=850,
+        font=dict(family="Roboto, sans-serif", size=12),
+        title_font=dict(family="Oswald, sans-serif", size=20, color="#1565c0"),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis=dict(tickangle=-45, showgrid=False),
+        yaxis=dict(autorange='reversed', showgrid=False),
+        clickmode='event+select'
+    )
+    heatmap = plotly_chart(fig, on_select="rerun", selection_mode="points", key="correlation_heatmap")
+    
+    # A clicked cell sets the scatter's metric pickers, which start on the strongest pair
+    pairs = strongest_pairs(matrix, corr_columns)
+    if 'correlation_x' not in st.session_state:
+        st.session_state['correlation_x'], st.session_state['correlation_y'] = (
+            (pairs['Metric 1'].iloc[0], pairs['Metric 2'].iloc[0]) if len(pairs) else corr_columns[:2])
+    clicked = heatmap.selection.points if heatmap else []
+    if clicked and clicked[0]['x'] != clicked[0]['y']:
+        cell = (clicked[0]['x'], clicked[0]['y'])
+        if st.session_state.get('correlation_cell') != cell:
+            st.session_state['correlation_cell'] = cell
+            st.session_state['correlation_x'], st.session_state['correlation_y'] = cell
+    
+    st.subheader("🔍 Start-by-Start Scatter")
+    col1, col2 = st.columns(2)
+    with col1:
+        x_metric = st.selectbox("X axis:", corr_columns, key='correlation_x')
+    with col2:
+        y_metric = st.selectbox("Y axis:", corr_columns, key='correlation_y')
+    
+    scatter_games = df_window if season_label == ALL_SEASONS else df_window[df_window['Year'] == season_label]
+    r = matrix[corr_columns.index(y_metric), corr_columns.index(x_metric)]
+    fig = go.Figure()
+    for year, games in scatter_games.groupby('Year'):
+        fig.add_trace(
+            go.Scatter(
+                x=games[x_metric],
+                y=games[y_metric],
+                mode='markers',
+                name=f'{year}',
+                marker=dict(color=colors[str(year)], size=8, opacity=0.75),
+                text=games['Date'].dt.strftime('%b %d, %Y') + ' vs ' + games['Opp'],
+                hovertemplate=f'%{{text}}<br>{x_metric}: %{{x}}<br>{y_metric}: %{{y}}<extra></extra>'
+            )
+        )
+    fig.update_layout(
+        title=f"⚾ {y_metric} vs {x_metric} (r = {r:.2f})",
+        xaxis_title=x_metric,
+        yaxis_title=y_metric,
+        height=500,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        font=dict(family="Roboto, sans-serif", size=12),
+        title_font=dict(family="Oswald, sans-serif", size=20, color="#1565c0"),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    plotly_chart(fig)
+    
+    st.subheader("📊 Strongest Relationships")
+    st.dataframe(pairs.style.format({'Correlation': '{:+.2f}'}), width="stretch")
+    export_tables['Correlation Matrix'] = pd.DataFrame(matrix, index=corr_columns, columns=corr_columns).rename_axis('Metric').reset_index()
+    export_tables['Strongest Correlations'] = pairs
+    
+    st.markdown("""
+    **What this shows:** Many pairs are related by construction (batters faced and pitches, hits and runs), so
+    the more telling cells are the ones between groups, such as swinging strikes (StS) against Game Score, or
+    walks against win probability added (WPA). Correlation over a few dozen starts is noisy, and it doesn't
+    show which stat drives the other.
+    """)
+
+# ========== AD-HOC QUERY PAGE ==========
+elif page == "Ad-hoc Query":
+    st.header("🔍 Ad-hoc Query ⚾")
+    st.markdown("""
+    Ask questions the fixed pages don't answer with SQL. Three tables are available:
+    - **games** - one row per start (the game log, including the parsed Entered/Exited game states)
+    - **seasons** - the Season Totals sheet, one row per season
+    - **variables** - descriptions of each column
+    
+    Queries run in an embedded DuckDB engine. They can't read or write files, they stop after 10 seconds
+    and results are cut off at the row limit. Repeating a query returns the saved result.
+    """)
+    
+    from adhoc_query import ROW_LIMITS, DEFAULT_ROW_LIMIT, EXAMPLE_QUERY, query_tables, table_columns, run_query
+    
+    with st.expander("📋 Table columns"):
+        st.dataframe(load_table_columns(df_data, df_season_totals, df_vars), width="stretch")
+    
+    sql = st.text_area("SQL query:", value=EXAMPLE_QUERY, height=180)
+    row_limit = st.selectbox("Row limit:", ROW_LIMITS, index=ROW_LIMITS.index(DEFAULT_ROW_LIMIT))
+    
+    if sql.strip():
+        try:
+            result, truncated, elapsed = load_query_result(df_data, df_season_totals, df_vars, sql.strip(), row_limit)
+        except Exception as exc:
+            st.error(f"Query failed: {exc}")
+        else:
+            st.caption(f"{len(result):,} rows in {elapsed * 1000:.0f} ms")
+            if truncated:
+                st.warning(f"Only the first {row_limit:,} rows are shown. Raise the row limit or narrow the query.")
+            st.dataframe(result, width="stretch")
+            export_tables['Query Result'] = result
+
+# Fill in the sidebar download section now that the page has added its tables
+export_name = export_table_slot.selectbox("Table:", list(export_tables.keys()))
+export_df = export_tables[export_name]
+export_button_slot.download_button(
+    f"Download {export_format}",
+    # The file is written in chunks when the button is clicked, not on every rerun
+    data=lambda: export_file(export_df, export_format),
+    file_name=f"sandy_alcantara_{export_name.lower().replace(' ', '_')}.{EXPORT_FORMATS[export_format]['extension']}",
+    mime=EXPORT_FORMATS[export_format]['mime'],
+    width="stretch"
+)
+
+if payload_report:
+    with st.sidebar.expander("📦 Chart Payload Sizes"):
+        st.dataframe(pd.DataFrame(payload_report).style.format({
+            'JSON (KB)': '{:.1f}',
+            'Binary (KB)': '{:.1f}',
+            'Saved (%)': '{:.0f}%'
+        }), width="stretch")
+
 # Footer
 st.markdown("---")
 st.markdown("""
@@ -0,0 +1,137 @@
+"""Least-squares fits of Game Score and earned runs per out on game-line drivers.
+
+Each target is regressed on walks, strikeouts, home runs, line-drive share, swinging
+strikes and pitches, with an intercept, once per season and over every rolling window of
+starts. All fits share one pass. The cross products X'X and X'y of every start are
+accumulated into running sums, so any run of consecutive starts has its normal equations
+as the difference of two cumulative sums. Every season and window is then solved in a
+single batched call, however many windows or pitchers there are. A start missing a driver
+(e.g. no balls in play for line-drive share) or the target is left out of the fits.
+"""
+import numpy as np
+import pandas as pd
+
+DRIVERS = ['BB', 'SO', 'HR', 'LD%', 'StS', 'Pit']
+
+# Target -> (numerator, denominator) in the game log; None means the column itself
+TARGETS = {
+    'GmSc': ('GmSc', None),
+    'ER/Out': ('ER', 'Outs'),
+}
+
+ROLLING_STARTS = 20
+
+
+def driver_matrix(df_data):
+    """Drivers of each start as a float array, with LD% as line drives per ball in play"""
+    in_play = df_data[['GB', 'FB', 'LD', 'PU']].sum(axis=1).to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ld_share = np.where(in_play > 0, df_data['LD'].to_numpy(dtype=float) / in_play * 100, np.nan)
+    columns = {name: ld_share if name == 'LD%' else df_data[name].to_numpy(dtype=float) for name in DRIVERS}
+    return np.column_stack([columns[name] for name in DRIVERS])
+
+
+def target_values(df_data, target):
+    """Per-start values of a target in TARGETS (NaN where its denominator is 0)"""
+    num, den = TARGETS[target]
+    values = df_data[num].to_numpy(dtype=float)
+    if den is None:
+        return values
+    den = df_data[den].to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(den > 0, values / den, np.nan)
+
+
+def batched_fits(X, y, lo, hi):
+    """Least-squares fit of y on X (plus an intercept) over rows lo[i]:hi[i] for every i at once.
+
+    Returns (coefficients, starts, r2): coefficients is (n_fits, n_drivers) in the drivers' own
+    units. Rows with a NaN are skipped. A fit with no more starts than parameters, or whose
+    target doesn't vary, is NaN.
+    """
+    keep = ~(np.isnan(X).any(axis=1) | np.isnan(y))
+    # Centre and scale on the whole log so the normal equations stay well conditioned
+    mean = np.nanmean(X[keep], axis=0) if keep.any() else np.zeros(X.shape[1])
+    scale = np.nanstd(X[keep], axis=0) if keep.any() else np.ones(X.shape[1])
+    scale[~(scale > 0)] = 1
+    Z = np.where(keep[:, None], np.column_stack([np.ones(len(X)), (X - mean) / scale]), 0)
+    t = np.where(keep, y, 0)
+
+    def running(a):
+        return np.concatenate([np.zeros((1,) + a.shape[1:]), np.cumsum(a, axis=0)])
+
+    xtx = running(Z[:, :, None] * Z[:, None, :])
+    xty = running(Z * t[:, None])
+    sums = running(np.column_stack([keep, t, t * t]))
+
+    A, b = xtx[hi] - xtx[lo], xty[hi] - xty[lo]
+    n, sy, syy = (sums[hi] - sums[lo]).T
+    beta = np.einsum('kij,kj->ki', np.linalg.pinv(A, hermitian=True), b)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rss = syy - 2 * np.einsum('ki,ki->k', beta, b) + np.einsum('ki,kij,kj->k', beta, A, beta)
+        tss = syy - sy * sy / n
+        r2 = np.where((n > Z.shape[1]) & (tss > 0), 1 - rss / tss, np.nan)
+    coefficients = beta[:, 1:] / scale
+    coefficients[~(n > Z.shape[1]) | ~(tss > 0)] = np.nan
+    return coefficients, n.astype(int), r2
+
+
+def driver_fits(df_data, window=ROLLING_STARTS, by=()):
+    """Per-season and rolling-window driver coefficients for every target.
+
+    `by` lists the columns that identify one pitcher; windows never span two pitchers, but do
+    run across seasons so drift shows through the off-season. Returns (seasons, rolling): one
+    row per target and season, and one per target and window, labelled by the window's last start.
+    """
+    by = list(by)
+    log = df_data.sort_values(by + ['Date'], kind='stable').reset_index(drop=True)
+    X = driver_matrix(log)
+
+    season_keys = log.groupby(by + ['Year'], sort=False).ngroup().to_numpy()
+    season_lo = np.flatnonzero(np.r_[True, season_keys[1:] != season_keys[:-1]])
+    season_hi = np.r_[season_lo[1:], len(log)]
+
+    pitcher = log.groupby(by, sort=False).ngroup().to_numpy() if by else np.zeros(len(log), dtype=np.int64)
+    window_hi = np.arange(window, len(log) + 1)
+    window_lo = window_hi - window
+    same = pitcher[window_lo] == pitcher[window_hi - 1]
+    window_lo, window_hi = window_lo[same], window_hi[same]
+
+    lo = np.r_[season_lo, window_lo]
+    hi = np.r_[season_hi, window_hi]
+    labels = log.iloc[hi - 1][by + ['Year', 'Date']].reset_index(drop=True)
+    is_season = np.arange(len(lo)) < len(season_lo)
+
+    frames = []
+    for target in TARGETS:
+        coefficients, starts, r2 = batched_fits(X, target_values(log, target), lo, hi)
+        frames.append(labels.assign(**{'Target': target, 'Starts': starts, 'R²': r2}).join(
+            pd.DataFrame(coefficients, columns=DRIVERS)))
+    fits = pd.concat(frames, ignore_index=True)
+    is_season = np.tile(is_season, len(TARGETS))
+
+    seasons = fits[is_season].drop(columns='Date').reset_index(drop=True)
+    rolling = fits[~is_season].rename(columns={'Date': 'Window End'}).reset_index(drop=True)
+    order = ['Target'] + by
+    return (seasons[order + ['Year', 'Starts', 'R²'] + DRIVERS],
+            rolling[order + ['Window End', 'Year', 'Starts', 'R²'] + DRIVERS])
+
+
+def driver_effects(df_data, seasons, by=()):
+    """Each season's coefficients times that season's driver spread (one standard deviation), ranked.
+
+    The effect is how much the target moves when a driver swings by a typical start-to-start
+    amount, which makes walks, pitches and line-drive share comparable.
+    """
+    by = list(by)
+    spread = pd.DataFrame(driver_matrix(df_data), columns=DRIVERS, index=df_data.index).join(
+        df_data[by + ['Year']]).groupby(by + ['Year'])[DRIVERS].std()
+    long = seasons.melt(id_vars=['Target'] + by + ['Year'], value_vars=DRIVERS,
+                        var_name='Driver', value_name='Coefficient')
+    sd = spread.reset_index().melt(id_vars=by + ['Year'], var_name='Driver', value_name='Driver SD')
+    long = long.merge(sd, on=by + ['Year', 'Driver'], how='left')
+    long['Effect per SD'] = long['Coefficient'] * long['Driver SD']
+    long['Rank'] = long['Effect per SD'].abs().groupby([long[col] for col in ['Target'] + by + ['Year']]).rank(
+        ascending=False, method='first', na_option='bottom').astype(int)
+    return long.sort_values(['Target'] + by + ['Year', 'Rank'], ignore_index=True)
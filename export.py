@@ -0,0 +1,80 @@
+"""Chunked CSV, Parquet and Arrow export of the dashboard's tables.
+
+Frames are written a slice of rows at a time, so no format ever holds a second full copy
+of the table as one in-memory string or buffer. Parquet and Arrow chunks are converted
+straight from the DataFrame's column buffers into Arrow record batches.
+
+pyarrow is imported only when an export is written, so it stays out of the dashboard's
+startup import cost.
+"""
+import tempfile
+
+EXPORT_FORMATS = {
+    'CSV': {'extension': 'csv', 'mime': 'text/csv'},
+    'Parquet': {'extension': 'parquet', 'mime': 'application/vnd.apache.parquet'},
+    'Arrow': {'extension': 'arrow', 'mime': 'application/vnd.apache.arrow.stream'},
+}
+
+# Exports larger than this spill from memory to a temporary file on disk
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _export_frame(df):
+    """String column names and string-typed object columns, as Parquet and Arrow require"""
+    df = df.rename(columns=str)
+    object_cols = df.columns[df.dtypes == object]
+    return df.astype({col: 'string' for col in object_cols})
+
+
+def iter_csv_chunks(df, chunk_rows=10000):
+    """Yield the table as UTF-8 CSV bytes, header first, `chunk_rows` rows at a time"""
+    df = _export_frame(df)
+    for start in range(0, max(len(df), 1), chunk_rows):
+        yield df.iloc[start:start + chunk_rows].to_csv(index=False, header=start == 0).encode('utf-8')
+
+
+def iter_record_batches(df, chunk_rows=10000):
+    """Yield the table as Arrow record batches sharing one schema"""
+    import pyarrow as pa
+
+    df = _export_frame(df)
+    # Every column has a concrete dtype by now, so the first chunk fixes the schema
+    schema = pa.Schema.from_pandas(df.iloc[:chunk_rows], preserve_index=False)
+    for start in range(0, max(len(df), 1), chunk_rows):
+        # Arrow-backed string columns of concatenated frames come in several chunks, which
+        # only the table conversion accepts; each column is then joined into one array
+        chunk = pa.Table.from_pandas(df.iloc[start:start + chunk_rows], schema=schema, preserve_index=False)
+        yield pa.RecordBatch.from_arrays([column.combine_chunks() for column in chunk.columns], schema=chunk.schema)
+
+
+def write_export(df, fmt, sink, chunk_rows=10000):
+    """Write the table to a binary file-like `sink` in the given export format"""
+    if fmt == 'CSV':
+        for chunk in iter_csv_chunks(df, chunk_rows):
+            sink.write(chunk)
+        return
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    batches = iter_record_batches(df, chunk_rows)
+    first = next(batches)
+    if fmt == 'Parquet':
+        writer = pq.ParquetWriter(sink, first.schema)
+    elif fmt == 'Arrow':
+        writer = pa.ipc.new_stream(sink, first.schema)
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    with writer:
+        writer.write_batch(first)
+        for batch in batches:
+            writer.write_batch(batch)
+
+
+def export_file(df, fmt, chunk_rows=10000):
+    """Export the table to a rewound temporary file that spills to disk once it grows large"""
+    sink = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    write_export(df, fmt, sink, chunk_rows)
+    sink.seek(0)
+    return sink
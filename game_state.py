@@ -0,0 +1,65 @@
+"""Parser for the encoded base-out-inning-score strings in the `Entered`/`Exited` columns.
+
+The strings look like "1t --- 0 out tie" or "7b 12- 1 out d1":
+inning and half (t = top, b = bottom), base occupancy (first/second/third, "-" for empty,
+omitted once the inning has 3 outs), outs, and score state (tie, a<N> = ahead by N,
+d<N> = down by N). Rows that don't match the pattern are left as missing values.
+
+Some seasons (2025) hold the strings one column to the right, in the unnamed column after
+Entered/Exited, with numbers in the named column; `restore_game_state_strings` moves them back.
+"""
+import pandas as pd
+
+GAME_STATE_PATTERN = (
+    r'^\s*(?P<inning>\d+)(?P<half>[tb])\s+'
+    r'(?:(?P<bases>[1-][2-][3-])\s+)?'
+    r'(?P<outs>[0-3])\s+out\s+'
+    r'(?P<lead>tie|a|d)(?P<runs>\d*)\s*$'
+)
+
+# Base occupancy is stored as a bitmask: 1 = runner on first, 2 = second, 4 = third
+BASE_BITS = {'1': 1, '2': 2, '3': 4}
+
+# Game-state column -> the unnamed column after it, where some seasons put the strings
+GAME_STATE_COLUMNS = {'Entered': 'Unnamed: 55', 'Exited': 'Unnamed: 56'}
+
+
+def restore_game_state_strings(df_data):
+    """Copy game-state strings from the unnamed columns into Entered/Exited where those hold no string"""
+    df_data = df_data.copy()
+    for col, spill in GAME_STATE_COLUMNS.items():
+        if col in df_data and spill in df_data:
+            misplaced = ~df_data[col].map(lambda value: isinstance(value, str))
+            df_data[col] = df_data[col].astype(object).where(~misplaced, df_data[spill])
+    return df_data
+
+
+def parse_game_state(values, prefix):
+    """Expand a column of game-state strings into typed inning/half/bases/outs/score columns"""
+    parts = pd.Series(values).astype('string').str.extract(GAME_STATE_PATTERN)
+    parsed = parts['inning'].notna()
+
+    bases = parts['bases'].fillna('---')
+    base_mask = sum(
+        (bases.str[i] == marker).astype('uint8') * bit
+        for i, (marker, bit) in enumerate(BASE_BITS.items())
+    )
+
+    runs = pd.to_numeric(parts['runs'].replace('', '0'), errors='coerce')
+    sign = parts['lead'].map({'a': 1, 'd': -1, 'tie': 0})
+
+    return pd.DataFrame({
+        f'{prefix} Inning': pd.to_numeric(parts['inning']).astype('Int8'),
+        f'{prefix} Half': pd.Categorical(parts['half'], categories=['t', 'b']),
+        f'{prefix} Bases': base_mask.astype('UInt8').where(parsed),
+        f'{prefix} Outs': pd.to_numeric(parts['outs']).astype('Int8'),
+        f'{prefix} Score Diff': (sign * runs).astype('Int8'),
+    }, index=parts.index)
+
+
+def add_game_state_columns(df_data):
+    """Append the parsed `Entered`/`Exited` columns to the game log"""
+    return pd.concat(
+        [df_data] + [parse_game_state(df_data[col], col) for col in GAME_STATE_COLUMNS if col in df_data],
+        axis=1
+    )
@@ -0,0 +1,115 @@
+"""League percentiles for Sandy's season stats from a league-wide pitcher-season table.
+
+The league table has the same columns as the Season Totals sheet (one row per pitcher
+season). When it loads, every stat is sorted once into a single array keyed by
+(season, value), so percentiles for any number of Sandy's seasons come from two
+vectorized `searchsorted` calls per stat. Each lookup is O(log n), however many pitcher
+seasons the table grows to.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from rates import outs_from_ip, add_rate_stats
+
+LEAGUE_FILE = 'Data/league_pitcher_seasons.csv'
+LEAGUE_MIN_IP = 100
+
+# Stat -> True when a lower value is better (percentiles are reported as "better than X%")
+PERCENTILE_STATS = {
+    'ERA': True,
+    'FIP': True,
+    'K/9': False,
+    'BB/9': True,
+    'HR/9': True,
+    'K/BB': False,
+    'BAbip': True,
+}
+
+
+def read_league_table(path=LEAGUE_FILE):
+    """League pitcher seasons from CSV or Parquet, with outs and per-9 rates added (None if the file is missing)"""
+    if not os.path.exists(path):
+        return None
+    league = pd.read_parquet(path) if path.endswith('.parquet') else pd.read_csv(path)
+    league['Outs'] = outs_from_ip(league['IP'])
+    return add_rate_stats(league)
+
+
+class LeagueBaseline:
+    """Per-stat sorted (season, value) keys for percentile lookups against the league.
+
+    Values are replaced by their rank among the stat's distinct values, so the key
+    season_index * n_distinct + rank is an exact integer and one sorted array covers
+    every season.
+    """
+
+    def __init__(self, league, stats=PERCENTILE_STATS, min_ip=LEAGUE_MIN_IP):
+        league = league[league['Outs'] >= min_ip * 3]
+        self.years = np.unique(league['Year'].to_numpy())
+        year_index = np.searchsorted(self.years, league['Year'].to_numpy())
+
+        self.stats = {}
+        for stat, lower_is_better in stats.items():
+            if stat not in league.columns:
+                continue
+            values = league[stat].to_numpy(dtype=float)
+            valid = ~np.isnan(values)
+            distinct = np.unique(values[valid])
+            keys = np.sort(year_index[valid] * len(distinct) + np.searchsorted(distinct, values[valid]))
+            # Where each season's keys start and end in the sorted array
+            bounds = np.searchsorted(keys, np.arange(len(self.years) + 1) * len(distinct))
+            self.stats[stat] = (distinct, keys, bounds, lower_is_better)
+
+    def __len__(self):
+        return len(self.years)
+
+    def percentiles(self, stat, years, values):
+        """Percent of the same season's league pitchers each value beats (NaN for seasons not in the table)"""
+        distinct, keys, bounds, lower_is_better = self.stats[stat]
+        years = np.asarray(years)
+        values = np.asarray(values, dtype=float)
+
+        year_index = np.searchsorted(self.years, years)
+        known = (year_index < len(self.years)) & (self.years[np.minimum(year_index, len(self.years) - 1)] == years)
+        year_index = np.minimum(year_index, len(self.years) - 1)
+        base = year_index * len(distinct)
+
+        # League values below, and at or below, each value within its own season
+        below = np.searchsorted(keys, base + np.searchsorted(distinct, values, side='left')) - bounds[year_index]
+        at_or_below = np.searchsorted(keys, base + np.searchsorted(distinct, values, side='right')) - bounds[year_index]
+        n = bounds[year_index + 1] - bounds[year_index]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct = (below + at_or_below) / 2 / n * 100
+        if lower_is_better:
+            pct = 100 - pct
+        return np.where(known & (n > 0) & ~np.isnan(values), pct, np.nan)
+
+    def season_percentiles(self, df_season):
+        """Percentile of each available stat for each season in `df_season`, one row per Year"""
+        out = {'Year': df_season['Year'].to_numpy()}
+        for stat in self.stats:
+            if stat in df_season.columns:
+                out[stat] = self.percentiles(stat, df_season['Year'], df_season[stat])
+        return pd.DataFrame(out)
+
+
+def percentile_label(pct):
+    """'87th' style ordinal for a percentile"""
+    if np.isnan(pct):
+        return 'n/a'
+    rank = int(round(pct))
+    suffix = 'th' if 10 <= rank % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(rank % 10, 'th')
+    return f'{rank}{suffix}'
+
+
+def percentile_badge(pct, stat):
+    """Small HTML pill showing a league percentile, colored from red (low) to green (high)"""
+    if np.isnan(pct):
+        return ''
+    color = '#2e7d32' if pct >= 67 else '#f57c00' if pct >= 33 else '#c62828'
+    return (f"<span style='display: inline-block; background-color: {color}; color: white; "
+            f"border-radius: 0.8rem; padding: 0.1rem 0.6rem; font-family: \"Roboto\", sans-serif; "
+            f"font-size: 0.8rem; margin-top: 0.3rem;'>{percentile_label(pct)} pct {stat}</span>")
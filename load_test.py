@@ -0,0 +1,232 @@
+"""Concurrent-session load test for the dashboard server.
+
+    python load_test.py --sessions 1 5 10 20 --rounds 3
+
+Starts the dashboard with `streamlit run` on a local port, then for each session count N
+opens N simulated browser sessions over the loopback websocket. Every session walks the
+same scripted navigation: switch to each page in turn, change the Overview metric and
+change the Detailed Statistics multiselect. Each step is a script rerun, timed from
+sending the rerun request until the server reports the script finished. Metric switching
+normally happens in the browser without a rerun; `--server-charts` turns that off in each
+session so the metric changes are measured as server reruns too.
+
+For each N it prints p50/p95/p99 rerun latency, reruns per second across all sessions
+and the server process's resident memory, so the session count where latency collapses
+can be read off directly.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+DASHBOARD = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dashboard.py')
+
+PAGE_LABEL = "Select a section:"
+METRIC_LABEL = "Select a metric to compare:"
+MULTISELECT_LABEL = "Select metrics to display:"
+BROWSER_CHARTS_LABEL = "Switch metrics in the browser"
+WIDGET_TYPES = ('radio', 'selectbox', 'multiselect', 'checkbox')
+
+LATENCY_PERCENTILES = [50, 95, 99]
+
+
+def free_port():
+    """An unused local TCP port"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port, script=DASHBOARD):
+    """Start `streamlit run` headless on `port` and return the process"""
+    return subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', script,
+         '--server.headless', 'true', '--server.port', str(port),
+         '--server.address', '127.0.0.1', '--browser.gatherUsageStats', 'false'],
+        cwd=os.path.dirname(script), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_for_server(port, timeout=60):
+    """Block until the server answers its health check"""
+    from urllib.request import urlopen
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.25)
+    raise TimeoutError(f"Server did not start on port {port} within {timeout}s")
+
+
+def rss_mb(pid):
+    """Resident set size of a process in MB"""
+    out = subprocess.run(['ps', '-o', 'rss=', '-p', str(pid)], capture_output=True, text=True).stdout
+    return int(out.strip()) / 1024 if out.strip() else float('nan')
+
+
+class Session:
+    """One simulated browser session: sends reruns with widget states, times each one"""
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.widgets = {}   # label -> (widget type, id, options, fragment id)
+        self.states = {}    # id -> WidgetState sent with every rerun
+        self.latencies = []
+        self.errors = []    # messages of exceptions the script raised
+
+    async def rerun(self, label=None):
+        """Request a rerun with the current widget states and wait for the script to finish.
+
+        When `label` names a widget inside a fragment, only that fragment is rerun, as the
+        browser does.
+        """
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        if label is not None and self.widgets[label][3]:
+            msg.rerun_script.fragment_id = self.widgets[label][3]
+        start = time.perf_counter()
+        await self.websocket.send(msg.SerializeToString())
+
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.websocket.recv())
+            kind = forward.WhichOneof('type')
+            if kind == 'delta' and forward.delta.WhichOneof('type') == 'new_element':
+                element = forward.delta.new_element
+                if element.WhichOneof('type') == 'exception':
+                    self.errors.append(element.exception.message)
+                self._learn_widget(element, forward.delta.fragment_id)
+            elif kind == 'script_finished':
+                self.latencies.append(time.perf_counter() - start)
+                return
+
+    def _learn_widget(self, element, fragment_id):
+        widget_type = element.WhichOneof('type')
+        if widget_type in WIDGET_TYPES:
+            widget = getattr(element, widget_type)
+            self.widgets[widget.label] = (widget_type, widget.id, list(getattr(widget, 'options', [])), fragment_id)
+
+    def options(self, label):
+        return self.widgets[label][2] if label in self.widgets else []
+
+    def set_widget(self, label, value):
+        """Set a widget's value (by label) for the next rerun"""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        widget_type, widget_id = self.widgets[label][:2]
+        state = WidgetState(id=widget_id)
+        if widget_type == 'multiselect':
+            state.string_array_value.data.extend(value)
+        elif widget_type == 'checkbox':
+            state.bool_value = value
+        else:
+            state.string_value = value
+        self.states[widget_id] = state
+
+    def forget(self, *labels):
+        """Drop page-specific widgets, as the browser does when they leave the page"""
+        for label in labels:
+            if label in self.widgets:
+                self.states.pop(self.widgets.pop(label)[1], None)
+
+
+async def run_session(url, rounds, seed, server_charts=False):
+    """Connect, load the default page, then walk the navigation script `rounds` times"""
+    import websockets
+
+    rng = np.random.default_rng(seed)
+    async with websockets.connect(url, subprotocols=['streamlit'], max_size=None) as websocket:
+        session = Session(websocket)
+        await session.rerun()
+        if server_charts:
+            session.set_widget(BROWSER_CHARTS_LABEL, False)
+
+        for _ in range(rounds):
+            for page in session.options(PAGE_LABEL):
+                session.set_widget(PAGE_LABEL, page)
+                await session.rerun()
+                if METRIC_LABEL in session.widgets:
+                    session.set_widget(METRIC_LABEL, str(rng.choice(session.options(METRIC_LABEL))))
+                    await session.rerun(METRIC_LABEL)
+                if MULTISELECT_LABEL in session.widgets:
+                    metrics = session.options(MULTISELECT_LABEL)
+                    picked = rng.choice(metrics, size=rng.integers(1, len(metrics) + 1), replace=False)
+                    session.set_widget(MULTISELECT_LABEL, [str(metric) for metric in picked])
+                    await session.rerun(MULTISELECT_LABEL)
+                session.forget(METRIC_LABEL, MULTISELECT_LABEL)
+        return session.latencies
+
+
+async def run_level(port, n_sessions, rounds, server_pid, server_charts=False):
+    """Run `n_sessions` concurrent sessions; return latencies, wall time and peak RSS"""
+    url = f'ws://127.0.0.1:{port}/_stcore/stream'
+    peak_rss = rss_mb(server_pid)
+
+    async def sample_rss():
+        nonlocal peak_rss
+        while True:
+            await asyncio.sleep(0.2)
+            peak_rss = max(peak_rss, await asyncio.to_thread(rss_mb, server_pid))
+
+    sampler = asyncio.create_task(sample_rss())
+    start = time.perf_counter()
+    results = await asyncio.gather(*(run_session(url, rounds, seed, server_charts) for seed in range(n_sessions)))
+    elapsed = time.perf_counter() - start
+    sampler.cancel()
+    return np.concatenate([np.asarray(r) for r in results]), elapsed, peak_rss
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the dashboard")
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 5, 10, 20],
+                        help="session counts to test, in order")
+    parser.add_argument('--rounds', type=int, default=2,
+                        help="times each session walks the navigation script")
+    parser.add_argument('--port', type=int, default=None,
+                        help="port of an already-running server (default: start one)")
+    parser.add_argument('--server-charts', action='store_true',
+                        help="draw metric charts on the server, so metric changes rerun the script")
+    args = parser.parse_args()
+
+    server = None
+    port = args.port
+    if port is None:
+        port = free_port()
+        server = start_server(port)
+    try:
+        wait_for_server(port)
+        pid = server.pid if server else int(subprocess.run(
+            ['lsof', '-t', f'-iTCP:{port}', '-sTCP:LISTEN'], capture_output=True, text=True).stdout.split()[0])
+
+        # One untimed session so the first level doesn't pay for loading data and caches
+        asyncio.run(run_level(port, 1, 1, pid, args.server_charts))
+
+        header = ['Sessions', 'Reruns'] + [f'p{p} ms' for p in LATENCY_PERCENTILES] + ['Reruns/s', 'Peak RSS MB']
+        print(''.join(f'{col:>12}' for col in header))
+        for n_sessions in args.sessions:
+            latencies, elapsed, peak_rss = asyncio.run(run_level(port, n_sessions, args.rounds, pid, args.server_charts))
+            pct = np.percentile(latencies * 1000, LATENCY_PERCENTILES)
+            row = [n_sessions, len(latencies)] + [f'{p:.0f}' for p in pct] + \
+                  [f'{len(latencies) / elapsed:.1f}', f'{peak_rss:.0f}']
+            print(''.join(f'{col:>12}' for col in row))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
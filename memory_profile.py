@@ -0,0 +1,251 @@
+"""Per-page memory profile of the dashboard, with a comparison mode for regressions.
+
+    python memory_profile.py --out memory_report.json --rounds 2
+    python memory_profile.py --compare baseline.json memory_report.json
+
+Renders every page in-process (as warmup.py does) under tracemalloc, then changes each
+selectbox on the page as a separate interaction step (except those with a format_func,
+whose option values can't be recovered from their labels). For each step it records the peak
+memory above the starting point and the memory still held afterwards (retained). It also
+lists the dashboard.py lines with the largest peaks and what each retained, labelled with
+their section: the innermost dashboard function, or else the nearest page or subheader
+above the line. The first round fills the caches. Memory retained in later
+rounds is what a long-lived worker would keep accumulating.
+
+`--compare` reads two reports and flags steps whose peak or retained memory grew by more
+than the threshold. It exits with status 1 when any did, so it can gate a deploy.
+
+tracemalloc slows rendering several times over, so compare timings only with `load_test.py`.
+"""
+import argparse
+import ast
+import bisect
+import json
+import linecache
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+
+DASHBOARD = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dashboard.py')
+
+TOP_SITES = 10
+GROWTH_THRESHOLD = 10  # percent
+GROWTH_FLOOR_MB = 1    # ignore growth smaller than this, however large in percent
+
+SECTION_PATTERN = re.compile(r'^\s*(?:# =+ (.+?) =+$|st\.(?:title|header|subheader)\("(.+?)"\))')
+
+
+class SectionMap:
+    """Maps dashboard.py line numbers to the function, page or subheader they belong to"""
+
+    def __init__(self, path=DASHBOARD):
+        with open(path, encoding='utf-8') as f:
+            source = f.read()
+        self.lines, self.labels = [1], ['Setup']
+        for lineno, line in enumerate(source.splitlines(), start=1):
+            match = SECTION_PATTERN.match(line)
+            if match:
+                self.lines.append(lineno)
+                self.labels.append(match.group(1) or match.group(2))
+        self.functions = sorted(
+            (node.lineno, node.end_lineno, node.name) for node in ast.walk(ast.parse(source))
+            if isinstance(node, ast.FunctionDef)
+        )
+
+    def section(self, lineno):
+        # Innermost function containing the line (the one starting last), else the heading above it
+        enclosing = [name for first, last, name in self.functions if first <= lineno <= last]
+        if enclosing:
+            return f'{enclosing[-1]}()'
+        return self.labels[bisect.bisect_right(self.lines, lineno) - 1]
+
+
+class LineTracer:
+    """Charges tracemalloc's running total to the dashboard.py line executing at the time.
+
+    Between two line events in dashboard.py, whatever the interpreter allocates (inside pandas,
+    plotly or Streamlit too) belongs to the earlier line. Only the one-frame running total and
+    peak are read, so tracemalloc doesn't have to keep deep tracebacks.
+    """
+
+    def __init__(self, path=DASHBOARD):
+        self.path = path
+        self.net = {}    # line -> bytes allocated minus freed while it ran
+        self.peak = {}   # line -> largest rise above the start of any one run of it
+        self.line = None
+        self.mark = 0
+        self.high = 0    # highest running total seen
+
+    def _call(self, frame, event, arg):
+        return self._line if frame.f_code.co_filename == self.path else None
+
+    def _line(self, frame, event, arg):
+        if event in ('line', 'return'):
+            self.step(frame.f_lineno)
+        return self._line
+
+    def step(self, lineno):
+        current, peak = tracemalloc.get_traced_memory()
+        if self.line is not None:
+            self.net[self.line] = self.net.get(self.line, 0) + current - self.mark
+            self.peak[self.line] = max(self.peak.get(self.line, 0), peak - self.mark)
+        self.high = max(self.high, peak)
+        tracemalloc.reset_peak()
+        self.line, self.mark = lineno, current
+
+    def __enter__(self):
+        # Streamlit runs the script on its own thread, which picks up threading.settrace
+        threading.settrace(self._call)
+        sys.settrace(self._call)
+        self.mark = self.high = tracemalloc.get_traced_memory()[0]
+        return self
+
+    def __exit__(self, *exc):
+        sys.settrace(None)
+        threading.settrace(None)
+        self.step(None)
+
+    def sites(self, sections, top=TOP_SITES):
+        """Lines with the largest peaks, labelled with their dashboard.py section"""
+        lines = sorted(self.peak, key=lambda lineno: -self.peak[lineno])[:top]
+        return [
+            {
+                'Section': sections.section(lineno),
+                'Line': lineno,
+                'Code': linecache.getline(self.path, lineno).strip(),
+                'Peak KB': self.peak[lineno] / 1024,
+                'Retained KB': self.net[lineno] / 1024,
+            }
+            for lineno in lines
+        ]
+
+
+def profile_step(at, action, sections, path=DASHBOARD):
+    """Run one rerun under tracemalloc; return peak and retained MB and the top lines.
+
+    A step that raises (e.g. a widget gone after the previous rerun) is recorded in its
+    Error field, so the remaining steps still run.
+    """
+    start_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    error = None
+    with LineTracer(path) as tracer:
+        try:
+            action()
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+    seconds = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    if error is None and at.exception:
+        error = at.exception[0].message
+    return {
+        'Peak MB': (tracer.high - start_bytes) / 1024 ** 2,
+        'Retained MB': (current - start_bytes) / 1024 ** 2,
+        'Seconds': seconds,
+        'Error': error,
+        'Sites': tracer.sites(sections),
+    }
+
+
+def selectable(box, option):
+    """Whether AppTest can select the display label `option` on `box`.
+
+    AppTest sets a selectbox by its underlying value and runs it through the widget's
+    format_func, and only the labels are known here. So a label works only if it formats to
+    itself (no format_func, or one that leaves it alone).
+    """
+    try:
+        return str(box.format_func(option)) == option
+    except Exception:
+        return False
+
+
+def profile_pages(script=DASHBOARD, rounds=2, timeout=600):
+    """Profile each page render and selectbox change `rounds` times; return one row per step"""
+    from streamlit.testing.v1 import AppTest
+
+    sections = SectionMap(script)
+    tracemalloc.start()
+    at = AppTest.from_file(script, default_timeout=timeout)
+    steps = [dict(Round=0, Step='First run (load data + default page)', **profile_step(at, at.run, sections, script))]
+
+    for round_no in range(1, rounds + 1):
+        for page in at.sidebar.radio[0].options:
+            steps.append(dict(Round=round_no, Step=f'Page: {page}', **profile_step(
+                at, lambda: at.sidebar.radio[0].set_value(page).run(), sections, script)))
+            for i, box in enumerate(at.main.selectbox):
+                option = box.options[round_no % len(box.options)]
+                if not selectable(box, option):
+                    continue
+                steps.append(dict(Round=round_no, Step=f'{page} › {box.label}', **profile_step(
+                    at, lambda: at.main.selectbox[i].set_value(option).run(), sections, script)))
+    tracemalloc.stop()
+    return steps
+
+
+def compare_reports(baseline, current, threshold=GROWTH_THRESHOLD, floor_mb=GROWTH_FLOOR_MB):
+    """Steps whose peak or retained memory grew by more than `threshold` percent and `floor_mb` MB"""
+    old = {(step['Round'], step['Step']): step for step in baseline['steps']}
+    flagged = []
+    for step in current['steps']:
+        prev = old.get((step['Round'], step['Step']))
+        if prev is None:
+            continue
+        for metric in ('Peak MB', 'Retained MB'):
+            growth = step[metric] - prev[metric]
+            if growth > floor_mb and growth > abs(prev[metric]) * threshold / 100:
+                flagged.append((step['Round'], step['Step'], metric, prev[metric], step[metric]))
+    return flagged
+
+
+def print_report(steps):
+    print(f"{'Round':>5}  {'Step':<56} {'Peak MB':>9} {'Retained MB':>12} {'Seconds':>8}")
+    for step in steps:
+        print(f"{step['Round']:>5}  {step['Step'][:56]:<56} {step['Peak MB']:9.1f} "
+              f"{step['Retained MB']:12.2f} {step['Seconds']:8.2f}")
+        if step['Error']:
+            print(f"       ERROR: {step['Error']}")
+        for site in step['Sites'][:3]:
+            if site['Peak KB'] >= 64:
+                print(f"       peak {site['Peak KB']:8.0f} KB  kept {site['Retained KB']:8.0f} KB  "
+                      f"{site['Section'][:36]:<36} line {site['Line']:<5} {site['Code'][:44]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-page memory profile of the dashboard")
+    parser.add_argument('--out', default='memory_report.json', help="report file to write (default: memory_report.json)")
+    parser.add_argument('--rounds', type=int, default=2,
+                        help="times to visit every page; rounds after the first show what each visit keeps")
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+                        help="compare two reports instead of profiling")
+    parser.add_argument('--threshold', type=float, default=GROWTH_THRESHOLD,
+                        help="percent growth in peak or retained memory to flag (default: 10)")
+    args = parser.parse_args()
+
+    if args.compare:
+        reports = []
+        for path in args.compare:
+            with open(path, encoding='utf-8') as f:
+                reports.append(json.load(f))
+        flagged = compare_reports(*reports, threshold=args.threshold)
+        for round_no, step, metric, before, after in flagged:
+            print(f"GREW  round {round_no}  {step:<56} {metric:<12} {before:8.2f} -> {after:8.2f}")
+        print(f"{len(flagged)} step(s) grew by more than {args.threshold:g}%" if flagged else "No memory growth")
+        return 1 if flagged else 0
+
+    os.chdir(os.path.dirname(DASHBOARD))
+    sys.path.insert(0, os.path.dirname(DASHBOARD))
+    steps = profile_pages(rounds=args.rounds)
+    print_report(steps)
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump({'script': DASHBOARD, 'rounds': args.rounds, 'steps': steps}, f, indent=1)
+    print(f"Wrote {args.out}")
+    return 1 if any(step['Error'] for step in steps) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
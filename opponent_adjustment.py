@@ -0,0 +1,101 @@
+"""Opponent-adjusted ERA, FIP and K/BB from a team-season offense table.
+
+The team table uses Baseball-Reference's team batting columns, one row per team season:
+Year, Tm, G, PA, R, HR, BB and SO. Each team season gets a factor per stat: the league's
+rate divided by the team's (runs per game; home runs, walks and strikeouts per plate
+appearance). So a start against a strong lineup counts its runs for less, and its
+strikeouts for more. The factors are indexed by (team, season) once. Every start then
+finds its opponent's row with one hash lookup, `get_indexer`, whether the log holds one
+pitcher or a whole staff.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from rates import per_nine, fip_core
+
+TEAM_OFFENSE_FILE = 'Data/team_offense.csv'
+
+# Adjusted count -> (game-log column, team-table column, per-game or per-PA rate)
+ADJUSTED_COUNTS = {
+    'Adj ER': ('ER', 'R', 'G'),
+    'Adj HR': ('HR', 'HR', 'PA'),
+    'Adj BB': ('BB', 'BB', 'PA'),
+    'Adj SO': ('SO', 'SO', 'PA'),
+}
+
+
+def season_fip_constants(df_season):
+    """League FIP constant of each season, as implied by the Season Totals FIP, indexed by Year"""
+    season = df_season.set_index('Year')
+    return season['FIP'] - fip_core(season['HR'], season['BB'], season['HBP'], season['SO'], season['Outs'])
+
+
+def read_team_offense(path=TEAM_OFFENSE_FILE):
+    """Team-season batting totals from CSV or Parquet (None if the file is missing)"""
+    if not os.path.exists(path):
+        return None
+    return pd.read_parquet(path) if path.endswith('.parquet') else pd.read_csv(path)
+
+
+class TeamOffense:
+    """Opponent factors per (team, season), looked up for many starts at once by hash index"""
+
+    def __init__(self, teams):
+        teams = teams.groupby(['Tm', 'Year'], sort=False)[['G', 'PA', 'R', 'HR', 'BB', 'SO']].sum()
+        league = teams.groupby(level='Year').sum()
+        self.index = teams.index
+        self.factors = {}
+        for name, (_, col, per) in ADJUSTED_COUNTS.items():
+            league_rate = (league[col] / league[per]).reindex(teams.index.get_level_values('Year')).to_numpy()
+            self.factors[name] = league_rate / (teams[col] / teams[per]).to_numpy()
+        self.runs_per_game = (teams['R'] / teams['G']).to_numpy()
+
+    def __len__(self):
+        return len(self.index)
+
+    def lookup(self, opp, years):
+        """Row of each (opponent, season) in the factor arrays, -1 where the table has no such team season"""
+        return self.index.get_indexer(pd.MultiIndex.from_arrays([np.asarray(opp), np.asarray(years)]))
+
+    def adjust(self, df_data, df_season):
+        """Game log with opponent-adjusted counts, and that start's Adj ERA, Adj FIP and Adj K/BB, added.
+
+        Starts against a team season missing from the table keep their raw counts (factor 1)
+        and are marked in 'Opp Matched'. Adj FIP uses each season's league constant from `df_season`.
+        """
+        rows = self.lookup(df_data['Opp'], df_data['Year'])
+        matched = rows >= 0
+        adjusted = {'Opp Matched': matched,
+                    'Opp R/G': np.where(matched, self.runs_per_game[rows], np.nan)}
+        for name, (col, _, _) in ADJUSTED_COUNTS.items():
+            adjusted[name] = df_data[col].to_numpy() * np.where(matched, self.factors[name][rows], 1.0)
+
+        outs = df_data['Outs'].to_numpy()
+        fip_const = season_fip_constants(df_season).reindex(df_data['Year']).to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            adjusted['Adj ERA'] = per_nine(adjusted['Adj ER'], outs)
+            adjusted['Adj FIP'] = fip_core(adjusted['Adj HR'], adjusted['Adj BB'], df_data['HBP'],
+                                           adjusted['Adj SO'], outs) + fip_const
+            # No walks in a start leaves its K/BB undefined rather than infinite
+            adjusted['Adj K/BB'] = np.where(adjusted['Adj BB'] > 0, adjusted['Adj SO'] / adjusted['Adj BB'], np.nan)
+        return df_data.assign(**adjusted)
+
+
+def season_adjusted(games, df_season):
+    """Raw and opponent-adjusted ERA, FIP and K/BB per season from an adjusted game log"""
+    sums = games.groupby('Year')[['Outs', 'ER', 'HR', 'BB', 'SO', 'HBP'] + list(ADJUSTED_COUNTS)].sum()
+    fip_const = season_fip_constants(df_season).reindex(sums.index)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = pd.DataFrame({
+            'Starts': games.groupby('Year').size(),
+            'Avg Opp R/G': games.groupby('Year')['Opp R/G'].mean(),
+            'ERA': per_nine(sums['ER'], sums['Outs']),
+            'Adj ERA': per_nine(sums['Adj ER'], sums['Outs']),
+            'FIP': fip_core(sums['HR'], sums['BB'], sums['HBP'], sums['SO'], sums['Outs']) + fip_const,
+            'Adj FIP': fip_core(sums['Adj HR'], sums['Adj BB'], sums['HBP'], sums['Adj SO'], sums['Outs']) + fip_const,
+            'K/BB': sums['SO'] / sums['BB'],
+            'Adj K/BB': sums['Adj SO'] / sums['Adj BB'],
+        }, index=sums.index)
+    return out.reset_index()
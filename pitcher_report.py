@@ -0,0 +1,138 @@
+"""Every page's metrics for one pitcher's workbook, computed without Streamlit.
+
+`read_workbook` loads and prepares the three-sheet workbook the same way the dashboard
+does, and `pitcher_report` returns the tables behind each page as plain DataFrames.
+The dashboard's 2022-vs-2025 comparisons become peak-vs-latest here: the peak season is
+the pitcher's lowest-ERA season and the latest is the most recent one.
+"""
+import pandas as pd
+
+from game_state import restore_game_state_strings, add_game_state_columns
+from rates import outs_from_ip, add_rate_stats
+from win_probability import win_probability_by_season
+from streaks import season_streaks, longest_streaks, consistency_summary
+from change_points import change_points
+
+PITCH_TYPES = {
+    'Four-seam %': 'Four-Seam Fastball',
+    'Sinker %': 'Sinker',
+    'Slider %': 'Slider',
+    'Curve %': 'Curveball',
+    'Changeup %': 'Changeup',
+}
+BATTED_BALL_TYPES = {'GB': 'Ground Balls', 'FB': 'Fly Balls', 'LD': 'Line Drives', 'PU': 'Pop-ups'}
+SEASON_COLUMNS = ['Year', 'W', 'L', 'IP', 'ERA', 'FIP', 'SO', 'BB', 'HR', 'BAbip', 'K/9', 'BB/9', 'HR/9', 'K/BB']
+DECLINE_STATS = ['ERA', 'FIP', 'K/9', 'BB/9', 'HR']
+
+
+def read_workbook(path):
+    """Load the Data, Season Totals and Variable Descriptions sheets, with outs, rates and game-state columns"""
+    # Load all sheets in one pass over the workbook
+    sheets = pd.read_excel(path, sheet_name=['Data', 'Season Totals', 'Variable Descriptions'])
+    df_data = sheets['Data']
+    df_season = sheets['Season Totals']
+    df_vars = sheets['Variable Descriptions']
+
+    # Some seasons keep the Entered/Exited strings in the unnamed columns next to them
+    df_data = restore_game_state_strings(df_data)
+
+    # Clean up the data sheet - remove unnamed columns
+    # Handle NaN values by filling them with False before applying ~ operator
+    unnamed_mask = df_data.columns.str.contains('^Unnamed', na=False)
+    df_data = df_data.loc[:, ~unnamed_mask]
+
+    # Ensure Date is datetime
+    df_data['Date'] = pd.to_datetime(df_data['Date'])
+
+    # Expand the Entered/Exited game-state strings into typed columns
+    df_data = add_game_state_columns(df_data)
+
+    # Convert IP notation (6.1 = 6 1/3 innings) to integer outs; all rate stats use outs
+    df_data['Outs'] = outs_from_ip(df_data['IP'])
+    df_season['Outs'] = outs_from_ip(df_season['IP'])
+    df_season = add_rate_stats(df_season)
+
+    return df_data, df_season, df_vars
+
+
+def peak_and_latest(df_season):
+    """The lowest-ERA season and the most recent season"""
+    return int(df_season.loc[df_season['ERA'].idxmin(), 'Year']), int(df_season['Year'].max())
+
+
+def pitch_usage(df_season):
+    """Pitch mix per season, in percent"""
+    usage = df_season[['Year'] + list(PITCH_TYPES)].copy()
+    usage[list(PITCH_TYPES)] *= 100
+    return usage.rename(columns=PITCH_TYPES)
+
+
+def pitch_usage_change(df_season):
+    """Change in each pitch's share from the peak season to the latest, in percentage points"""
+    peak, latest = peak_and_latest(df_season)
+    usage = pitch_usage(df_season).set_index('Year')
+    return pd.DataFrame({
+        'Pitch': usage.columns,
+        'Peak Year': peak,
+        'Latest Year': latest,
+        'Peak %': usage.loc[peak].to_numpy(),
+        'Latest %': usage.loc[latest].to_numpy(),
+        'Change (pts)': (usage.loc[latest] - usage.loc[peak]).to_numpy(),
+    })
+
+
+def average_game_score(df_data):
+    """Mean Game Score per season"""
+    return df_data.groupby('Year')['GmSc'].mean().rename('Average Game Score').reset_index()
+
+
+def batted_ball_profile(df_season):
+    """Share of each batted-ball type per season, in percent"""
+    counts = df_season[list(BATTED_BALL_TYPES)]
+    shares = counts.div(counts.sum(axis=1), axis=0) * 100
+    return pd.concat([df_season[['Year']], shares.rename(columns=BATTED_BALL_TYPES)], axis=1)
+
+
+def declines(df_season):
+    """Key stats in the peak season and the latest season, and the change between them"""
+    peak, latest = peak_and_latest(df_season)
+    by_year = df_season.set_index('Year')
+    return pd.DataFrame({
+        'Stat': DECLINE_STATS,
+        'Peak Year': peak,
+        'Latest Year': latest,
+        'Peak': by_year.loc[peak, DECLINE_STATS].to_numpy(dtype=float),
+        'Latest': by_year.loc[latest, DECLINE_STATS].to_numpy(dtype=float),
+    }).assign(Change=lambda df: df['Latest'] - df['Peak'])
+
+
+def exit_context(df_data):
+    """Game state when the pitcher left each start, summarized per season"""
+    exited = df_data[df_data['Exited Inning'].notna()]
+    context = exited.groupby('Year').agg(
+        Starts=('Exited Inning', 'size'),
+        avg_exit_inning=('Exited Inning', 'mean'),
+        mid_inning=('Exited Outs', lambda outs: (outs < 3).mean() * 100),
+        runners_on=('Exited Bases', lambda bases: (bases > 0).mean() * 100),
+        trailing=('Exited Score Diff', lambda diff: (diff < 0).mean() * 100)
+    ).reset_index()
+    context.columns = ['Year', 'Starts', 'Average Exit Inning', 'Pulled Mid-Inning (%)',
+                       'Left With Runners On (%)', 'Left Trailing (%)']
+    return context
+
+
+def pitcher_report(df_data, df_season):
+    """Every page's tables for one pitcher, by table name"""
+    return {
+        'Season Statistics': df_season[[col for col in SEASON_COLUMNS if col in df_season.columns]],
+        'Win Probability': win_probability_by_season(df_data),
+        'Longest Streaks': longest_streaks(season_streaks(df_data)),
+        'Consistency': consistency_summary(df_data),
+        'Regime Shifts': change_points(df_data),
+        'Pitch Usage': pitch_usage(df_season),
+        'Pitch Usage Change': pitch_usage_change(df_season),
+        'Average Game Score': average_game_score(df_data),
+        'Batted Ball Profile': batted_ball_profile(df_season),
+        'Exit Context': exit_context(df_data),
+        'Declines': declines(df_season),
+    }
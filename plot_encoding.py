@@ -0,0 +1,69 @@
+"""Compact binary encoding for Plotly figure data.
+
+Plotly (6.0+) sends NumPy arrays to the browser as base64 typed arrays instead of JSON
+decimal text. `encode_figure` converts every numeric array in a figure's traces to the
+smallest NumPy dtype that holds it exactly (int8/int16/int32), or float32 when the
+rounding error is invisible at the chart's scale, so every chart gets the compact form.
+"""
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# Trace keys whose arrays are labels rather than plotted numbers
+SKIPPED_KEYS = {'text', 'hovertext', 'customdata', 'ids', 'range'}
+
+# float32 is used when its rounding error is below this fraction of the data's spread
+FLOAT32_TOLERANCE = 1e-6
+
+# Shorter arrays (e.g. one value per season) are smaller as plain JSON than with the
+# typed-array wrapper, so they are left alone
+MIN_BINARY_LENGTH = 16
+
+
+def compact_array(values):
+    """Smallest exact integer dtype or float32-when-safe NumPy array for numeric `values`"""
+    arr = np.asarray(values)
+    if arr.size < MIN_BINARY_LENGTH or arr.dtype.kind not in 'iuf':
+        return values
+
+    finite = arr[np.isfinite(arr)] if arr.dtype.kind == 'f' else arr
+    if finite.size == arr.size and np.all(finite == np.round(finite)):
+        low, high = finite.min(), finite.max()
+        for dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return arr.astype(dtype)
+
+    if arr.dtype.kind != 'f':
+        return arr
+
+    as_float32 = arr.astype(np.float32)
+    if finite.size:
+        scale = np.ptp(finite) or np.abs(finite).max()
+        error = np.abs(as_float32[np.isfinite(arr)].astype(np.float64) - finite).max()
+        if error > scale * FLOAT32_TOLERANCE:
+            return arr.astype(np.float64)
+    return as_float32
+
+
+def _compact_arrays(obj):
+    """Recursively replace numeric list/array values in a trace dict with compact arrays"""
+    for key, value in obj.items():
+        if key in SKIPPED_KEYS:
+            continue
+        if isinstance(value, dict):
+            _compact_arrays(value)
+        elif isinstance(value, (list, tuple, np.ndarray)):
+            obj[key] = compact_array(value)
+    return obj
+
+
+def encode_figure(fig):
+    """Copy of `fig` whose trace data is sent to the browser as compact binary arrays"""
+    data = [_compact_arrays(trace.to_plotly_json()) for trace in fig.data]
+    return go.Figure(data=data, layout=fig.layout)
+
+
+def payload_size(fig):
+    """Size in bytes of the JSON the browser receives for `fig`"""
+    return len(pio.to_json(fig, validate=False).encode('utf-8'))
@@ -0,0 +1,75 @@
+"""Monte Carlo season projections built by resampling per-start outcomes from the game log.
+
+Each simulated start is drawn either from the post-surgery starts or from the pre-injury
+baseline starts, with `recovery_weight` setting the chance of drawing a post-surgery start.
+A weight of 1.0 assumes Sandy keeps pitching like his return season; 0.0 assumes a full
+return to pre-injury form.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from rates import fip_core, per_nine
+
+PROJECTION_STATS = ['ERA', 'FIP', 'K/BB']
+PROJECTION_PERCENTILES = [10, 25, 50, 75, 90]
+OUTCOME_COLUMNS = ['ER', 'SO', 'BB', 'HBP', 'HR']
+
+
+def _start_outcomes(df_data):
+    """Per-start integer outcome matrix: outs followed by OUTCOME_COLUMNS"""
+    return df_data[['Outs'] + OUTCOME_COLUMNS].to_numpy(dtype=np.int64)
+
+
+def _simulate_chunk(recent, baseline, played, n_starts, recovery_weight, n_sims, seed):
+    """Season totals (outs + outcome columns) for `n_sims` simulated seasons"""
+    rng = np.random.default_rng(seed)
+    from_recent = rng.random((n_sims, n_starts)) < recovery_weight
+    recent_draw = recent[rng.integers(len(recent), size=(n_sims, n_starts))]
+    baseline_draw = baseline[rng.integers(len(baseline), size=(n_sims, n_starts))]
+    starts = np.where(from_recent[..., None], recent_draw, baseline_draw)
+    return starts.sum(axis=1) + played
+
+
+def simulate_season(df_data, n_starts=30, recovery_weight=0.5, recent_years=(2025,),
+                    baseline_years=(2021, 2022, 2023), played=None, n_sims=20000,
+                    chunk_size=5000, n_jobs=1, seed=0):
+    """Simulated season totals as an (n_sims, 6) integer array of outs, ER, SO, BB, HBP and HR.
+
+    `played` is an optional game log of starts already made this season; their totals are
+    added to every simulation, so `n_starts` is then the number of starts remaining.
+    With `n_jobs` > 1 the chunks of simulations run across a process pool.
+    """
+    recent = _start_outcomes(df_data[df_data['Year'].isin(recent_years)])
+    baseline = _start_outcomes(df_data[df_data['Year'].isin(baseline_years)])
+    played_totals = _start_outcomes(played).sum(axis=0) if played is not None else 0
+
+    chunks = [min(chunk_size, n_sims - start) for start in range(0, n_sims, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    args = [(recent, baseline, played_totals, n_starts, recovery_weight, size, chunk_seed)
+            for size, chunk_seed in zip(chunks, seeds)]
+
+    if n_jobs == 1:
+        results = [_simulate_chunk(*chunk_args) for chunk_args in args]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            results = list(pool.map(_simulate_chunk, *zip(*args)))
+    return np.concatenate(results)
+
+
+def projection_rates(totals, fip_const):
+    """ERA, FIP and K/BB for each simulated season"""
+    outs, er, so, bb, hbp, hr = totals.T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return pd.DataFrame({
+            'ERA': per_nine(er, outs),
+            'FIP': fip_core(hr, bb, hbp, so, outs) + fip_const,
+            'K/BB': so / bb,
+        })
+
+
+def projection_bands(rates, percentiles=PROJECTION_PERCENTILES):
+    """Percentile bands of each projected stat, one row per stat"""
+    bands = np.nanpercentile(rates[PROJECTION_STATS].to_numpy(), percentiles, axis=0).T
+    return pd.DataFrame(bands, index=PROJECTION_STATS, columns=[f'{p}th' for p in percentiles])
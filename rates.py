@@ -0,0 +1,56 @@
+"""Innings as integer outs, and the rate stats computed from them.
+
+IP is recorded in baseball notation, where 6.1 means 6 1/3 innings and 6.2 means 6 2/3,
+so it can't be summed or divided as a decimal. At ingest it is converted to an integer
+count of outs; every per-9 rate is then count * 27 / outs.
+"""
+import numpy as np
+import pandas as pd
+
+OUTS_PER_NINE = 27
+
+# Counting stats reported per 9 innings in the season table
+PER_NINE_STATS = {'K/9': 'SO', 'BB/9': 'BB', 'HR/9': 'HR', 'H/9': 'H',
+                  'GB/9': 'GB', 'FB/9': 'FB', 'LD/9': 'LD', 'PU/9': 'PU'}
+
+
+def outs_from_ip(ip):
+    """Integer outs from IP in baseball notation (6.1 -> 19)"""
+    tenths = np.round(np.asarray(ip, dtype=float) * 10).astype(np.int64)
+    whole, partial = np.divmod(tenths, 10)
+    if np.any(partial > 2):
+        raise ValueError("IP values must end in .0, .1 or .2 (thirds of an inning)")
+    return whole * 3 + partial
+
+
+def ip_from_outs(outs):
+    """IP in baseball notation from integer outs (19 -> 6.1)"""
+    whole, partial = np.divmod(np.asarray(outs, dtype=np.int64), 3)
+    return whole + partial / 10
+
+
+def per_nine(count, outs):
+    """Rate per 9 innings of a count over the same outs (NaN where no outs were recorded)"""
+    count = np.asarray(count, dtype=float)
+    outs = np.asarray(outs)
+    out = np.full(np.broadcast(count, outs).shape, np.nan)
+    np.divide(count * OUTS_PER_NINE, outs, out=out, where=outs != 0)
+    return out
+
+
+def fip_core(hr, bb, hbp, so, outs):
+    """FIP before the league constant is added: (13 HR + 3 (BB + HBP) - 2 SO) per inning"""
+    return per_nine(13 * np.asarray(hr) + 3 * (np.asarray(bb) + np.asarray(hbp)) - 2 * np.asarray(so), outs) / 9
+
+
+def fip_constant(df_season):
+    """League FIP constant implied by the FIP values in the Season Totals sheet"""
+    core = fip_core(df_season['HR'], df_season['BB'], df_season['HBP'], df_season['SO'], df_season['Outs'])
+    return float(np.nanmean(df_season['FIP'].to_numpy() - core))
+
+
+def add_rate_stats(df_season):
+    """Append per-9 rates and K/BB, all computed from integer outs, to a season table"""
+    rates = {name: per_nine(df_season[col], df_season['Outs']) for name, col in PER_NINE_STATS.items()}
+    rates['K/BB'] = df_season['SO'] / df_season['BB']
+    return df_season.assign(**rates)
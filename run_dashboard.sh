@@ -7,5 +7,8 @@ echo "The dashboard will open in your default web browser."
 echo "Press Ctrl+C to stop the dashboard."
 echo ""
 
+# Validate the data and fill the dashboard's caches before the server accepts traffic
+python warmup.py || exit 1
+
 streamlit run dashboard.py
 
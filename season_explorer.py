@@ -0,0 +1,102 @@
+"""Season metric charts that switch metrics in the browser instead of rerunning the script.
+
+The season table, its bootstrap intervals and the chart settings go to a custom component
+(components/season_explorer) as one JSON bundle. The component draws the bars with
+Plotly.js and handles metric switching itself, so changing the metric costs no websocket
+round trip and no server CPU. The bundle only changes, and the charts only redraw, when
+the data does.
+
+Plotly.js is served with the component rather than from a CDN, so the charts also draw
+offline. The file is copied from the installed plotly package, which keeps the browser
+charts on the same Plotly.js version as the server-drawn ones.
+"""
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+import plotly
+import streamlit.components.v1 as components
+
+COMPONENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'components', 'season_explorer')
+PLOTLY_JS = os.path.join(os.path.dirname(plotly.__file__), 'package_data', 'plotly.min.js')
+
+
+def _install_plotly_js(component_dir=COMPONENT_DIR, source=PLOTLY_JS):
+    """Copy the plotly package's Plotly.js next to the component's index.html unless an identical copy is there"""
+    target = os.path.join(component_dir, 'plotly.min.js')
+    if not os.path.exists(target) or os.path.getsize(target) != os.path.getsize(source):
+        shutil.copyfile(source, target)
+    return target
+
+
+_install_plotly_js()
+_component = components.declare_component('season_explorer', path=COMPONENT_DIR)
+
+
+def _json_values(values):
+    """Floats as a plain list with NaN as None, since JSON has no NaN"""
+    values = np.asarray(values, dtype=float)
+    return np.where(np.isnan(values), None, values).tolist()
+
+
+def season_bundle(df_season, columns, colors, intervals=None):
+    """Years, bar colors and the given season columns, plus bootstrap bounds for any of them in `intervals`"""
+    years = df_season['Year'].astype(int).tolist()
+    bundle = {
+        'years': years,
+        'colors': [colors[str(year)] for year in years],
+        'columns': {col: _json_values(df_season[col]) for col in columns},
+        'intervals': {},
+    }
+    if intervals is not None:
+        bounds = intervals.set_index('Year').reindex(years)
+        for col in columns:
+            if f'{col} Low' in bounds.columns:
+                bundle['intervals'][col] = {'low': _json_values(bounds[f'{col} Low']),
+                                            'high': _json_values(bounds[f'{col} High'])}
+    return bundle
+
+
+def metric_view(names, formats, label, title, y_title, error_bars=False, compare=None):
+    """Settings for one bar chart with a dropdown of metrics.
+
+    `names` maps each metric column to its display name and `formats` maps it to 'int',
+    'pct' or a decimal format such as '.2f'. `title` and `y_title` may use {name}.
+    `compare` is an optional (year, year) pair shown as usage cards under the chart.
+    """
+    return {
+        'mode': 'single',
+        'label': label,
+        'metrics': [{'key': key, 'name': name, 'format': formats.get(key, '.2f')} for key, name in names.items()],
+        'title': title,
+        'yTitle': y_title,
+        'errorBars': error_bars,
+        'compare': list(compare) if compare else None,
+    }
+
+
+def metric_group_view(groups, names, formats, group_label, label, title, default_count=3):
+    """Settings for a stack of bar charts, one per metric ticked within the chosen group.
+
+    `title` may use {group}; metrics missing from `names` are shown by column name.
+    """
+    keys = [key for group in groups.values() for key in group]
+    return {
+        'mode': 'multi',
+        'groupLabel': group_label,
+        'label': label,
+        'groups': groups,
+        'defaultCount': default_count,
+        'metrics': [{'key': key, 'name': names.get(key, key), 'format': formats.get(key, '.1f')} for key in keys],
+        'title': title,
+        'yTitle': '{name}',
+        'errorBars': False,
+    }
+
+
+def season_explorer(bundle, view, key):
+    """Render the component; it redraws only when the bundle or view differs from the last run"""
+    data_key = hashlib.sha1(json.dumps([bundle, view], sort_keys=True).encode()).hexdigest()
+    return _component(bundle=bundle, view=view, data_key=data_key, key=key, default=None)
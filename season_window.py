@@ -0,0 +1,123 @@
+"""Season totals recomputed from the game log over a window of each season.
+
+The game log is sorted by date once. A window, such as "starts between May 1 and July 15"
+or "each season's last 10 starts", becomes one row range per season by binary search on
+the sorted dates. The selected starts are then summed by season in a single group-by and
+the rate stats are recomputed from the sums. Over full seasons the result reproduces the
+Season Totals sheet, which `check_season_totals` verifies.
+"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from rates import ip_from_outs, fip_core, per_nine, add_rate_stats
+
+# Counting stats whose season value is the sum of the game lines
+SUMMED_COLUMNS = [
+    'Outs', 'H', 'R', 'ER', 'HR', 'BB', 'IBB', 'SO', 'HBP', 'BK', 'WP', 'BF', 'Pit', 'Str',
+    'StL', 'StS', 'GB', 'FB', 'LD', 'PU', 'Unk', 'SB', 'CS', 'PO', 'AB', '2B', '3B', 'GIDP',
+    'SF', 'ROE', 'WPA', 'cWPA', 'RE24',
+]
+
+# Pitch mix is only recorded per season, so windows carry the full-season values
+FULL_SEASON_COLUMNS = ['Four-seam %', 'Sinker %', 'Slider %', 'Curve %', 'Changeup %']
+
+# Leap year that month/day windows are expressed in, so February 29 is a valid day
+WINDOW_YEAR = 2024
+
+# Game lines round these to one or two decimals, so their sums drift from the season values
+SEASON_TOLERANCE = {'WPA': 0.5, 'cWPA': 0.02, 'RE24': 0.5, 'aLI': 0.02, 'ERA': 0.005,
+                    'BAbip': 0.001, 'GmSc': 0.5}
+
+
+class GameLogWindow:
+    """Date-sorted game log that turns per-season windows into row ranges by binary search"""
+
+    def __init__(self, df_data):
+        log = df_data.sort_values('Date', kind='stable').reset_index(drop=True)
+        # Counts summed alongside the game lines: starts, decisions and BF-weighted leverage
+        self.log = log.assign(
+            GS=1,
+            W=(log['DecWL'] == 'W').astype(np.int64),
+            L=(log['DecWL'] == 'L').astype(np.int64),
+            LI_BF=log['aLI'] * log['BF'],
+        )
+        self.dates = self.log['Date'].to_numpy()
+        self.years, self.season_start = np.unique(self.log['Year'].to_numpy(), return_index=True)
+        self.season_end = np.r_[self.season_start[1:], len(self.log)]
+
+    def __len__(self):
+        return len(self.log)
+
+    def date_range(self, start, end):
+        """(lo, hi) row bounds per season for starts from month/day `start` through `end`"""
+        first = np.array([f'{year}-{start:%m-%d}' for year in self.years], dtype='datetime64[D]')
+        last = np.array([f'{year}-{end:%m-%d}' for year in self.years], dtype='datetime64[D]')
+        lo = np.searchsorted(self.dates, first.astype(self.dates.dtype), side='left')
+        hi = np.searchsorted(self.dates, (last + 1).astype(self.dates.dtype), side='left')
+        return lo, np.maximum(lo, hi)
+
+    def day_span(self):
+        """Earliest and latest month/day of any start, as dates in WINDOW_YEAR"""
+        days = self.log['Date'].dt.month * 100 + self.log['Date'].dt.day
+        first, last = int(days.min()), int(days.max())
+        return date(WINDOW_YEAR, first // 100, first % 100), date(WINDOW_YEAR, last // 100, last % 100)
+
+    def last_starts(self, n):
+        """(lo, hi) row bounds covering each season's last `n` starts"""
+        return np.maximum(self.season_end - n, self.season_start), self.season_end
+
+    def full_seasons(self):
+        """(lo, hi) row bounds covering every start"""
+        return self.season_start, self.season_end
+
+    def rows(self, lo, hi):
+        """Game-log rows inside the (lo, hi) ranges"""
+        marks = np.zeros(len(self.log) + 1, dtype=np.int64)
+        np.add.at(marks, lo, 1)
+        np.add.at(marks, hi, -1)
+        return self.log[np.cumsum(marks[:-1]) > 0]
+
+    def totals(self, lo, hi, df_season):
+        """Season-style totals and rates for the starts inside the (lo, hi) ranges, one row per Year.
+
+        `df_season` supplies each season's league FIP constant and the full-season pitch mix.
+        Seasons with no starts in the window keep their row with zero counts and NaN rates.
+        """
+        window = self.rows(lo, hi)
+        sums = (window.groupby('Year')[SUMMED_COLUMNS + ['GS', 'W', 'L', 'GmSc', 'LI_BF']].sum()
+                .reindex(self.years, fill_value=0))
+
+        season = df_season.set_index('Year').reindex(self.years)
+        fip_const = season['FIP'] - fip_core(season['HR'], season['BB'], season['HBP'],
+                                             season['SO'], season['Outs'])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            totals = sums.assign(
+                IP=ip_from_outs(sums['Outs']),
+                ERA=per_nine(sums['ER'], sums['Outs']),
+                FIP=fip_core(sums['HR'], sums['BB'], sums['HBP'], sums['SO'], sums['Outs']) + fip_const,
+                BAbip=(sums['H'] - sums['HR']) / (sums['AB'] - sums['SO'] - sums['HR'] + sums['SF']),
+                GmSc=sums['GmSc'] / sums['GS'],
+                aLI=sums['LI_BF'] / sums['BF'],
+            ).drop(columns='LI_BF')
+        totals[FULL_SEASON_COLUMNS] = season[FULL_SEASON_COLUMNS]
+        totals = add_rate_stats(totals.rename_axis('Year').reset_index())
+
+        order = [col for col in df_season.columns if col in totals.columns]
+        return totals[order + [col for col in totals.columns if col not in order]]
+
+
+def check_season_totals(window, df_season):
+    """Differences between full-season totals rebuilt from the game log and the Season Totals sheet"""
+    rebuilt = window.totals(*window.full_seasons(), df_season).set_index('Year')
+    sheet = df_season.set_index('Year')
+    problems = []
+    for year in sheet.index.difference(rebuilt.index):
+        problems.append(f"{year}: in Season Totals but has no starts in the game log")
+    for col in SUMMED_COLUMNS + ['W', 'L', 'ERA', 'BAbip', 'GmSc', 'aLI']:
+        diff = (rebuilt[col] - sheet[col]).reindex(sheet.index).abs()
+        bad = diff[diff > SEASON_TOLERANCE.get(col, 0)]
+        problems.extend(f"{year} {col}: game log gives {rebuilt.loc[year, col]:g}, "
+                        f"Season Totals has {sheet.loc[year, col]:g}" for year in bad.index)
+    return problems
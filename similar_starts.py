@@ -0,0 +1,60 @@
+"""Nearest-neighbour search over standardized game lines ("find similar starts")."""
+import numpy as np
+
+# Innings enter as integer outs; standardizing makes that identical to using innings
+SIMILARITY_FEATURES = ['Outs', 'H', 'ER', 'BB', 'SO', 'HR', 'Pit', 'StS', 'GB', 'FB', 'LD', 'PU', 'GmSc']
+
+
+class StartIndex:
+    """Standardized game-line matrix with batched Euclidean nearest-neighbour queries.
+
+    The matrix is z-scored once when the index is built; each query is a single
+    matrix product against every start, so a lookup over a few hundred thousand
+    starts is one pass of (n_starts x 13) float32 arithmetic.
+    """
+
+    def __init__(self, df_data, features=SIMILARITY_FEATURES):
+        self.features = list(features)
+        self.starts = df_data.reset_index(drop=True)
+
+        values = self.starts[self.features].to_numpy(dtype=float)
+        self.mean = values.mean(axis=0)
+        std = values.std(axis=0)
+        self.std = np.where(std > 0, std, 1.0)
+
+        self.matrix = np.ascontiguousarray((values - self.mean) / self.std, dtype=np.float32)
+        self.sq_norms = np.einsum('ij,ij->i', self.matrix, self.matrix)
+
+    def __len__(self):
+        return len(self.matrix)
+
+    def distances(self, rows):
+        """Euclidean distances from each start in `rows` to every start in the index"""
+        query = self.matrix[rows]
+        d2 = self.sq_norms[rows][:, None] + self.sq_norms[None, :] - 2 * (query @ self.matrix.T)
+        return np.sqrt(np.maximum(d2, 0))
+
+    def query(self, rows, k=5, chunk_size=256):
+        """Positions and distances of the k most similar starts for each start in `rows` (itself excluded)"""
+        rows = np.atleast_1d(np.asarray(rows))
+        k = min(k, len(self) - 1)
+        neighbours = np.empty((len(rows), k), dtype=np.int64)
+        dists = np.empty((len(rows), k), dtype=np.float32)
+
+        for start in range(0, len(rows), chunk_size):
+            batch = rows[start:start + chunk_size]
+            d = self.distances(batch)
+            d[np.arange(len(batch)), batch] = np.inf
+            top = np.argpartition(d, k - 1, axis=1)[:, :k]
+            order = np.argsort(np.take_along_axis(d, top, axis=1), axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            neighbours[start:start + len(batch)] = top
+            dists[start:start + len(batch)] = np.take_along_axis(d, top, axis=1)
+        return neighbours, dists
+
+    def similar_starts(self, row, k=5):
+        """The k most similar starts to game-log position `row` as a DataFrame with a Distance column"""
+        neighbours, dists = self.query([row], k)
+        result = self.starts.iloc[neighbours[0]].copy()
+        result.insert(0, 'Distance', dists[0])
+        return result
@@ -0,0 +1,102 @@
+"""Streaks and consistency from the date-sorted game log, using vectorized run-length encoding.
+
+Each streak type is a per-start condition (e.g. Game Score of 50 or more). The run lengths
+of every condition are found at once from the positions where the condition, or the
+season, changes, so the cost is a few array passes however many starts or pitchers
+the log holds. Streaks never cross a season boundary.
+"""
+import numpy as np
+import pandas as pd
+
+from rates import ip_from_outs
+
+QUALITY_GMSC = 50
+LOW_WALKS = 1
+HIGH_WALKS = 3
+
+# Streak name -> whether a run of it is a good or a bad stretch
+STREAK_TYPES = {
+    f'Quality starts (GmSc ≥ {QUALITY_GMSC})': 'Good',
+    f'Starts with ≤ {LOW_WALKS} BB': 'Good',
+    'Scoreless starts': 'Good',
+    f'Starts below GmSc {QUALITY_GMSC}': 'Bad',
+    f'Starts with {HIGH_WALKS}+ BB': 'Bad',
+}
+
+
+def streak_conditions(log):
+    """Boolean matrix (n_starts x n_streak_types) of which starts extend each kind of streak"""
+    gmsc = log['GmSc'].to_numpy()
+    bb = log['BB'].to_numpy()
+    return np.column_stack([
+        gmsc >= QUALITY_GMSC,
+        bb <= LOW_WALKS,
+        log['R'].to_numpy() == 0,
+        gmsc < QUALITY_GMSC,
+        bb >= HIGH_WALKS,
+    ])
+
+
+def run_lengths(flags, groups):
+    """Runs of True in each column of `flags`, broken wherever `groups` changes.
+
+    Returns (column, start, length) arrays with one entry per run, ordered by column then start.
+    """
+    n, k = flags.shape
+    on = flags.astype(bool)
+    new_group = np.r_[True, groups[1:] != groups[:-1]]
+    last_in_group = np.r_[new_group[1:], True]
+    prev_on = np.vstack([np.zeros((1, k), dtype=bool), on[:-1]]) & ~new_group[:, None]
+    next_on = np.vstack([on[1:], np.zeros((1, k), dtype=bool)]) & ~last_in_group[:, None]
+
+    # Transposed so the runs come out ordered by column, then by start
+    column, start = np.nonzero((on & ~prev_on).T)
+    _, end = np.nonzero((on & ~next_on).T)
+    return column, start, end - start + 1
+
+
+def season_streaks(df_data, by=('Year',)):
+    """Every streak of every type, with its length, dates and innings, one row per streak.
+
+    `by` lists the columns a streak can't cross; add a pitcher column to run a whole staff at once.
+    """
+    by = list(by)
+    log = df_data.sort_values(by + ['Date'], kind='stable').reset_index(drop=True)
+    groups = log.groupby(by, sort=False).ngroup().to_numpy()
+
+    column, start, length = run_lengths(streak_conditions(log), groups)
+    end = start + length - 1
+    outs = np.r_[0, np.cumsum(log['Outs'].to_numpy())]
+    names = np.array(list(STREAK_TYPES))
+
+    streaks = log.loc[start, by].reset_index(drop=True)
+    streaks['Streak'] = names[column]
+    streaks['Type'] = streaks['Streak'].map(STREAK_TYPES)
+    streaks['Starts'] = length
+    streaks['IP'] = ip_from_outs(outs[end + 1] - outs[start])
+    streaks['From'] = log['Date'].to_numpy()[start]
+    streaks['To'] = log['Date'].to_numpy()[end]
+    return streaks
+
+
+def longest_streaks(streaks, by=('Year',)):
+    """The longest streak of each type within each group (the earliest one when tied)"""
+    by = list(by)
+    longest = (streaks.sort_values(by + ['Streak', 'Starts', 'From'], ascending=[True] * len(by) + [True, False, True])
+               .drop_duplicates(by + ['Streak']))
+    order = pd.Categorical(longest['Streak'], categories=list(STREAK_TYPES), ordered=True)
+    return longest.assign(Streak=order).sort_values(by + ['Streak']).reset_index(drop=True)
+
+
+def consistency_summary(df_data, by=('Year',)):
+    """Per-group quality-start rate and the spread of Game Score (lower spread = more consistent)"""
+    by = list(by)
+    keys = [df_data[col] for col in by]
+    gmsc = df_data['GmSc'].groupby(keys)
+    summary = pd.DataFrame({
+        'Starts': gmsc.size(),
+        'Quality Start %': (df_data['GmSc'] >= QUALITY_GMSC).groupby(keys).mean() * 100,
+        'GmSc Mean': gmsc.mean(),
+        'GmSc Std': gmsc.std(),
+    })
+    return summary.reset_index()
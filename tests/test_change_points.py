@@ -0,0 +1,69 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from change_points import segment_cost, binary_segmentation, change_points, recent_shifts, MIN_SEGMENT  # noqa: E402
+
+
+def cumulative(x, w):
+    return np.r_[0, np.cumsum(w)], np.r_[0, np.cumsum(w * x)], np.r_[0, np.cumsum(w * x * x)]
+
+
+def test_segment_cost_matches_the_weighted_squared_error():
+    rng = np.random.default_rng(0)
+    x, w = rng.normal(size=50), rng.integers(15, 30, 50).astype(float)
+    for lo, hi in [(0, 50), (3, 17), (20, 21)]:
+        mean = np.average(x[lo:hi], weights=w[lo:hi])
+        expected = (w[lo:hi] * (x[lo:hi] - mean) ** 2).sum()
+        assert np.isclose(segment_cost(*cumulative(x, w), lo, hi), expected)
+
+
+def test_first_split_is_the_best_by_brute_force():
+    rng = np.random.default_rng(1)
+    x = np.r_[rng.normal(0, 1, 40), rng.normal(1.5, 1, 40)]
+    w = np.ones_like(x)
+    sums = cumulative(x, w)
+    gains = {s: segment_cost(*sums, 0, 80) - segment_cost(*sums, 0, s) - segment_cost(*sums, s, 80)
+             for s in range(MIN_SEGMENT, 80 - MIN_SEGMENT + 1)}
+    points = binary_segmentation(x, w, np.zeros(80, dtype=np.int64))
+    assert max(gains, key=gains.get) in points.tolist()
+
+
+def test_planted_shifts_are_found_per_group_and_noise_alone_is_not_split():
+    rng = np.random.default_rng(2)
+    step = np.r_[rng.normal(0, 0.5, 30), rng.normal(4, 0.5, 30), rng.normal(1, 0.5, 30)]
+    flat = rng.normal(0, 1, 90)
+    x = np.r_[step, flat]
+    groups = np.repeat([0, 1], 90)
+    points = binary_segmentation(x, np.ones_like(x), groups)
+    assert points.tolist() == [30, 60]
+    assert binary_segmentation(step, np.ones_like(step), np.zeros(90, dtype=np.int64)).tolist() == [30, 60]
+
+
+def test_change_points_report_levels_before_and_after():
+    rng = np.random.default_rng(3)
+    n = 60
+    dates = pd.date_range('2024-04-01', periods=n, freq='5D')
+    bf = rng.integers(22, 28, n)
+    log = pd.DataFrame({
+        'Date': dates, 'Year': dates.year, 'BF': bf,
+        # Walk rate jumps from about 4% to about 16% of batters after 40 starts
+        'BB': np.r_[np.full(40, 1), np.full(20, 4)],
+        'SO': np.round(bf * 0.25).astype(int),
+        'GmSc': np.full(n, 55),
+        'HR': np.zeros(n, dtype=int),
+    })
+    points = change_points(log)
+    walks = points[points['Series'] == 'BB/BF']
+    assert walks['Start'].tolist() == [41]
+    assert walks['Date'].tolist() == [dates[40]]
+    assert np.isclose(walks['Before'].iloc[0], 40 / bf[:40].sum())
+    assert np.isclose(walks['After'].iloc[0], 80 / bf[40:].sum())
+    assert walks['Starts Ago'].tolist() == [19]
+    assert recent_shifts(points).empty
+    assert len(recent_shifts(points, last_n=20)) == len(walks)
@@ -0,0 +1,97 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from pitcher_report import read_workbook  # noqa: E402
+from drivers import DRIVERS, batched_fits, driver_matrix, target_values, driver_fits, driver_effects  # noqa: E402
+
+WORKBOOK = os.path.join(REPO, 'Data', 'sandy_stats_since_21 copy.xlsx')
+DF_DATA = read_workbook(WORKBOOK)[0]
+
+
+def lstsq_fit(X, y):
+    """Reference fit of one window with np.linalg.lstsq: (coefficients, starts, r2)"""
+    keep = ~(np.isnan(X).any(axis=1) | np.isnan(y))
+    X, y = X[keep], y[keep]
+    design = np.column_stack([np.ones(len(X)), X])
+    beta = np.linalg.lstsq(design, y, rcond=None)[0]
+    residual = y - design @ beta
+    return beta[1:], len(y), 1 - (residual @ residual) / ((y - y.mean()) @ (y - y.mean()))
+
+
+def test_batched_fits_match_lstsq_window_by_window():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 4)) * [1, 10, 100, 0.1]
+    y = X @ [2.0, -0.3, 0.01, 5.0] + rng.normal(size=200)
+    X[[5, 50]] = np.nan
+    y[77] = np.nan
+    lo = np.array([0, 0, 30, 120, 180])
+    hi = np.array([200, 40, 90, 200, 200])
+
+    coefficients, starts, r2 = batched_fits(X, y, lo, hi)
+    for i in range(len(lo)):
+        expected, n, expected_r2 = lstsq_fit(X[lo[i]:hi[i]], y[lo[i]:hi[i]])
+        assert np.allclose(coefficients[i], expected, rtol=1e-6, atol=1e-9)
+        assert starts[i] == n
+        assert np.isclose(r2[i], expected_r2)
+
+
+def test_underdetermined_or_constant_fits_are_nan():
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(30, 3))
+    y = np.r_[rng.normal(size=20), np.full(10, 4.0)]
+    coefficients, starts, r2 = batched_fits(X, y, np.array([0, 0, 20]), np.array([30, 4, 30]))
+    assert not np.isnan(coefficients[0]).any()
+    assert starts[1] == 4 and np.isnan(coefficients[1]).all() and np.isnan(r2[1])
+    assert np.isnan(coefficients[2]).all() and np.isnan(r2[2])
+
+
+def test_season_and_rolling_fits_on_the_game_log_match_lstsq():
+    seasons, rolling = driver_fits(DF_DATA)
+    log = DF_DATA.sort_values('Date').reset_index(drop=True)
+    X = driver_matrix(log)
+
+    for target in ['GmSc', 'ER/Out']:
+        y = target_values(log, target)
+        for _, row in seasons[seasons['Target'] == target].iterrows():
+            rows = (log['Year'] == row['Year']).to_numpy()
+            expected, n, r2 = lstsq_fit(X[rows], y[rows])
+            assert np.allclose(row[DRIVERS].to_numpy(dtype=float), expected, rtol=1e-6, atol=1e-9)
+            assert row['Starts'] == n and np.isclose(row['R²'], r2)
+
+        windows = rolling[rolling['Target'] == target].reset_index(drop=True)
+        assert len(windows) == len(log) - 20 + 1
+        for i in [0, 37, len(windows) - 1]:
+            expected = lstsq_fit(X[i:i + 20], y[i:i + 20])[0]
+            assert np.allclose(windows.loc[i, DRIVERS].to_numpy(dtype=float), expected, rtol=1e-6, atol=1e-9)
+            assert windows.loc[i, 'Window End'] == log.loc[i + 19, 'Date']
+
+
+def test_by_keeps_windows_within_one_pitcher():
+    staff = pd.concat([DF_DATA.assign(Pitcher='A'), DF_DATA.assign(Pitcher='B')], ignore_index=True)
+    seasons, rolling = driver_fits(staff, by=['Pitcher'])
+    alone_seasons, alone_rolling = driver_fits(DF_DATA)
+    assert len(rolling) == 2 * len(alone_rolling)
+    for pitcher in ['A', 'B']:
+        mine = seasons[seasons['Pitcher'] == pitcher].drop(columns='Pitcher').reset_index(drop=True)
+        assert np.allclose(mine[DRIVERS].to_numpy(dtype=float), alone_seasons[DRIVERS].to_numpy(dtype=float),
+                           equal_nan=True)
+
+
+def test_driver_effects_rank_by_effect_size():
+    seasons, _ = driver_fits(DF_DATA)
+    effects = driver_effects(DF_DATA, seasons)
+    year = int(DF_DATA['Year'].max())
+    latest = effects[(effects['Target'] == 'GmSc') & (effects['Year'] == year)]
+    assert latest['Rank'].tolist() == list(range(1, len(DRIVERS) + 1))
+    assert latest['Effect per SD'].abs().is_monotonic_decreasing
+
+    bb = latest.set_index('Driver').loc['BB']
+    sd = DF_DATA.loc[DF_DATA['Year'] == year, 'BB'].std()
+    assert np.isclose(bb['Driver SD'], sd)
+    assert np.isclose(bb['Effect per SD'], bb['Coefficient'] * sd)
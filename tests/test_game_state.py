@@ -0,0 +1,51 @@
+import os
+import sys
+
+import pandas as pd
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from game_state import parse_game_state, restore_game_state_strings, add_game_state_columns  # noqa: E402
+from pitcher_report import read_workbook  # noqa: E402
+
+WORKBOOK = os.path.join(REPO, 'Data', 'sandy_stats_since_21 copy.xlsx')
+
+
+def test_parse_game_state_types_and_values():
+    parsed = parse_game_state(['7b 12- 1 out d1', '5t 3 out a2', '1t --- 0 out tie', 'not a state'], 'Exited')
+
+    assert str(parsed['Exited Inning'].dtype) == 'Int8'
+    assert str(parsed['Exited Outs'].dtype) == 'Int8'
+    assert str(parsed['Exited Score Diff'].dtype) == 'Int8'
+    assert str(parsed['Exited Bases'].dtype) == 'UInt8'
+    assert list(parsed['Exited Half'].cat.categories) == ['t', 'b']
+
+    assert parsed['Exited Inning'].tolist()[:3] == [7, 5, 1]
+    assert parsed['Exited Half'].tolist()[:3] == ['b', 't', 't']
+    assert parsed['Exited Bases'].tolist()[:3] == [3, 0, 0]
+    assert parsed['Exited Outs'].tolist()[:3] == [1, 3, 0]
+    assert parsed['Exited Score Diff'].tolist()[:3] == [-1, 2, 0]
+    assert parsed.iloc[3].isna().all()
+
+
+def test_restore_game_state_strings_uses_the_unnamed_column_when_needed():
+    df = pd.DataFrame({
+        'Entered': ['1t --- 0 out tie', 16.9],
+        'Exited': ['5b 3 out d3', 29],
+        'Unnamed: 55': [None, '1b --- 0 out tie'],
+        'Unnamed: 56': [None, '6t 12- 2 out a2'],
+    })
+    restored = restore_game_state_strings(df)
+    assert restored['Entered'].tolist() == ['1t --- 0 out tie', '1b --- 0 out tie']
+    assert restored['Exited'].tolist() == ['5b 3 out d3', '6t 12- 2 out a2']
+    assert add_game_state_columns(restored)['Exited Bases'].tolist() == [0, 3]
+
+
+def test_every_season_has_game_state():
+    df_data, _, _ = read_workbook(WORKBOOK)
+    columns = [f'{col} {part}' for col in ('Entered', 'Exited') for part in ('Inning', 'Bases', 'Outs')]
+    counts = df_data.groupby('Year')[columns].count()
+    starts = df_data.groupby('Year').size()
+    for col in columns:
+        assert (counts[col] == starts).all(), col
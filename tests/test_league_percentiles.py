@@ -0,0 +1,66 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from league_percentiles import LeagueBaseline, percentile_label, read_league_table  # noqa: E402
+
+
+def league_table(seed=0, n=400):
+    rng = np.random.default_rng(seed)
+    league = pd.DataFrame({
+        'Year': rng.choice([2021, 2022, 2023], n),
+        'Outs': rng.integers(150, 700, n),
+        # Rounded, so the table has ties like a real one
+        'ERA': np.round(rng.normal(4.2, 1.0, n), 2),
+        'K/9': np.round(rng.normal(8.5, 1.5, n), 1),
+    })
+    league.loc[::37, 'ERA'] = np.nan
+    return league
+
+
+def loop_percentile(league, stat, year, value, lower_is_better):
+    """Reference midrank percentile within one season's qualified pitchers"""
+    season = league[(league['Year'] == year) & (league['Outs'] >= 300)][stat].dropna().to_numpy()
+    pct = ((season < value).sum() + (season <= value).sum()) / 2 / len(season) * 100
+    return 100 - pct if lower_is_better else pct
+
+
+def test_percentiles_match_a_loop_over_the_league():
+    league = league_table()
+    baseline = LeagueBaseline(league, stats={'ERA': True, 'K/9': False})
+    rng = np.random.default_rng(1)
+    years = rng.choice([2021, 2022, 2023], 50)
+    # Probe values both between and exactly on league values
+    values = np.r_[np.round(rng.normal(4.2, 1.2, 25), 3), league['ERA'].dropna().to_numpy()[:25]]
+    expected = [loop_percentile(league, 'ERA', y, v, True) for y, v in zip(years, values)]
+    assert np.allclose(baseline.percentiles('ERA', years, values), expected)
+
+    k9 = league['K/9'].to_numpy()[:50]
+    expected = [loop_percentile(league, 'K/9', y, v, False) for y, v in zip(years, k9)]
+    assert np.allclose(baseline.percentiles('K/9', years, k9), expected)
+
+
+def test_unknown_seasons_and_missing_values_give_nan():
+    baseline = LeagueBaseline(league_table(), stats={'ERA': True})
+    pct = baseline.percentiles('ERA', [2025, 2022, 2020], [3.0, np.nan, 3.0])
+    assert np.isnan(pct).all()
+
+
+def test_season_percentiles_skip_stats_the_league_lacks():
+    baseline = LeagueBaseline(league_table())
+    seasons = pd.DataFrame({'Year': [2022], 'ERA': [2.28], 'K/9': [8.1], 'FIP': [2.99]})
+    table = baseline.season_percentiles(seasons)
+    assert list(table.columns) == ['Year', 'ERA', 'K/9']
+    assert len(baseline) == 3
+
+
+def test_labels_and_missing_file():
+    assert [percentile_label(p) for p in (1, 2, 3, 11, 12, 13, 21, 87.4, 100)] == \
+        ['1st', '2nd', '3rd', '11th', '12th', '13th', '21st', '87th', '100th']
+    assert percentile_label(np.nan) == 'n/a'
+    assert read_league_table(os.path.join(REPO, 'Data', 'no_such_table.csv')) is None
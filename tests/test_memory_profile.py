@@ -0,0 +1,21 @@
+import os
+import sys
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+import memory_profile  # noqa: E402
+
+
+def test_profile_pages_runs_every_page_without_errors(monkeypatch):
+    # The dashboard reads Data/ and its image relative to the repository root
+    monkeypatch.chdir(REPO)
+    steps = memory_profile.profile_pages(rounds=1)
+
+    errors = [(step['Step'], step['Error']) for step in steps if step['Error']]
+    assert not errors
+    names = [step['Step'] for step in steps]
+    assert 'Page: Analysis & Recommendations' in names
+    assert 'Analysis & Recommendations › Explain:' in names
+    assert any(name.startswith('Correlations › ') for name in names)
+    assert all(step['Peak MB'] >= 0 for step in steps)
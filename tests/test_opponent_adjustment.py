@@ -0,0 +1,81 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from opponent_adjustment import TeamOffense, season_adjusted, read_team_offense  # noqa: E402
+
+# Two teams per season: a strong lineup (NYM) and a weak one (OAK)
+TEAMS = pd.DataFrame({
+    'Year': [2022, 2022, 2023, 2023],
+    'Tm': ['NYM', 'OAK', 'NYM', 'OAK'],
+    'G': [162, 162, 162, 162],
+    'PA': [6000, 6000, 6000, 6000],
+    'R': [810, 486, 648, 648],
+    'HR': [200, 100, 150, 150],
+    'BB': [600, 400, 500, 500],
+    'SO': [1200, 1500, 1350, 1350],
+})
+
+SEASON = pd.DataFrame({'Year': [2022, 2023], 'FIP': [3.0, 3.5], 'HR': [10, 12], 'BB': [40, 50],
+                       'HBP': [5, 5], 'SO': [200, 180], 'Outs': [600, 600]})
+
+
+def game_log():
+    return pd.DataFrame({
+        'Year': [2022, 2022, 2023, 2023],
+        'Opp': ['NYM', 'OAK', 'NYM', 'MIA'],
+        'Outs': [18, 18, 21, 15],
+        'ER': [3, 3, 2, 4],
+        'HR': [1, 1, 0, 2],
+        'BB': [2, 2, 0, 3],
+        'SO': [6, 6, 8, 4],
+        'HBP': [0, 0, 1, 0],
+    })
+
+
+def test_factors_are_league_rate_over_team_rate():
+    offense = TeamOffense(TEAMS)
+    adjusted = offense.adjust(game_log(), SEASON)
+
+    # 2022 league: 1296 R in 324 G is 4 R/G; NYM score 5 and OAK 3
+    assert np.allclose(adjusted['Adj ER'][:2], [3 * 4 / 5, 3 * 4 / 3])
+    # League HR/PA 300/12000 against NYM's 200/6000 and OAK's 100/6000
+    assert np.allclose(adjusted['Adj HR'][:2], [1 * 0.025 / (200 / 6000), 1 * 0.025 / (100 / 6000)])
+    # Strikeouts against the free-swinging OAK lineup count for less
+    assert adjusted['Adj SO'][1] < 6 < adjusted['Adj SO'][0]
+    assert np.allclose(adjusted['Opp R/G'][:3], [5, 3, 4])
+    # 2023's teams are identical, so nothing changes
+    assert adjusted.loc[2, ['Adj ER', 'Adj HR', 'Adj BB', 'Adj SO']].tolist() == [2, 0, 0, 8]
+    assert np.isnan(adjusted.loc[2, 'Adj K/BB'])
+
+
+def test_unmatched_opponents_keep_raw_counts():
+    adjusted = TeamOffense(TEAMS).adjust(game_log(), SEASON)
+    assert adjusted['Opp Matched'].tolist() == [True, True, True, False]
+    assert adjusted.loc[3, ['Adj ER', 'Adj HR', 'Adj BB', 'Adj SO']].tolist() == [4, 2, 3, 4]
+    assert np.isnan(adjusted.loc[3, 'Opp R/G'])
+    assert np.isclose(adjusted.loc[3, 'Adj ERA'], 4 * 27 / 15)
+
+
+def test_lookup_matches_a_dictionary():
+    offense = TeamOffense(TEAMS)
+    rows = {key: i for i, key in enumerate(zip(TEAMS['Tm'], TEAMS['Year']))}
+    opp, years = ['OAK', 'NYM', 'MIA', 'NYM'], [2023, 2022, 2022, 2024]
+    assert offense.lookup(opp, years).tolist() == [rows.get(key, -1) for key in zip(opp, years)]
+    assert len(offense) == 4
+
+
+def test_season_adjusted_sums_the_starts():
+    games = TeamOffense(TEAMS).adjust(game_log(), SEASON)
+    seasons = season_adjusted(games, SEASON).set_index('Year')
+    assert seasons['Starts'].tolist() == [2, 2]
+    assert np.isclose(seasons.loc[2022, 'ERA'], 6 * 27 / 36)
+    assert np.isclose(seasons.loc[2022, 'Adj ERA'], (2.4 + 4) * 27 / 36)
+    # 2023's lineups are identical and its unmatched start keeps raw counts, so nothing changes
+    assert np.isclose(seasons.loc[2023, 'Adj ERA'], seasons.loc[2023, 'ERA'])
+    assert read_team_offense(os.path.join(REPO, 'Data', 'no_such_table.csv')) is None
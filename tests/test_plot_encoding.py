@@ -0,0 +1,51 @@
+import os
+import sys
+
+import numpy as np
+import plotly.graph_objects as go
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from plot_encoding import compact_array, encode_figure, payload_size, MIN_BINARY_LENGTH  # noqa: E402
+
+
+def test_whole_numbers_get_the_smallest_exact_integer_dtype():
+    assert compact_array(np.arange(100)).dtype == np.int8
+    assert compact_array(np.arange(100) * 300).dtype == np.int16
+    assert compact_array(np.arange(100) * 1e6).dtype == np.int32
+    assert compact_array(np.arange(100, dtype=float)).dtype == np.int8
+
+
+def test_float32_only_when_its_rounding_error_is_negligible():
+    rng = np.random.default_rng(0)
+    era = rng.uniform(0, 10, 200)
+    assert compact_array(era).dtype == np.float32
+    assert np.allclose(compact_array(era), era, rtol=0, atol=10 * 1e-6)
+
+    # Tiny differences on a large offset would be lost in float32
+    precise = 1e9 + rng.uniform(0, 1e-3, 200)
+    assert compact_array(precise).dtype == np.float64
+
+
+def test_nan_short_and_text_arrays_are_handled():
+    with_gap = np.r_[np.arange(20, dtype=float), np.nan]
+    assert compact_array(with_gap).dtype == np.float32
+    assert np.isnan(compact_array(with_gap)[-1])
+
+    short = list(range(MIN_BINARY_LENGTH - 1))
+    assert compact_array(short) is short
+    labels = ['2021', '2022'] * 10
+    assert compact_array(labels) is labels
+
+
+def test_encoded_figure_keeps_the_data_and_shrinks_the_payload():
+    x = np.arange(500)
+    y = np.random.default_rng(1).normal(3.5, 1.0, 500)
+    fig = go.Figure(go.Scatter(x=x, y=y, text=[str(v) for v in x]))
+    encoded = encode_figure(fig)
+
+    assert np.array_equal(encoded.data[0].x, x)
+    assert np.allclose(encoded.data[0].y, y, rtol=0, atol=np.ptp(y) * 1e-6)
+    assert list(encoded.data[0].text) == [str(v) for v in x]
+    assert payload_size(encoded) < payload_size(fig)
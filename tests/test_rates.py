@@ -0,0 +1,53 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from pitcher_report import read_workbook  # noqa: E402
+from rates import outs_from_ip, ip_from_outs, per_nine, fip_core, fip_constant, add_rate_stats  # noqa: E402
+
+WORKBOOK = os.path.join(REPO, 'Data', 'sandy_stats_since_21 copy.xlsx')
+
+
+def test_ip_notation_round_trips_through_outs():
+    ip = [0.0, 0.1, 0.2, 6.1, 6.2, 7.0, 228.2]
+    outs = outs_from_ip(ip)
+    assert outs.tolist() == [0, 1, 2, 19, 20, 21, 686]
+    assert np.allclose(ip_from_outs(outs), ip)
+
+
+def test_ip_with_an_impossible_fraction_is_rejected():
+    with pytest.raises(ValueError):
+        outs_from_ip([6.3])
+
+
+def test_per_nine_uses_thirds_of_an_inning():
+    # 8 strikeouts in 6.1 innings is 8 * 27 / 19, not 8 * 9 / 6.1
+    assert per_nine(8, 19) == pytest.approx(8 * 27 / 19)
+    assert np.isnan(per_nine([5], [0])[0])
+
+
+def test_fip_constant_recovers_the_constant_in_the_fip_column():
+    seasons = pd.DataFrame({'HR': [15, 20], 'BB': [50, 60], 'HBP': [8, 5], 'SO': [200, 150], 'Outs': [690, 600]})
+    core = fip_core(seasons['HR'], seasons['BB'], seasons['HBP'], seasons['SO'], seasons['Outs'])
+    # (13 * 15 + 3 * 58 - 2 * 200) / 230 innings
+    assert core[0] == pytest.approx((13 * 15 + 3 * 58 - 2 * 200) / 230)
+    assert fip_constant(seasons.assign(FIP=core + 3.1)) == pytest.approx(3.1)
+
+
+def test_season_rates_match_the_game_log_sums():
+    df_data, df_season, _ = read_workbook(WORKBOOK)
+    sums = df_data.groupby('Year')[['SO', 'BB', 'Outs']].sum()
+    season = df_season.set_index('Year')
+    assert (season['Outs'] == sums['Outs']).all()
+    assert np.allclose(season['K/9'], sums['SO'] * 27 / sums['Outs'])
+    assert np.allclose(season['BB/9'], sums['BB'] * 27 / sums['Outs'])
+
+    table = add_rate_stats(pd.DataFrame({'Outs': [27], 'SO': [10], 'BB': [2], 'HR': [1], 'H': [5],
+                                         'GB': [9], 'FB': [6], 'LD': [4], 'PU': [1]}))
+    assert table.loc[0, 'K/9'] == 10 and table.loc[0, 'K/BB'] == 5
@@ -0,0 +1,58 @@
+import os
+import sys
+from datetime import date
+
+import numpy as np
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from pitcher_report import read_workbook  # noqa: E402
+from rates import per_nine  # noqa: E402
+from season_window import GameLogWindow, check_season_totals  # noqa: E402
+
+WORKBOOK = os.path.join(REPO, 'Data', 'sandy_stats_since_21 copy.xlsx')
+DF_DATA, DF_SEASON, _ = read_workbook(WORKBOOK)
+WINDOW = GameLogWindow(DF_DATA)
+
+
+def month_day(dates):
+    return dates.dt.month * 100 + dates.dt.day
+
+
+def test_full_seasons_reproduce_the_season_totals_sheet():
+    assert check_season_totals(WINDOW, DF_SEASON) == []
+
+
+def test_date_range_matches_a_month_day_mask():
+    lo, hi = WINDOW.date_range(date(2024, 5, 1), date(2024, 7, 15))
+    inside = month_day(DF_DATA['Date']).between(501, 715)
+    expected = DF_DATA[inside].sort_values('Date')
+    assert WINDOW.rows(lo, hi)['Date'].tolist() == expected['Date'].tolist()
+
+    totals = WINDOW.totals(lo, hi, DF_SEASON).set_index('Year')
+    sums = expected.groupby('Year')[['ER', 'Outs', 'SO']].sum()
+    assert (totals.loc[sums.index, 'SO'] == sums['SO']).all()
+    assert np.allclose(totals.loc[sums.index, 'ERA'], per_nine(sums['ER'], sums['Outs']))
+
+
+def test_last_starts_matches_each_seasons_tail():
+    games = WINDOW.rows(*WINDOW.last_starts(10))
+    expected = DF_DATA.sort_values('Date').groupby('Year').tail(10)
+    assert games['Date'].tolist() == expected['Date'].tolist()
+
+
+def test_seasons_without_starts_keep_a_row_with_no_rate_stats():
+    lo, hi = WINDOW.date_range(date(2024, 3, 27), date(2024, 3, 31))
+    totals = WINDOW.totals(lo, hi, DF_SEASON).set_index('Year')
+    assert totals.loc[2021, 'GS'] == 0 and np.isnan(totals.loc[2021, 'ERA'])
+    assert totals.loc[2025, 'GS'] > 0 and not np.isnan(totals.loc[2025, 'ERA'])
+
+
+def test_day_span_covers_every_start():
+    first, last = WINDOW.day_span()
+    days = month_day(DF_DATA['Date'])
+    assert first.month * 100 + first.day == days.min()
+    assert last.month * 100 + last.day == days.max()
+    lo, hi = WINDOW.date_range(first, last)
+    assert len(WINDOW.rows(lo, hi)) == len(DF_DATA)
@@ -0,0 +1,68 @@
+import os
+import sys
+
+import numpy as np
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from pitcher_report import read_workbook  # noqa: E402
+from streaks import STREAK_TYPES, run_lengths, season_streaks, longest_streaks, consistency_summary  # noqa: E402
+
+WORKBOOK = os.path.join(REPO, 'Data', 'sandy_stats_since_21 copy.xlsx')
+
+
+def loop_run_lengths(flags, groups):
+    """Reference run-length encoding, one start at a time"""
+    runs = []
+    for col in range(flags.shape[1]):
+        start = None
+        for i in range(len(flags)):
+            if start is not None and (not flags[i, col] or groups[i] != groups[start]):
+                runs.append((col, start, i - start))
+                start = None
+            if flags[i, col] and start is None:
+                start = i
+        if start is not None:
+            runs.append((col, start, len(flags) - start))
+    return runs
+
+
+def test_run_lengths_match_a_python_loop():
+    rng = np.random.default_rng(0)
+    flags = rng.random((500, 4)) < 0.6
+    groups = np.repeat(np.arange(10), 50)
+    column, start, length = run_lengths(flags, groups)
+    assert list(zip(column.tolist(), start.tolist(), length.tolist())) == loop_run_lengths(flags, groups)
+
+
+def test_runs_break_at_group_boundaries():
+    flags = np.ones((6, 1), dtype=bool)
+    column, start, length = run_lengths(flags, np.array([0, 0, 0, 1, 1, 2]))
+    assert start.tolist() == [0, 3, 5]
+    assert length.tolist() == [3, 2, 1]
+
+
+def test_season_streaks_on_the_game_log():
+    df_data, _, _ = read_workbook(WORKBOOK)
+    streaks = season_streaks(df_data)
+
+    # Quality starts and starts below GmSc 50 are complements, so their runs cover every start once
+    quality, poor = list(STREAK_TYPES)[0], list(STREAK_TYPES)[3]
+    assert streaks.loc[streaks['Streak'].isin([quality, poor]), 'Starts'].sum() == len(df_data)
+    assert (streaks['From'].dt.year == streaks['Year']).all()
+    assert (streaks['To'].dt.year == streaks['Year']).all()
+
+    longest = longest_streaks(streaks).astype({'Streak': str}).set_index(['Year', 'Streak'])
+    best = streaks.groupby(['Year', 'Streak'])['Starts'].max()
+    assert longest.index.is_unique
+    assert (longest['Starts'] == best[longest.index]).all()
+
+
+def test_consistency_summary_matches_pandas():
+    df_data, _, _ = read_workbook(WORKBOOK)
+    summary = consistency_summary(df_data).set_index('Year')
+    gmsc = df_data.groupby('Year')['GmSc']
+    assert (summary['Starts'] == gmsc.size()).all()
+    assert np.allclose(summary['GmSc Std'], gmsc.std())
+    assert np.allclose(summary['Quality Start %'], (df_data['GmSc'] >= 50).groupby(df_data['Year']).mean() * 100)
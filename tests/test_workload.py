@@ -0,0 +1,109 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from pitcher_report import read_workbook  # noqa: E402
+import workload as workload_module  # noqa: E402
+from workload import workload, update_workload, extend_workload, workload_summary  # noqa: E402
+
+WORKBOOK = os.path.join(REPO, 'Data', 'sandy_stats_since_21 copy.xlsx')
+DF_DATA = read_workbook(WORKBOOK)[0]
+
+
+def schedule(days, pitches=100, outs=18, year=2024):
+    """Starts on the given day offsets from April 1"""
+    dates = pd.Timestamp(f'{year}-04-01') + pd.to_timedelta(days, unit='D')
+    return pd.DataFrame({'Date': dates, 'Year': year, 'Pit': pitches, 'Outs': outs})
+
+
+def test_acwr_on_a_five_day_rotation():
+    table = workload(schedule(np.arange(0, 60, 5)))
+
+    assert np.isnan(table.loc[0, 'Days Rest'])
+    assert (table.loc[1:, 'Days Rest'] == 4).all()
+    # No start 21+ days back until the sixth start, so no ratio before it
+    assert table.loc[:4, 'ACWR'].isna().all()
+    # From then on: 100 pitches in the last 7 days; 500 in the last 28, or 125 a week
+    assert (table.loc[5:, 'Acute Load'] == 100).all()
+    assert (table.loc[5:, 'Chronic Load'] == 125).all()
+    assert np.allclose(table.loc[5:, 'ACWR'], 0.8)
+    assert table['Flags'].sum() == 0
+
+
+def test_flags_on_a_hand_built_schedule():
+    # Ten days' rest twice, then two 120-pitch starts on short rest, the last lasting only 15 outs
+    starts = schedule([0, 11, 22, 24, 28])
+    starts.loc[3:, 'Pit'] = 120
+    starts.loc[3:, 'Outs'] = [21, 15]
+    table = workload(starts)
+
+    assert table['Days Rest'].tolist()[1:] == [10, 10, 1, 3]
+    assert table['Short Rest'].tolist() == [False, False, False, True, True]
+    assert table['High Pitch Count'].tolist() == [False, False, False, True, True]
+    assert table['Inefficient'].tolist() == [False] * 4 + [True]
+    # Last start: 100 + 120 pitches in the 7 days before it, over (100 * 3 + 120) * 7 / 28 = 105 a week
+    assert table.loc[4, 'Acute Load'] == 220
+    assert table.loc[4, 'Chronic Load'] == 105
+    assert table['Load Spike'].tolist() == [False] * 4 + [True]
+    assert table.loc[4, 'Flags'] == 4
+
+
+def test_workload_matches_a_loop_over_each_start():
+    table = workload(DF_DATA)
+    dates = table['Date'].to_numpy()
+    pitches = table['Pit'].to_numpy(dtype=float)
+    for i, day in enumerate(dates):
+        before = dates < day
+        acute = pitches[before & (dates >= day - np.timedelta64(7, 'D'))].sum()
+        chronic = pitches[before & (dates >= day - np.timedelta64(28, 'D'))].sum() * 7 / 28
+        assert table.loc[i, 'Acute Load'] == acute
+        assert np.isclose(table.loc[i, 'Chronic Load'], chronic)
+
+
+def test_by_runs_each_pitcher_separately():
+    other = DF_DATA.assign(Pit=DF_DATA['Pit'] + 5)
+    staff = pd.concat([DF_DATA.assign(Pitcher='A'), other.assign(Pitcher='B')], ignore_index=True)
+    table = workload(staff, by=['Pitcher'])
+    for pitcher, log in [('A', DF_DATA), ('B', other)]:
+        alone = table[table['Pitcher'] == pitcher].drop(columns='Pitcher').reset_index(drop=True)
+        assert_frame_equal(alone, workload(log))
+
+
+def test_update_workload_matches_a_full_run():
+    cut = pd.Timestamp('2025-06-01')
+    table = update_workload(workload(DF_DATA[DF_DATA['Date'] < cut]), DF_DATA[DF_DATA['Date'] >= cut])
+    assert_frame_equal(table, workload(DF_DATA))
+
+
+def test_extend_workload_reuses_the_table_only_for_later_starts(monkeypatch):
+    full = workload(DF_DATA)
+    cut = pd.Timestamp('2025-06-01')
+    earlier = workload(DF_DATA[DF_DATA['Date'] < cut])
+
+    # Only the new starts and their last 28 days of history are recomputed
+    sizes = []
+    monkeypatch.setattr(workload_module, 'workload', lambda df, by=(): sizes.append(len(df)) or workload(df, by))
+    assert_frame_equal(extend_workload(earlier, DF_DATA), full)
+    first_new = DF_DATA.loc[DF_DATA['Date'] >= cut, 'Date'].min()
+    assert sizes == [(DF_DATA['Date'] >= first_new - pd.Timedelta(days=28)).sum()]
+    monkeypatch.undo()
+
+    assert_frame_equal(extend_workload(None, DF_DATA), full)
+
+    # An edited earlier start can't be patched in, so the table is rebuilt
+    edited = DF_DATA.copy()
+    edited.loc[edited['Date'].idxmin(), 'Pit'] += 10
+    assert_frame_equal(extend_workload(full, edited), workload(edited))
+
+
+def test_workload_summary_counts_flags_per_season():
+    table = workload(DF_DATA)
+    summary = workload_summary(table).set_index('Year')
+    assert summary['Starts'].sum() == len(DF_DATA)
+    assert (summary['High Pitch Count'] == table.groupby('Year')['High Pitch Count'].sum()).all()
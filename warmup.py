@@ -0,0 +1,154 @@
+"""Warm-up run for the dashboard, meant to finish before the server accepts traffic.
+
+    python warmup.py && streamlit run dashboard.py
+
+It times each import the dashboard needs and validates the workbook, then starts the
+dashboard with `streamlit run` on a spare local port and opens one session that visits
+every page with its default widget values. The dashboard's data and metric caches persist
+to disk, so that visit leaves them ready for the server's first visitor. Exits with status
+1 if the workbook is invalid or a page fails to render.
+"""
+import asyncio
+import importlib
+import os
+import sys
+import time
+
+DASHBOARD = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dashboard.py')
+DATA_FILE = 'Data/sandy_stats_since_21 copy.xlsx'
+
+WARMUP_IMPORTS = [
+    'numpy', 'pandas', 'openpyxl', 'streamlit', 'plotly.graph_objects', 'plotly.subplots',
+    'rates', 'win_probability', 'game_state', 'bootstrap', 'similar_starts', 'projection',
+    'export', 'plot_encoding', 'season_window', 'adhoc_query', 'season_explorer',
+    'streaks', 'league_percentiles', 'change_points', 'pitcher_report',
+    'correlations', 'opponent_adjustment', 'workload', 'drivers',
+]
+
+REQUIRED_COLUMNS = {
+    'Data': [
+        'Date', 'Year', 'Opp', 'IP', 'H', 'ER', 'HR', 'BB', 'SO', 'HBP', 'BF', 'ERA', 'Pit',
+        'StS', 'GB', 'FB', 'LD', 'PU', 'GmSc', 'aLI', 'WPA', 'cWPA', 'RE24', 'Entered', 'Exited',
+    ],
+    'Season Totals': [
+        'Year', 'W', 'L', 'IP', 'H', 'ER', 'HR', 'BB', 'SO', 'HBP', 'ERA', 'FIP', 'BAbip',
+        'Four-seam %', 'Sinker %', 'Slider %', 'Curve %', 'Changeup %',
+        'Pit', 'Str', 'StL', 'StS', 'GB', 'FB', 'LD', 'PU', 'GmSc', 'WPA', 'RE24',
+    ],
+    'Variable Descriptions': ['Variable', 'Description'],
+}
+
+
+def time_imports(modules=WARMUP_IMPORTS):
+    """Import each module in turn and return (module, seconds) pairs"""
+    timings = []
+    for name in modules:
+        start = time.perf_counter()
+        importlib.import_module(name)
+        timings.append((name, time.perf_counter() - start))
+    return timings
+
+
+def validate_workbook(path=DATA_FILE):
+    """Return a list of problems with the workbook's sheets and columns (empty when valid)"""
+    from pitcher_report import read_workbook
+
+    if not os.path.exists(path):
+        return [f"Workbook not found: {path}"]
+
+    # Load it the way the dashboard does, so anything the dashboard can't read fails here
+    try:
+        sheets = dict(zip(REQUIRED_COLUMNS, read_workbook(path)))
+    except (ValueError, KeyError) as exc:
+        return [f"Workbook could not be loaded: {exc}"]
+
+    problems = []
+    for sheet, columns in REQUIRED_COLUMNS.items():
+        missing = [col for col in columns if col not in sheets[sheet].columns]
+        if missing:
+            problems.append(f"{sheet}: missing columns {', '.join(missing)}")
+        if sheets[sheet].empty:
+            problems.append(f"{sheet}: no rows")
+
+    if not problems:
+        game_years = set(sheets['Data']['Year'])
+        season_years = set(sheets['Season Totals']['Year'])
+        if game_years != season_years:
+            problems.append(f"Seasons differ between Data {sorted(game_years)} and Season Totals {sorted(season_years)}")
+        if sheets['Data']['Date'].isna().any():
+            problems.append("Data: some rows have a missing or invalid Date")
+    return problems
+
+
+def warm_pages(script=DASHBOARD, timeout=300):
+    """Visit every dashboard page on a real server with default widget values; return (stage, seconds, error) rows"""
+    from load_test import free_port, start_server, wait_for_server
+
+    port = free_port()
+    start = time.perf_counter()
+    server = start_server(port, script)
+    try:
+        wait_for_server(port)
+        stages = [('Server start', time.perf_counter() - start, None)]
+        stages.extend(asyncio.run(visit_pages(port, timeout)))
+    finally:
+        server.terminate()
+        server.wait()
+    return stages
+
+
+async def visit_pages(port, timeout):
+    """Open one session, load the default page, then switch to each page in turn"""
+    import websockets
+    from load_test import PAGE_LABEL, Session
+
+    stages = []
+    url = f'ws://127.0.0.1:{port}/_stcore/stream'
+    async with websockets.connect(url, subprotocols=['streamlit'], max_size=None) as websocket:
+        session = Session(websocket)
+
+        async def visit(stage, page=None):
+            if page is not None:
+                session.set_widget(PAGE_LABEL, page)
+            session.errors.clear()
+            start = time.perf_counter()
+            await asyncio.wait_for(session.rerun(), timeout)
+            stages.append((stage, time.perf_counter() - start, session.errors[0] if session.errors else None))
+
+        await visit('First run (load data + default page)')
+        for page in session.options(PAGE_LABEL):
+            await visit(f'Page: {page}', page)
+    return stages
+
+
+def main():
+    os.chdir(os.path.dirname(DASHBOARD))
+    sys.path.insert(0, os.path.dirname(DASHBOARD))
+    failed = False
+
+    print("Imports")
+    for name, seconds in time_imports():
+        print(f"  {name:<28} {seconds * 1000:8.1f} ms")
+
+    print("Workbook validation")
+    start = time.perf_counter()
+    problems = validate_workbook()
+    print(f"  {'Validate ' + DATA_FILE:<50} {(time.perf_counter() - start) * 1000:8.1f} ms")
+    for problem in problems:
+        print(f"  ERROR: {problem}")
+        failed = True
+
+    if not failed:
+        print("Page warm-up")
+        for stage, seconds, error in warm_pages():
+            print(f"  {stage:<50} {seconds * 1000:8.1f} ms")
+            if error:
+                print(f"  ERROR: {error}")
+                failed = True
+
+    print("Warm-up failed" if failed else "Warm-up complete")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Leverage and win-probability analytics built from the game log (aLI, WPA, cWPA, RE24)."""
+import numpy as np
+import pandas as pd
+
+# A start's average leverage index (aLI) of 1.0 is a league-average pressure game.
+# Starts at or above this value are treated as high-leverage starts.
+HIGH_LEVERAGE_ALI = 1.2
+
+
+def _season_codes(df_data):
+    """Return the sorted unique seasons and each row's position in that list"""
+    return np.unique(df_data['Year'].to_numpy(), return_inverse=True)
+
+
+def _safe_divide(numerator, denominator):
+    """Element-wise division that returns NaN instead of dividing by zero"""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    out = np.full(np.broadcast(numerator, denominator).shape, np.nan)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+def win_probability_by_season(df_data, high_leverage_ali=HIGH_LEVERAGE_ALI):
+    """Season leverage and win-probability summary, one row per Year"""
+    years, codes = _season_codes(df_data)
+    n_seasons = len(years)
+
+    ali = df_data['aLI'].to_numpy(dtype=float)
+    wpa = df_data['WPA'].to_numpy(dtype=float)
+    cwpa = df_data['cWPA'].to_numpy(dtype=float)
+    re24 = df_data['RE24'].to_numpy(dtype=float)
+    bf = df_data['BF'].to_numpy(dtype=float)
+    high = ali >= high_leverage_ali
+
+    starts = np.bincount(codes, minlength=n_seasons)
+    bf_total = np.bincount(codes, weights=bf, minlength=n_seasons)
+    wpa_total = np.bincount(codes, weights=wpa, minlength=n_seasons)
+    re24_total = np.bincount(codes, weights=re24, minlength=n_seasons)
+
+    high_starts = np.bincount(codes, weights=high, minlength=n_seasons)
+    high_wpa = np.bincount(codes, weights=wpa * high, minlength=n_seasons)
+    high_re24 = np.bincount(codes, weights=re24 * high, minlength=n_seasons)
+    high_bf = np.bincount(codes, weights=bf * high, minlength=n_seasons)
+
+    return pd.DataFrame({
+        'Year': years,
+        'GS': starts,
+        'aLI': _safe_divide(np.bincount(codes, weights=ali * bf, minlength=n_seasons), bf_total),
+        'WPA': wpa_total,
+        'WPA/GS': _safe_divide(wpa_total, starts),
+        # Context-neutral wins: WPA with the leverage of each start divided out
+        'WPA/LI': np.bincount(codes, weights=_safe_divide(wpa, ali), minlength=n_seasons),
+        'cWPA': np.bincount(codes, weights=cwpa, minlength=n_seasons),
+        'RE24': re24_total,
+        'RE24/100BF': _safe_divide(re24_total, bf_total) * 100,
+        'High-Lev GS': high_starts.astype(int),
+        'High-Lev WPA/GS': _safe_divide(high_wpa, high_starts),
+        'High-Lev RE24/100BF': _safe_divide(high_re24, high_bf) * 100,
+    })
+
+
+def rolling_win_probability(df_data, window=5):
+    """Rolling WPA, leverage and RE24 rates over the last `window` starts of each season"""
+    log = df_data.sort_values('Date')
+    _, codes = _season_codes(log)
+    n = len(log)
+
+    # Position of each start within its season, so windows never straddle two seasons
+    season_start = np.r_[0, np.flatnonzero(np.diff(codes)) + 1]
+    season_lengths = np.diff(np.r_[season_start, n])
+    position = np.arange(n) - np.repeat(season_start, season_lengths)
+    span = np.minimum(position + 1, window)
+
+    def rolling_sum(values):
+        csum = np.r_[0.0, np.cumsum(values)]
+        idx = np.arange(1, n + 1)
+        return csum[idx] - csum[idx - span]
+
+    ali = log['aLI'].to_numpy(dtype=float)
+    wpa = log['WPA'].to_numpy(dtype=float)
+    re24 = log['RE24'].to_numpy(dtype=float)
+    bf = log['BF'].to_numpy(dtype=float)
+
+    bf_sum = rolling_sum(bf)
+    return pd.DataFrame({
+        'Date': log['Date'].to_numpy(),
+        'Year': log['Year'].to_numpy(),
+        'Starts': span,
+        'WPA/GS': rolling_sum(wpa) / span,
+        'aLI': _safe_divide(rolling_sum(ali * bf), bf_sum),
+        'RE24/100BF': _safe_divide(rolling_sum(re24), bf_sum) * 100,
+    })
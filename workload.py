@@ -0,0 +1,131 @@
+"""Workload from pitch counts and rest days: days of rest, acute and chronic pitch loads, and their ratio.
+
+The log is sorted by pitcher and date once. Each start's day number is offset by its
+pitcher, so one sorted key array covers every pitcher. The 7-day (acute) and 28-day
+(chronic) windows before each start are then found by binary search on those keys, and
+their pitch totals come from one cumulative sum. The windows only ever look back 28 days.
+So `update_workload` can add new starts to an existing table using just the last four
+weeks of history, without recomputing the rest, and `extend_workload` does that whenever
+a reloaded log has only gained later starts.
+"""
+import numpy as np
+import pandas as pd
+
+ACUTE_DAYS = 7
+CHRONIC_DAYS = 28
+CHRONIC_MIN_DAYS = 21      # the chronic window needs a start this far back to be a fair baseline
+
+ACWR_HIGH = 1.5            # acute load this far above the weekly chronic load is a spike
+SHORT_REST_DAYS = 4
+HIGH_PITCH_COUNT = 110
+HIGH_PITCHES_PER_INNING = 20
+
+# Flag column -> description shown with the workload chart
+WORKLOAD_FLAGS = {
+    'Load Spike': f'Acute:chronic ratio above {ACWR_HIGH}',
+    'Short Rest': f'Fewer than {SHORT_REST_DAYS} days of rest',
+    'High Pitch Count': f'{HIGH_PITCH_COUNT}+ pitches',
+    'Inefficient': f'{HIGH_PITCHES_PER_INNING}+ pitches per inning',
+}
+
+
+def workload(df_data, by=()):
+    """Per-start rest, acute and chronic pitch loads, their ratio, pitches per inning and flags.
+
+    `by` lists the columns that identify one pitcher; add a pitcher column to run a whole staff
+    at once. Acute load is the pitches thrown in the 7 days before the start, and chronic load
+    is the weekly average over the 28 days before it. The ratio is NaN until the pitcher has a start at
+    least 21 days back within those 28 days (e.g. at the start of a season or after an injury).
+    """
+    by = list(by)
+    log = df_data.sort_values(by + ['Date'], kind='stable').reset_index(drop=True)
+    groups = log.groupby(by, sort=False).ngroup().to_numpy() if by else np.zeros(len(log), dtype=np.int64)
+
+    day = log['Date'].to_numpy().astype('datetime64[D]').astype(np.int64)
+    day -= day.min() if len(day) else 0
+    span = (day.max() if len(day) else 0) + CHRONIC_DAYS + 1
+    keys = groups * span + day
+
+    pit = log['Pit'].to_numpy(dtype=float)
+    cum = np.r_[0, np.cumsum(pit)]
+    # Windows cover the days before the start, so the ratio is the load carried into it
+    end = np.searchsorted(keys, keys, side='left')
+    acute_lo = np.searchsorted(keys, keys - ACUTE_DAYS, side='left')
+    chronic_lo = np.searchsorted(keys, keys - CHRONIC_DAYS, side='left')
+    acute = cum[end] - cum[acute_lo]
+    chronic = (cum[end] - cum[chronic_lo]) * 7 / CHRONIC_DAYS
+    established = (chronic_lo < end) & (keys[chronic_lo] <= keys - CHRONIC_MIN_DAYS)
+
+    # Days between this start and the pitcher's previous one within the chronic window
+    gap = np.r_[np.nan, np.diff(keys).astype(float)]
+    recent = np.r_[False, groups[1:] == groups[:-1]] & (gap < CHRONIC_DAYS)
+
+    outs = log['Outs'].to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(established, acute / chronic, np.nan)
+        per_inning = np.where(outs > 0, pit * 3 / outs, np.nan)
+    days_rest = np.where(recent, gap - 1, np.nan)
+
+    out = log[by + ['Date', 'Year', 'Pit', 'Outs']].assign(**{
+        'Days Rest': days_rest,
+        'Acute Load': acute,
+        'Chronic Load': chronic,
+        'ACWR': ratio,
+        'Pitches/Inning': per_inning,
+        'Load Spike': ratio > ACWR_HIGH,
+        'Short Rest': days_rest < SHORT_REST_DAYS,
+        'High Pitch Count': pit >= HIGH_PITCH_COUNT,
+        'Inefficient': per_inning >= HIGH_PITCHES_PER_INNING,
+    })
+    out['Flags'] = out[list(WORKLOAD_FLAGS)].sum(axis=1)
+    return out
+
+
+def update_workload(table, new_starts, by=()):
+    """`table` with rows for `new_starts` appended, from only the last 28 days of history.
+
+    The new starts must all be later than the starts already in `table`, as when each day's
+    games are added to a running log.
+    """
+    if new_starts.empty:
+        return table
+    by = list(by)
+    cutoff = new_starts['Date'].min() - pd.Timedelta(days=CHRONIC_DAYS)
+    history = table.loc[table['Date'] >= cutoff, by + ['Date', 'Year', 'Pit', 'Outs']]
+    combined = pd.concat([history.assign(_new=False), new_starts[by + ['Date', 'Year', 'Pit', 'Outs']].assign(_new=True)],
+                         ignore_index=True).sort_values(by + ['Date'], kind='stable')
+    # Already sorted, so workload() keeps this row order and the marker lines up
+    added = workload(combined, by)
+    return pd.concat([table, added[combined['_new'].to_numpy()]], ignore_index=True)
+
+
+def extend_workload(table, df_data, by=()):
+    """Workload for `df_data`, extending `table` when the log has only gained starts after its last date.
+
+    Any other change to the log (an edited or removed start, or a new start dated before the
+    table's last one) rebuilds the whole table, as does a missing `table`.
+    """
+    if table is None or table.empty:
+        return workload(df_data, by)
+    by = list(by)
+    columns = by + ['Date', 'Year', 'Pit', 'Outs']
+    later = df_data['Date'] > table['Date'].max()
+    known = df_data.loc[~later, columns].sort_values(by + ['Date'], kind='stable').reset_index(drop=True)
+    built = table[columns].sort_values(by + ['Date'], kind='stable').reset_index(drop=True)
+    if not known.equals(built):
+        return workload(df_data, by)
+    return update_workload(table, df_data[later], by)
+
+
+def workload_summary(table, by=('Year',)):
+    """Average rest, load ratio and pitches per inning, and flag counts, per group"""
+    by = list(by)
+    summary = table.groupby(by).agg(**{
+        'Starts': ('Pit', 'size'),
+        'Avg Days Rest': ('Days Rest', 'mean'),
+        'Avg Pitches': ('Pit', 'mean'),
+        'Avg ACWR': ('ACWR', 'mean'),
+        'Avg Pitches/Inning': ('Pitches/Inning', 'mean'),
+    })
+    flags = table.groupby(by)[list(WORKLOAD_FLAGS)].sum()
+    return summary.join(flags).reset_index()